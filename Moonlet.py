@@ -1,5 +1,8 @@
+import sys
 from argparse import ArgumentParser
 from interpreter.launcher import Launcher
+from interpreter.checker import run_check
+from interpreter.program import MAX_CALL_DEPTH
 
 if __name__ == "__main__":
     # Define the Arguments Parser and it's arguments
@@ -24,8 +27,67 @@ if __name__ == "__main__":
         action="store_true",
         help="Run all Testing functions.",
     )
+    parser.add_argument(
+        "--trace",
+        metavar="size",
+        type=int,
+        default=None,
+        help="Record the last 'size' execution events of the Program.",
+    )
+    parser.add_argument(
+        "--trace-format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="Format of the dumped trace.",
+    )
+    parser.add_argument(
+        "--trace-output",
+        metavar="file_path",
+        type=str,
+        default=None,
+        help="Always dump the trace to this file (instead of only on errors).",
+    )
+    parser.add_argument(
+        "--max-depth",
+        metavar="depth",
+        type=int,
+        default=1000,
+        help=f"Maximum depth of (nested) function calls (at most {MAX_CALL_DEPTH}).",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        metavar="size",
+        type=int,
+        default=8192,
+        help="Amount of printed characters to buffer before writing them.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="jobs",
+        type=int,
+        default=1,
+        help="Amount of processes to lex the file (or check the files) with.",
+    )
+    parser.add_argument(
+        "--check",
+        metavar="file_path",
+        nargs="+",
+        default=None,
+        help="Only check the syntax of the given '.mnl' files, without executing them.",
+    )
     args = parser.parse_args()
 
+    # The stack of the Program is limited, so
+    # the maximum call depth is limited as well
+    if not 0 < args.max_depth <= MAX_CALL_DEPTH:
+        parser.error(f"--max-depth must be between 1 and {MAX_CALL_DEPTH}")
+
+    # Only lex and parse the files, and exit
+    # with code 1 when any Error was found
+    if args.check is not None:
+        sys.exit(run_check(args.check, args.jobs))
+
     # Store the result of the parser in named variables
     file_path = args.file_input if args.file_input is not None else args.file_path
     debug_mode = args.debug
@@ -37,4 +99,14 @@ if __name__ == "__main__":
         print(f"{'DEBUG_MODE:': <30} {debug_mode}")
         print(f"{'TEST_MODE:': <30} {test_mode}")
 
-    launcher = Launcher(file_path=file_path, debug_mode=debug_mode, test_mode=test_mode)
+    launcher = Launcher(
+        file_path=file_path,
+        debug_mode=debug_mode,
+        test_mode=test_mode,
+        trace_size=args.trace,
+        trace_format=args.trace_format,
+        trace_output=args.trace_output,
+        max_depth=args.max_depth,
+        buffer_size=args.buffer_size,
+        jobs=args.jobs,
+    )
@@ -0,0 +1,135 @@
+"""Benchmark of raising Errors as signals within the Program.
+
+Executes the generated programs with the Program, which returns the
+results of the nodes as they are (and raises it's Errors), against
+a Program wrapping the result of every node within ProgramStates
+(like each node used to), and reports the time per executed node.
+
+Example:
+    ```
+    python3 -m benchmarks.error_signals --size 300
+    ```
+"""
+import sys
+from argparse import ArgumentParser
+from typing import Any, Dict, List, Optional
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import run_deep, timed, check
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+from interpreter.nodes import BaseNode
+from interpreter.program import Program, ProgramState, Scope
+
+
+class CountingProgram(Program):
+    """Program counting the amount of evaluated nodes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count = 0
+
+    def eval(self, node: BaseNode, scope: Scope) -> Any:
+        self.count += 1
+        return super().eval(node, scope)
+
+
+class StatefulProgram(Program):
+    """Program wrapping the result of every node within ProgramStates.
+
+    Every evaluation allocates a ProgramState for it's result,
+    which is wrapped and checked again by another ProgramState
+    (like 'exec' used to), which is used as the baseline.
+    """
+
+    def eval(self, node: BaseNode, scope: Scope) -> Any:
+        p_state = ProgramState()
+        result = p_state.add(
+            p_state.run(ProgramState().success(super().eval(node, scope)))
+        )
+        if p_state.failed():
+            return p_state
+        return result
+
+
+def bench_signals(text: str, repeat: int = 3) -> Dict[str, float]:
+    """Time executing the given source, with and without ProgramStates.
+
+    Args:
+        text: Source of the program to execute.
+        repeat: Amount of timed runs. Defaults to 3.
+
+    Returns:
+        Dict with the amount of evaluated 'nodes', and the best
+        time (in seconds) of the 'states' and 'signals' Program.
+    """
+    tokens, error = Lexer(text).run_sharded(1)
+    check("Lexer", error)
+    ats = Parser(tokens).parse()
+    check("Parser", ats.error)
+
+    def execute(program: Program) -> ProgramState:
+        """Execute the parsed source with the given Program."""
+        return program.exec(ats.node, Scope(name="<Program>", origin=ats.node))
+
+    counter = CountingProgram()
+    check("Program", execute(counter).error)
+
+    return {
+        "nodes": counter.count,
+        "states": min(
+            map(lambda _: timed(lambda: execute(StatefulProgram())), range(repeat))
+        ),
+        "signals": min(map(lambda _: timed(lambda: execute(Program())), range(repeat))),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks.error_signals", description="Error signals benchmark"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(GENERATORS.keys()),
+        default=list(GENERATORS.keys()),
+        help="Generated programs to execute.",
+    )
+    parser.add_argument("--size", type=int, default=300, help="Size of the programs.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        map(
+            lambda x: (
+                x,
+                run_deep(lambda: bench_signals(GENERATORS[x](args.size), args.repeat)),
+            ),
+            args.cases,
+        )
+    )
+
+    print(
+        f"{'CASE': <20} {'NODES': >8} {'STATES (us/node)': >17}",
+        f"{'SIGNALS (us/node)': >18} {'SAVED (us/node)': >16}",
+    )
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]: <20} {x[1]['nodes']: >8} {x[1]['states'] / x[1]['nodes'] * 1e6: >17.2f} {x[1]['signals'] / x[1]['nodes'] * 1e6: >18.2f} {(x[1]['states'] - x[1]['signals']) / x[1]['nodes'] * 1e6: >16.2f}",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Generators of synthetic Moonlet programs.
+
+Every generator takes a 'size' and returns the source
+of a Moonlet program, which grows with the given size.
+"""
+from itertools import chain
+
+
+def straight_line(size: int) -> str:
+    """Generate a long list of straight-line assignments.
+
+    Args:
+        size: Amount of variables to create and update.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        map(
+            lambda x: f"=: var_{x} {x}\n=+ var_{x} {x + 1}\n=* var_{x} 2",
+            range(size),
+        )
+    )
+
+
+def deep_recursion(size: int) -> str:
+    """Generate a single deep recursion, like the 'sommig' example.
+
+    Args:
+        size: Depth of the recursion.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| sommig (n, result) ={",
+            "    =? (n < 1) => result",
+            "    =+ result n",
+            "    =- n 1",
+            "    => sommig(n, result)",
+            "}",
+            "",
+            f"=@ sommig ({size}, 0) =: result",
+        ]
+    )
+
+
+def mutual_recursion(size: int) -> str:
+    """Generate a mutual recursion, like the 'odd'/'even' example.
+
+    Args:
+        size: Depth of the recursion.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| odd (n) ={",
+            "    =? n == 0 => false",
+            "    =- n 1",
+            "    => even (n)",
+            "}",
+            "",
+            "=| even (n) ={",
+            "    =? n == 0 => true",
+            "    =- n 1",
+            "    => odd (n)",
+            "}",
+            "",
+            f"=@ odd ({size}) =: awnser_a",
+            f"=@ even ({size}) =: awnser_b",
+        ]
+    )
+
+
+def string_concat(size: int) -> str:
+    """Generate a recursion, which builds a string by concatenation.
+
+    Args:
+        size: Amount of concatenations.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| build (n, text) ={",
+            "    =? (n < 1) => text",
+            '    =+ text "ab"',
+            "    =- n 1",
+            "    => build(n, text)",
+            "}",
+            "",
+            f'=@ build ({size}, "x") =: result',
+        ]
+    )
+
+
+def repeated_statements(size: int) -> str:
+    """Generate the same statements over and over again.
+
+    Args:
+        size: Amount of times the statements are repeated.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| inc (n) ={",
+            "    => n + 1",
+            "}",
+            "",
+            "=: x 0",
+        ]
+        + ["=+ x 1\n=@ inc (x) =: x"] * size
+    )
+
+
+def nested_returns(size: int, nesting: int = 8) -> str:
+    """Generate a recursion, which returns from within nested if-statements.
+
+    Args:
+        size: Depth of the recursion.
+        nesting: Amount of nested if-statements. Defaults to 8.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| descend (n, depth) ={",
+            "    =? (n < 1) => depth",
+        ]
+        + list(map(lambda x: "    " * (x + 1) + "=? (n > 0) ={", range(nesting)))
+        + [
+            "    " * (nesting + 1) + "=- n 1",
+            "    " * (nesting + 1) + "=+ depth 1",
+            "    " * (nesting + 1) + "=> descend(n, depth)",
+        ]
+        + list(map(lambda x: "    " * (x + 1) + "}", reversed(range(nesting))))
+        + [
+            "    => depth",
+            "}",
+            "",
+            f"=@ descend ({size}, 0) =: result",
+        ]
+    )
+
+
+def arithmetic_recursion(size: int) -> str:
+    """Generate a recursion, which does arithmetic on each call.
+
+    Args:
+        size: Depth of the recursion.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| poly (n, total) ={",
+            "    =? (n < 1) => total",
+            "    =: square n * n",
+            "    =: total total + square - n + 1",
+            "    =? (square < 0) => total",
+            "    =? (n == 0) => total",
+            "    =- n 1",
+            "    => poly(n, total)",
+            "}",
+            "",
+            f"=@ poly ({size}, 0) =: result",
+        ]
+    )
+
+
+def many_functions(size: int, length: int = 10) -> str:
+    """Generate many function definitions, of which only one is called.
+
+    Args:
+        size: Amount of functions to define.
+        length: Amount of statements within each function. Defaults to 10.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        chain.from_iterable(
+            map(
+                lambda x: [f"=| func_{x} (a, b) ={{", "    =: c a + b"]
+                + list(map(lambda y: f"    =: c c * b - {x + y}", range(length)))
+                + ["    =! c", "    => c", "}", ""],
+                range(size),
+            )
+        )
+    ) + "\n=@ func_0 (1, 2) =: result"
+
+
+def nested_definitions(size: int) -> str:
+    """Generate a recursion, which defines a helper function on each call.
+
+    Args:
+        size: Depth of the recursion.
+
+    Returns:
+        Source of the generated program.
+    """
+    return "\n".join(
+        [
+            "=| walk (n, total) ={",
+            "    =| step (x) ={",
+            "        => x + 2",
+            "    }",
+            "    =? (n < 1) => total",
+            "    =@ step (total) =: total",
+            "    =- n 1",
+            "    => walk(n, total)",
+            "}",
+            "",
+            f"=@ walk ({size}, 0) =: result",
+        ]
+    )
+
+
+def long_string(size: int, length: int = 20) -> str:
+    """Generate a recursion, which appends to a long string on each call.
+
+    Args:
+        size: Depth of the recursion.
+        length: Amount of (100 character) strings appended
+            on each call. Defaults to 20.
+
+    Returns:
+        Source of the generated program, building a string
+        of ('size' * 'length' + 1) * 100 characters.
+    """
+    chunk = "0123456789" * 10
+    return "\n".join(
+        ["=| build (n, text) ={", "    =? (n < 1) => text"]
+        + list(map(lambda _: f'    =+ text "{chunk}"', range(length)))
+        + [
+            "    =- n 1",
+            "    => build(n, text)",
+            "}",
+            "",
+            f'=@ build ({size}, "{chunk}") =: result',
+            "=! result",
+        ]
+    )
+
+
+GENERATORS = {
+    "straight_line": straight_line,
+    "deep_recursion": deep_recursion,
+    "mutual_recursion": mutual_recursion,
+    "string_concat": string_concat,
+    "repeated_statements": repeated_statements,
+    "nested_returns": nested_returns,
+    "arithmetic_recursion": arithmetic_recursion,
+    "many_functions": many_functions,
+    "nested_definitions": nested_definitions,
+    "long_string": long_string,
+}
@@ -0,0 +1,93 @@
+"""Benchmark of the parallel (sharded) Lexer.
+
+Lexes a large generated program in shards, using an increasing
+amount of processes, and reports the speedup compared
+to lexing all shards within a single process.
+
+Example:
+    ```
+    python3 -m benchmarks.parallel_lexing --size 5000 --jobs 1 2 4 8
+    ```
+"""
+import os
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List, Optional
+from benchmarks.generators import straight_line
+from benchmarks.suite import timed
+from interpreter.lexer import Lexer, SHARD_SIZE
+
+
+def bench_jobs(text: str, jobs: List[int], size: int, repeat: int) -> Dict[int, float]:
+    """Time the sharded Lexer with each amount of jobs.
+
+    Args:
+        text: Source to lex.
+        jobs: Amounts of processes to lex with.
+        size: Preferred size of a shard.
+        repeat: Amount of timed runs.
+
+    Returns:
+        Dict with the best time (in seconds) of each amount of jobs.
+    """
+    return dict(
+        map(
+            lambda x: (
+                x,
+                min(
+                    map(
+                        lambda _: timed(lambda: Lexer(text).run_sharded(x, size)),
+                        range(repeat),
+                    )
+                ),
+            ),
+            jobs,
+        )
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks.parallel_lexing", description="Parallel Lexer benchmark"
+    )
+    parser.add_argument("--size", type=int, default=5000, help="Size of the program.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Amounts of processes to lex with.",
+    )
+    parser.add_argument(
+        "--shard-size", type=int, default=SHARD_SIZE, help="Size of a shard."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per job.")
+    args = parser.parse_args(argv)
+
+    text = straight_line(args.size)
+    results = bench_jobs(text, args.jobs, args.shard_size, args.repeat)
+    single = results.get(1, results[min(results.keys())])
+
+    print(f"Lexing {len(text) / 1024:.1f} KiB in shards of {args.shard_size} characters")
+    print(f"{'JOBS': >6} {'TIME (ms)': >12} {'SPEEDUP': >10}")
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]: >6} {x[1] * 1000: >12.1f} {single / x[1]: >9.2f}x",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Throughput benchmark of the Parser.
+
+Lexes the generated programs once, and reports how many
+Tokens per second the Parser turns into Nodes.
+
+Example:
+    ```
+    python3 -m benchmarks.parser_throughput --size 500
+    ```
+"""
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List, Optional
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import run_deep, timed, check
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+
+
+def bench_parser(text: str, repeat: int = 5) -> Dict[str, float]:
+    """Time the Parser on the given source.
+
+    Args:
+        text: Source of the program to parse.
+        repeat: Amount of timed runs. Defaults to 5.
+
+    Returns:
+        Dict with the amount of 'tokens', the best 'time'
+        in seconds and the resulting 'throughput' in Tokens per second.
+    """
+    tokens, error = Lexer(text).run()
+    check("Lexer", error)
+    check("Parser", Parser(tokens).parse().error)
+
+    best = min(map(lambda _: timed(lambda: Parser(tokens).parse()), range(repeat)))
+    return {"tokens": len(tokens), "time": best, "throughput": len(tokens) / best}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks.parser_throughput", description="Parser throughput benchmark"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(GENERATORS.keys()),
+        default=list(GENERATORS.keys()),
+        help="Generated programs to parse.",
+    )
+    parser.add_argument("--size", type=int, default=500, help="Size of the programs.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case.")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        map(
+            lambda x: (
+                x,
+                run_deep(lambda: bench_parser(GENERATORS[x](args.size), args.repeat)),
+            ),
+            args.cases,
+        )
+    )
+
+    print(f"{'CASE': <20} {'TOKENS': >8} {'TIME (ms)': >12} {'TOKENS/S': >12}")
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]: <20} {x[1]['tokens']: >8} {x[1]['time'] * 1000: >12.3f} {x[1]['throughput']: >12.0f}",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
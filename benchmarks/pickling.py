@@ -0,0 +1,175 @@
+"""Pickling benchmark of the Tokens and the parsed ATS.
+
+Compares the default pickling of every Token and Node as a
+separate object, against the compact encodings of 'encode_tokens'
+and 'encode_nodes' (which the Nodes use when they're pickled).
+
+Example:
+    ```
+    python3 -m benchmarks.pickling --size 11000
+    ```
+"""
+import io
+import sys
+import pickle
+import copyreg
+from itertools import chain
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import run_deep, timed, check, count_nodes
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+from interpreter.position import Position
+from interpreter.tokens import Token, encode_tokens, decode_tokens
+from interpreter.nodes import BaseNode, encode_nodes, decode_nodes
+
+
+class DefaultPickler(pickle.Pickler):
+    """Pickler ignoring the custom reductions of the Tokens, Nodes and Positions.
+
+    Every object is reduced the way 'object.__reduce_ex__' would,
+    which is used as the baseline of the benchmark.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Token):
+            return copyreg.__newobj__, (type(obj),), dict(obj.__dict__)
+
+        if isinstance(obj, (BaseNode, Position)):
+            slots = chain.from_iterable(
+                map(lambda x: x.__dict__.get("__slots__", ()), type(obj).__mro__)
+            )
+            return (
+                copyreg.__newobj__,
+                (type(obj),),
+                (None, dict(map(lambda x: (x, getattr(obj, x)), slots))),
+            )
+
+        return NotImplemented
+
+
+def default_dumps(obj: Any) -> bytes:
+    """Pickle the given object with the 'DefaultPickler'."""
+    stream = io.BytesIO()
+    DefaultPickler(stream, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return stream.getvalue()
+
+
+def bench_codec(
+    obj: Any, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any], repeat: int
+) -> Dict[str, float]:
+    """Time dumping and loading the given object.
+
+    Args:
+        obj: Object to dump.
+        dumps: Function dumping the object to bytes.
+        loads: Function loading the object from bytes.
+        repeat: Amount of timed runs.
+
+    Returns:
+        Dict with the 'size' in bytes, and the best 'dump' and 'load' time in seconds.
+    """
+    data = dumps(obj)
+    return {
+        "size": len(data),
+        "dump": min(map(lambda _: timed(lambda: dumps(obj)), range(repeat))),
+        "load": min(map(lambda _: timed(lambda: loads(data)), range(repeat))),
+    }
+
+
+def bench_pickling(text: str, repeat: int = 3) -> Dict[str, Any]:
+    """Time pickling the Tokens and ATS of the given source.
+
+    Args:
+        text: Source of the program to lex and parse.
+        repeat: Amount of timed runs. Defaults to 3.
+
+    Returns:
+        Dict with the amount of 'tokens' and 'nodes', and
+        the results of each codec (see 'bench_codec').
+    """
+    # Lex line by line, as lexing a large text at once is quadratic
+    tokens, error = Lexer(text).run_sharded(1)
+    check("Lexer", error)
+    ats = Parser(tokens).parse()
+    check("Parser", ats.error)
+
+    return {
+        "tokens": len(tokens),
+        "nodes": count_nodes(ats.node),
+        "codecs": {
+            "tokens (default)": bench_codec(
+                tokens, default_dumps, pickle.loads, repeat
+            ),
+            "tokens (encoded)": bench_codec(
+                tokens, encode_tokens, decode_tokens, repeat
+            ),
+            "nodes (default)": bench_codec(
+                ats.node, default_dumps, pickle.loads, repeat
+            ),
+            "nodes (encoded)": bench_codec(ats.node, encode_nodes, decode_nodes, repeat),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(prog="benchmarks.pickling", description="Pickling benchmark")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(GENERATORS.keys()),
+        default=["straight_line"],
+        help="Generated programs to pickle.",
+    )
+    parser.add_argument(
+        "--size", type=int, default=11000, help="Size of the programs."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        map(
+            lambda x: (
+                x,
+                run_deep(lambda: bench_pickling(GENERATORS[x](args.size), args.repeat)),
+            ),
+            args.cases,
+        )
+    )
+
+    print(f"{'CASE': <36} {'KIB': >10} {'DUMP (ms)': >12} {'LOAD (ms)': >12}")
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0] + ' ' + x[1][0]: <36} {x[1][1]['size'] / 1024: >10.1f} {x[1][1]['dump'] * 1000: >12.1f} {x[1][1]['load'] * 1000: >12.1f}",
+                chain.from_iterable(
+                    map(
+                        lambda x: map(lambda y: (x[0], y), x[1]["codecs"].items()),
+                        results.items(),
+                    )
+                ),
+            )
+        )
+    )
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]}: {x[1]['tokens']} tokens, {x[1]['nodes']} nodes",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
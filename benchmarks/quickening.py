@@ -0,0 +1,109 @@
+"""Benchmark of quickening the operations of the Program.
+
+Executes the generated programs with and without specialising
+the binary operations and comparisons for the types of their
+operands (see 'Quickening'), and reports the hit rate of the
+Specializations and the resulting speedup.
+
+Example:
+    ```
+    python3 -m benchmarks.quickening --size 300
+    ```
+"""
+import sys
+from argparse import ArgumentParser
+from typing import Any, Dict, List, Optional
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import run_deep, timed, check
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+from interpreter.program import Program, ProgramState, Scope
+
+
+def bench_quickening(text: str, repeat: int = 3) -> Dict[str, Any]:
+    """Time executing the given source, with and without quickening.
+
+    Args:
+        text: Source of the program to execute.
+        repeat: Amount of timed runs. Defaults to 3.
+
+    Returns:
+        Dict with the best time (in seconds) 'without' and 'with'
+        quickening, and the 'hit_rate' of the Specializations.
+    """
+    tokens, error = Lexer(text).run_sharded(1)
+    check("Lexer", error)
+    ats = Parser(tokens).parse()
+    check("Parser", ats.error)
+
+    def execute(program: Program) -> ProgramState:
+        """Execute the parsed source with the given Program."""
+        return program.exec(ats.node, Scope(name="<Program>", origin=ats.node))
+
+    # The Specializations are stored on the (shared) nodes, so the
+    # Program without quickening runs first, on generic nodes only
+    without = min(
+        map(lambda _: timed(lambda: execute(Program(quicken=False))), range(repeat))
+    )
+    programs = list(map(lambda _: Program(), range(repeat)))
+    check("Program", execute(programs[0]).error)
+
+    return {
+        "without": without,
+        "with": min(map(lambda x: timed(lambda: execute(x)), programs[1:] or programs)),
+        "hit_rate": programs[0].quickening.hit_rate,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks.quickening", description="Quickening benchmark"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(GENERATORS.keys()),
+        default=list(GENERATORS.keys()),
+        help="Generated programs to execute.",
+    )
+    parser.add_argument("--size", type=int, default=300, help="Size of the programs.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        map(
+            lambda x: (
+                x,
+                run_deep(
+                    lambda: bench_quickening(GENERATORS[x](args.size), args.repeat)
+                ),
+            ),
+            args.cases,
+        )
+    )
+
+    print(
+        f"{'CASE': <20} {'HIT RATE': >10} {'WITHOUT (ms)': >14} {'WITH (ms)': >12}",
+        f"{'SPEEDUP': >8}",
+    )
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]: <20} {x[1]['hit_rate']: >10.1%} {x[1]['without'] * 1000: >14.1f} {x[1]['with'] * 1000: >12.1f} {x[1]['without'] / x[1]['with']: >8.2f}x",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
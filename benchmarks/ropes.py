@@ -0,0 +1,111 @@
+"""Benchmark of building long strings as a Rope.
+
+Executes the 'long_string' program (at the same depth) appending a
+quarter, half and all of the given length on each call (building a
+1 MB string by default), with and without concatenating the strings
+as a Rope, and reports the time per KB of the built string. Which
+stays the same with Ropes (building the string is linear), while it
+grows with the length of the string without them.
+
+Example:
+    ```
+    python3 -m benchmarks.ropes --size 250 --length 40
+    ```
+"""
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List, Optional
+from benchmarks.generators import long_string
+from benchmarks.suite import run_deep, timed, check
+from interpreter import rope
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+from interpreter.output import ListOutput
+from interpreter.program import Program, Scope
+
+
+def bench_ropes(size: int, length: int, repeat: int = 3) -> Dict[str, float]:
+    """Time building a string of the given size, with and without Ropes.
+
+    Args:
+        size: Depth of the 'long_string' program.
+        length: Amount of strings appended on each call.
+        repeat: Amount of timed runs. Defaults to 3.
+
+    Returns:
+        Dict with the amount of 'kib' built, and the best
+        time (in seconds) 'without' and 'with' Ropes.
+    """
+    tokens, error = Lexer(long_string(size, length)).run_sharded(1)
+    check("Lexer", error)
+    ats = Parser(tokens).parse()
+    check("Parser", ats.error)
+
+    def execute() -> ListOutput:
+        """Execute the parsed source, printing the string once it's built."""
+        output = ListOutput()
+        state = Program(output=output, max_depth=size + 10).exec(
+            ats.node, Scope(name="<Program>", origin=ats.node)
+        )
+        check("Program", state.error)
+        return output
+
+    # Raising the length of the Ropes above the length of the
+    # string disables them, which concatenates it as a 'str'
+    rope_length = rope.ROPE_LENGTH
+    rope.ROPE_LENGTH = sys.maxsize
+    try:
+        without = min(map(lambda _: timed(execute), range(repeat)))
+    finally:
+        rope.ROPE_LENGTH = rope_length
+
+    return {
+        "kib": len(execute().getvalue()) / 1024,
+        "without": without,
+        "with": min(map(lambda _: timed(execute), range(repeat))),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code.
+    """
+    parser = ArgumentParser(prog="benchmarks.ropes", description="Rope benchmark")
+    parser.add_argument(
+        "--size", type=int, default=250, help="Depth of the program."
+    )
+    parser.add_argument(
+        "--length", type=int, default=40, help="Largest amount of appends per call."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per length.")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        map(
+            lambda x: (x, run_deep(lambda: bench_ropes(args.size, x, args.repeat))),
+            [args.length // 4, args.length // 2, args.length],
+        )
+    )
+
+    print(
+        f"{'LENGTH': <8} {'KIB': >8} {'WITHOUT (ms)': >14} {'WITH (ms)': >12}",
+        f"{'WITHOUT (us/KIB)': >18} {'WITH (us/KIB)': >15} {'SPEEDUP': >8}",
+    )
+    print(
+        "\n".join(
+            map(
+                lambda x: f"{x[0]: <8} {x[1]['kib']: >8.0f} {x[1]['without'] * 1000: >14.1f} {x[1]['with'] * 1000: >12.1f} {x[1]['without'] * 1e6 / x[1]['kib']: >18.1f} {x[1]['with'] * 1e6 / x[1]['kib']: >15.1f} {x[1]['without'] / x[1]['with']: >8.2f}x",
+                results.items(),
+            )
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,503 @@
+"""Performance benchmark suite of the Moonlet interpreter.
+
+Times the Lexer, Parser and Program separately on generated
+programs, records their memory peaks (and the memory retained by
+the parsed ATS) and compares the results against a saved JSON
+baseline. The optimizations within 'FEATURES' can be compared as
+well, by timing the same stage with and without each of them.
+
+Example:
+    ```
+    python3 -m benchmarks.suite --size 50 --save baseline.json
+    python3 -m benchmarks.suite --size 50 --baseline baseline.json
+    python3 -m benchmarks.suite --size 300 --features line_cache call_cache
+    ```
+"""
+import gc
+import sys
+import json
+import tracemalloc
+from time import perf_counter
+from itertools import chain
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from benchmarks.generators import GENERATORS
+from interpreter.errors import ErrorSignal, RunTimeError
+from interpreter.lexer import Lexer, LineCache
+from interpreter.parser import Parser, ParseState
+from interpreter.nodes import FuncNode, ListNode
+from interpreter.output import ListOutput
+from interpreter.program import (
+    Function,
+    Program,
+    ProgramState,
+    ReturnSignal,
+    Scope,
+    walk_function,
+)
+from interpreter.utils import run_with_stack
+
+# The Lexer, Parser and Program are all recursive,
+# so the benchmarks are ran within a thread with a
+# large stack and a raised recursion limit.
+STACK_SIZE = 512 * 1024 * 1024
+RECURSION_LIMIT = 1_000_000
+
+
+def run_deep(func: Callable[[], Any]) -> Any:
+    """Run the given function with a large stack.
+
+    Args:
+        func: Function to run.
+
+    Returns:
+        Result of the given function.
+    """
+    return run_with_stack(func, RECURSION_LIMIT, STACK_SIZE)
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Time a single run of the given function.
+
+    Args:
+        func: Function to time.
+
+    Returns:
+        Elapsed time in seconds.
+    """
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Measure the memory peak of a single run of the given function.
+
+    Args:
+        func: Function to measure.
+
+    Returns:
+        Peak of the traced memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> Dict[str, float]:
+    """Measure the (best) time and memory peak of the given function.
+
+    Args:
+        func: Function to measure.
+        repeat: Amount of timed runs. Defaults to 5.
+
+    Returns:
+        Dict with the best 'time' in seconds and the 'peak' in bytes.
+    """
+    return {
+        "time": min(map(lambda _: timed(func), range(repeat))),
+        "peak": peak_memory(func),
+    }
+
+
+def retained_memory(tokens: List[Any]) -> int:
+    """Measure the memory retained by the ATS parsed from the given Tokens.
+
+    Args:
+        tokens: Tokens to parse.
+
+    Returns:
+        Retained memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        ats = Parser(tokens).parse()
+
+        # Only the (still referenced) ATS is retained once collected
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return after - before if ats is not None else 0
+
+
+def count_nodes(obj) -> int:
+    """Count the Nodes within the given (part of the) ATS.
+
+    Args:
+        obj: Node, or list of Nodes to count.
+
+    Returns:
+        Amount of Nodes.
+    """
+    if isinstance(obj, list):
+        return sum(map(count_nodes, obj))
+
+    if not hasattr(obj, "kind"):
+        return 0
+
+    return 1 + sum(map(count_nodes, obj.fields))
+
+
+def check(stage: str, error: Optional[Any]) -> None:
+    """Stop the benchmark when a stage caused an Error.
+
+    Args:
+        stage: Name of the stage.
+        error: Optional Error caused by the stage.
+    """
+    if error is not None:
+        raise RuntimeError(f"{stage} failed with: {error!r}")
+
+
+def execute(program: Program, ats: ParseState) -> ProgramState:
+    """Execute the parsed source with the given Program.
+
+    Args:
+        program: Program to execute the source with.
+        ats: Parsed source.
+
+    Returns:
+        ProgramState of the executed source.
+    """
+    return program.exec(ats.node, Scope(name="<Program>", origin=ats.node))
+
+
+class EagerProgram(Program):
+    """Program executing the body of a function when it's defined.
+
+    The parameters are set as 'Empty' values within the scope of
+    the definition, after which the body is executed until it
+    returns, which is the baseline of the 'lazy_definitions'.
+    """
+
+    def exec_func_node(self, node: FuncNode, scope: Scope) -> Function:
+        if scope.exist(node.symbol):
+            raise ErrorSignal(
+                RunTimeError(f"Function with name '{node.name}' already exist")
+            )
+
+        func_scope = Scope(name=f"<Function: '{node.name}'>", origin=node, outer=scope)
+
+        if isinstance(node.args, ListNode) and node.args.items is not None:
+            _ = self.exec_list_node(node.args, func_scope)
+
+        try:
+            _ = self.exec_list_node(node.body, func_scope)
+        except ReturnSignal:
+            pass
+
+        func_scope.close()
+        func = Function(node, node.body, func_scope)
+        scope.set(node.symbol, func)
+        return func
+
+
+# Runs of a stage without and with an optimization,
+# on the given source (and it's parsed ATS)
+Feature = Callable[[str, ParseState], Tuple[Callable[[], Any], Callable[[], Any]]]
+
+
+def line_cache(text: str, ats: ParseState):
+    """Lex the source line by line, without and with a (new) LineCache."""
+    return (
+        lambda: Lexer(text).run_sharded(1, 1),
+        lambda: Lexer(text, cache=LineCache()).run(),
+    )
+
+
+def binary_lexing(text: str, ats: ParseState):
+    """Lex the source as str slices (line by line) and as bytes (at once)."""
+    return (
+        lambda: Lexer(text).run_sharded(1, 1),
+        lambda: Lexer(text, binary=True).run(),
+    )
+
+
+def call_cache(text: str, ats: ParseState):
+    """Execute the source, without and with caching the called Functions."""
+    return (
+        lambda: execute(Program(output=ListOutput(), cache_calls=False), ats),
+        lambda: execute(Program(output=ListOutput()), ats),
+    )
+
+
+def function_table(text: str, ats: ParseState):
+    """Execute the source, without and with hoisting the function table."""
+    return (
+        lambda: execute(Program(output=ListOutput(), hoist=False), ats),
+        lambda: execute(Program(output=ListOutput()), ats),
+    )
+
+
+def lazy_definitions(text: str, ats: ParseState):
+    """Execute the source, with eager (see 'EagerProgram') and lazy definitions."""
+    funcs = list(
+        filter(
+            lambda x: isinstance(x, FuncNode),
+            map(lambda x: x[0], walk_function(ats.node)),
+        )
+    )
+
+    def run(program: Program) -> ProgramState:
+        # The functions are checked again on every run,
+        # as a FuncNode remembers it has been checked already
+        _ = list(map(lambda x: setattr(x, "bound", None), funcs))
+        return execute(program, ats)
+
+    return (
+        lambda: run(EagerProgram(output=ListOutput())),
+        lambda: run(Program(output=ListOutput())),
+    )
+
+
+# Optimizations that can be compared (see 'bench_feature'), by their name
+FEATURES: Dict[str, Feature] = {
+    "line_cache": line_cache,
+    "binary_lexing": binary_lexing,
+    "call_cache": call_cache,
+    "function_table": function_table,
+    "lazy_definitions": lazy_definitions,
+}
+
+
+def bench_feature(
+    name: str, text: str, ats: ParseState, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """Benchmark a stage without and with the given optimization.
+
+    The run without the optimization is measured first, as some
+    optimizations (like the CallCache) are kept within the Nodes.
+
+    Args:
+        name: Name of the optimization within 'FEATURES'.
+        text: Source of the program to benchmark.
+        ats: Parsed source.
+        repeat: Amount of timed runs. Defaults to 5.
+
+    Returns:
+        Dict containing the measurements 'without' and 'with' the optimization.
+    """
+    without, with_feature = FEATURES[name](text, ats)
+    return {
+        f"{name}/without": measure(without, repeat),
+        f"{name}/with": measure(with_feature, repeat),
+    }
+
+
+def bench_program(
+    text: str, repeat: int = 5, features: Optional[List[str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """Benchmark the Lexer, Parser and Program on the given source.
+
+    Args:
+        text: Source of the program to benchmark.
+        repeat: Amount of timed runs per stage. Defaults to 5.
+        features: Names of the optimizations to compare. Defaults to None.
+
+    Returns:
+        Dict containing the measurements of each stage.
+    """
+    tokens, lexer_error = Lexer(text).run()
+    check("Lexer", lexer_error)
+
+    ats = Parser(tokens).parse()
+    check("Parser", ats.error)
+
+    check(
+        "Program",
+        Program().exec(ats.node, Scope(name="<Program>", origin=ats.node)).error,
+    )
+
+    stages = {
+        "lexer": measure(lambda: Lexer(text).run(), repeat),
+        "parser": dict(
+            measure(lambda: Parser(tokens).parse(), repeat),
+            retained=retained_memory(tokens),
+        ),
+        "program": measure(
+            lambda: Program().exec(ats.node, Scope(name="<Program>", origin=ats.node)),
+            repeat,
+        ),
+    }
+    return dict(
+        chain(
+            stages.items(),
+            chain.from_iterable(
+                map(
+                    lambda x: bench_feature(x, text, ats, repeat).items(),
+                    features or [],
+                )
+            ),
+        )
+    )
+
+
+def run_suite(
+    cases: List[str], size: int, repeat: int = 5, features: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Run the benchmarks of the given cases.
+
+    Args:
+        cases: Names of the generators to benchmark.
+        size: Size of the generated programs.
+        repeat: Amount of timed runs per stage. Defaults to 5.
+        features: Names of the optimizations to compare. Defaults to None.
+
+    Returns:
+        Dict containing the measurements of each case.
+    """
+    return dict(
+        map(
+            lambda x: (
+                x,
+                run_deep(lambda: bench_program(GENERATORS[x](size), repeat, features)),
+            ),
+            cases,
+        )
+    )
+
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float,
+) -> List[str]:
+    """Compare the results against a baseline.
+
+    Args:
+        results: Measured results.
+        baseline: Previously saved results.
+        threshold: Allowed relative slowdown/growth (0.25 means 25%).
+
+    Returns:
+        List of messages, one for each regression found.
+    """
+
+    def regressions(case: str, stage: str) -> List[str]:
+        base = baseline.get(case, {}).get(stage, {})
+        current = results[case][stage]
+        return list(
+            map(
+                lambda x: f"{case}.{stage}.{x}: {current[x]:.6g} > {base[x]:.6g} (+{current[x] / base[x] - 1:.0%})",
+                filter(
+                    lambda x: base.get(x, 0) > 0
+                    and current[x] / base[x] > 1 + threshold,
+                    current.keys(),
+                ),
+            )
+        )
+
+    return sum(
+        map(
+            lambda x: sum(map(lambda y: regressions(x, y), results[x].keys()), []),
+            results.keys(),
+        ),
+        [],
+    )
+
+
+def format_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    """Format the results as a table.
+
+    Args:
+        results: Measured results.
+
+    Returns:
+        The formatted table.
+    """
+    header = f"{'CASE': <20} {'STAGE': <24} {'TIME (ms)': >12} {'PEAK (KiB)': >12} {'RETAINED (KiB)': >15} {'SPEEDUP': >8}"
+
+    def row(case: str, stage: str) -> str:
+        found = results[case][stage]
+        retained = found.get("retained", None)
+        retained = "" if retained is None else f"{retained / 1024:.1f}"
+
+        # The run with an optimization is compared to the run without it
+        without = results[case].get(stage.replace("/with", "/without"), None)
+        speedup = (
+            ""
+            if not stage.endswith("/with") or without is None
+            else f"{without['time'] / found['time']:.2f}x"
+        )
+        return f"{case: <20} {stage: <24} {found['time'] * 1000: >12.3f} {found['peak'] / 1024: >12.1f} {retained: >15} {speedup: >8}"
+
+    rows = sum(
+        map(
+            lambda x: list(map(lambda y: row(x, y), results[x].keys())),
+            results.keys(),
+        ),
+        [],
+    )
+    return "\n".join([header] + rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Args:
+        argv: Optional command line arguments. Defaults to None.
+
+    Returns:
+        Exit code, which is 1 when a regression was found.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks.suite", description="Moonlet performance benchmarks"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(GENERATORS.keys()),
+        default=list(GENERATORS.keys()),
+        help="Generated programs to benchmark.",
+    )
+    parser.add_argument("--size", type=int, default=50, help="Size of the programs.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage.")
+    parser.add_argument(
+        "--features",
+        nargs="+",
+        choices=list(FEATURES.keys()),
+        default=[],
+        help="Optimizations to compare, by timing a stage without and with them.",
+    )
+    parser.add_argument(
+        "--baseline", metavar="file_path", help="Baseline JSON to compare against."
+    )
+    parser.add_argument(
+        "--save", metavar="file_path", help="Save the results as a baseline JSON."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression, compared to the baseline.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.cases, args.size, args.repeat, args.features)
+    print(format_results(results))
+
+    if args.save is not None:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, "r") as file:
+        found = compare(results, json.load(file), args.threshold)
+
+    print(f"\n{'REGRESSIONS':-^60}")
+    print("\n".join(found) if len(found) > 0 else "None")
+    return 1 if len(found) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
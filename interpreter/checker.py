@@ -0,0 +1,208 @@
+import os
+import sys
+from itertools import accumulate, chain, repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, TextIO, Tuple
+from interpreter.tokens import Token, EOFToken
+from interpreter.lexer import LineCache, shard_text, move_tokens
+from interpreter.parser import Parser
+from interpreter.incremental import group_by_line, split_lines
+from interpreter.position import Position
+from interpreter.errors import Error, FileNotFoundError
+
+
+def locate(error: Error, line: int) -> Error:
+    """Make sure the given Error has a Position.
+
+    Args:
+        error: Error to locate.
+        line: Line to use, when the Error has no Position.
+
+    Returns:
+        The located Error.
+    """
+    if not isinstance(error.pos, Position):
+        error.pos = Position(line)
+    return error
+
+
+def lex_lines(text: str) -> Tuple[List[Token], List[Error]]:
+    """Lex the text line by line.
+
+    Every line is lexed on it's own, so an Error
+    only drops the Tokens of the line it occured on,
+    while the Lexer continues with the next line.
+    Repeated lines are replayed from a LineCache.
+
+    Args:
+        text: Text to lex.
+
+    Returns:
+        Tuple with the Tokens of all valid lines, and the Errors of the others.
+    """
+    shards = shard_text(text, 1)
+
+    # Every shard is a single line, ending with a newline
+    # (except for the last line), even when it failed lexing
+    lines = list(
+        accumulate(map(lambda x: int(x.endswith("\n")), shards), initial=0)
+    )
+    results = list(map(move_tokens, map(LineCache().lex, shards, repeat(True)), lines))
+
+    tokens = list(
+        chain.from_iterable(
+            map(
+                lambda x: x[0][:-1],
+                filter(lambda x: x[1] is None, results),
+            )
+        )
+    )
+    errors = list(
+        map(
+            lambda x: locate(x[1][1], x[0]),
+            filter(lambda x: x[1][1] is not None, zip(lines, results)),
+        )
+    )
+    return tokens, errors
+
+
+def parse_statement(tokens: List[Token], start: int, end: int) -> Optional[Error]:
+    """Parse the Tokens of a single top-level statement.
+
+    Args:
+        tokens: Tokens of the statement.
+        start: First line of the statement.
+        end: End (exclusive) line of the statement.
+
+    Returns:
+        Optional Error caused while parsing the statement.
+    """
+    ats = Parser(tokens + [EOFToken(pos=Position(end))]).parse()
+    return locate(ats.error, start) if ats.error is not None else None
+
+
+def check_text(text: str) -> List[Error]:
+    """Check the syntax of the given text, without executing it.
+
+    The Parser recovers from an Error by skipping to the
+    next top-level statement, so all statements containing
+    an Error are reported instead of only the first.
+
+    Args:
+        text: Text to check.
+
+    Returns:
+        List of all found Errors, ordered by their line.
+    """
+    if len(text) == 0:
+        return list()
+
+    tokens, errors = lex_lines(text)
+
+    # Statements on a line that failed lexing are
+    # incomplete, so don't report them twice
+    failed = set(map(lambda x: x.pos.line, errors))
+    lines = group_by_line(tokens)
+    ranges, _ = split_lines(lines, 0, text.count("\n") + 1)
+
+    statements = map(
+        lambda x: (
+            list(chain.from_iterable(map(lambda y: lines.get(y, []), range(*x)))),
+            *x,
+        ),
+        filter(lambda x: failed.isdisjoint(range(*x)), ranges),
+    )
+    errors += list(
+        filter(
+            lambda x: x is not None, map(lambda x: parse_statement(*x), statements)
+        )
+    )
+    return sorted(errors, key=lambda x: (x.pos.line, x.pos.start))
+
+
+def check_file(file_path: str) -> Tuple[str, List[Error]]:
+    """Check the syntax of the given file.
+
+    Args:
+        file_path: Path to the '.mnl' file to check.
+
+    Returns:
+        Tuple with the path of the file and it's Errors.
+    """
+    if not os.path.exists(file_path):
+        return file_path, [
+            FileNotFoundError(f"Couldn't find '{file_path}', no such file.", Position())
+        ]
+
+    if not file_path.endswith(".mnl"):
+        return file_path, [
+            FileNotFoundError(
+                f"File '{file_path}' has an invalid extention (must be '.mnl')",
+                Position(),
+            )
+        ]
+
+    with open(file_path, "r") as file:
+        return file_path, check_text(file.read())
+
+
+def check_files(file_paths: List[str], jobs: int = 1) -> List[Tuple[str, List[Error]]]:
+    """Check the syntax of the given files.
+
+    Args:
+        file_paths: Paths to the '.mnl' files to check.
+        jobs: Amount of processes to check the files with. Defaults to 1.
+
+    Returns:
+        List with the path and Errors of each file, in the given order.
+    """
+    if jobs > 1 and len(file_paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(
+                executor.map(
+                    check_file,
+                    file_paths,
+                    chunksize=max(1, len(file_paths) // (jobs * 4)),
+                )
+            )
+
+    return list(map(check_file, file_paths))
+
+
+def format_error(file_path: str, error: Error) -> str:
+    """Format an Error as a single line.
+
+    Args:
+        file_path: Path of the file the Error occured in.
+        error: Error to format.
+
+    Returns:
+        The formatted Error.
+    """
+    return f"{file_path}:{error.pos.line}:{error.pos.start}: {error}"
+
+
+def run_check(
+    file_paths: List[str], jobs: int = 1, stream: Optional[TextIO] = None
+) -> int:
+    """Check the given files, and report all found Errors.
+
+    Args:
+        file_paths: Paths to the '.mnl' files to check.
+        jobs: Amount of processes to check the files with. Defaults to 1.
+        stream: Stream to report to. Defaults to the current 'sys.stdout'.
+
+    Returns:
+        Exit code, which is 1 when any Error was found.
+    """
+    stream = sys.stdout if stream is None else stream
+    results = check_files(file_paths, jobs)
+    errors = list(
+        chain.from_iterable(
+            map(lambda x: map(lambda y: format_error(x[0], y), x[1]), results)
+        )
+    )
+
+    _ = list(map(lambda x: stream.write(f"{x}\n"), errors))
+    stream.write(f"Checked {len(results)} file(s), found {len(errors)} error(s)\n")
+    return 1 if len(errors) > 0 else 0
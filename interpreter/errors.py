@@ -28,6 +28,45 @@ class Error:
             f"{self.__class__.__name__}(details='{self.details!r}', pos={self.pos!r})"
         )
 
+    def locate(self, pos: Optional[Position]):
+        """Set the Position of the Error, when it doesn't have one yet.
+
+        Args:
+            pos: Position to set.
+
+        Returns:
+            The located Error.
+        """
+        if not isinstance(self.pos, Position):
+            self.pos = pos
+        return self
+
+
+class ErrorSignal(Exception):
+    """Signal raising an Error as a Python exception.
+
+    Unwinds the execution up to the boundary (like 'Program.exec')
+    that turns the raised Error back into a (failed) state.
+
+    Attributes:
+        error: The raised Error.
+    """
+
+    def __init__(self, error: Error):
+        """Initialise the signal with the raised Error.
+
+        Args:
+            error: The raised Error.
+        """
+        super().__init__(error)
+        self.error = error
+
+    def __str__(self):
+        return f"ErrorSignal({self.error})"
+
+    def __repr__(self):
+        return f"ErrorSignal(error={self.error!r})"
+
 
 class InvalidSyntaxError(Error):
     """Invalid Syntax Error.
@@ -0,0 +1,512 @@
+"""Declarative grammar of the Moonlet statements.
+
+Every statement is described by a 'Rule': the symbol(s) it
+starts with, the 'Steps' to parse the rest of the statement,
+and a function building the Node from the parsed fields.
+At import time the Rules are compiled into an LL(1) table,
+keyed by the kind of the first Token of each statement.
+
+To add a new statement, add a Rule to 'RULES'.
+"""
+import re
+from abc import ABC, abstractmethod
+from functools import reduce
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from interpreter.tokens import Token, TokenKind, TokenTypes, VALUE_KINDS
+from interpreter.nodes import (
+    BaseNode,
+    IDNode,
+    VarNode,
+    AssignOpNode,
+    FuncNode,
+    CallNode,
+    ReturnNode,
+    ConditionsNode,
+    PrintNode,
+)
+from interpreter.errors import ErrorSignal, InvalidSyntaxError
+
+# Tokens that can be referred to by their symbol within a Rule
+SYMBOL_TOKENS = list(
+    chain(
+        TokenTypes.SINGLE_CHARS.value,
+        TokenTypes.MATH_OPS.value,
+        TokenTypes.COMPERATIONS.value,
+        TokenTypes.ASSIGNMENT_OPS.value,
+        TokenTypes.STATEMENTS.value,
+    )
+)
+
+
+def kind_of(symbol: Union[str, int]) -> int:
+    """Compile a symbol into the kind of it's Token.
+
+    Args:
+        symbol: Symbol (like '=:') or an already compiled kind.
+
+    Returns:
+        Kind of the matching Token.
+    """
+    if isinstance(symbol, int):
+        return symbol
+
+    token = next(
+        filter(lambda x: re.fullmatch(x().expr, symbol), SYMBOL_TOKENS), None
+    )
+    if token is None:
+        raise ValueError(f"No Token matches the grammar symbol {symbol!r}")
+    return token.kind
+
+
+def kinds_of(symbols: Iterable[Union[str, int]]) -> frozenset:
+    """Compile the symbols into a set of Token kinds.
+
+    Args:
+        symbols: Symbols or already compiled kinds.
+
+    Returns:
+        Set of the Token kinds.
+    """
+    return frozenset(map(kind_of, symbols))
+
+
+class Step(ABC):
+    """Default base of a Step within a Rule.
+
+    Every Step reads from the current Token of the
+    Parser, and stores it's result within the 'fields'
+    of the statement that is being parsed.
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({vars(self)!r})"
+
+    @abstractmethod
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        """Run the Step.
+
+        Args:
+            parser: Parser to read the Tokens from.
+            fields: Parsed fields of the statement.
+
+        Raises:
+            ErrorSignal: With the Error when the Step failed.
+        """
+
+
+class Skip(Step):
+    """Skip the current Token."""
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        parser.next()
+
+
+class Mark(Step):
+    """Store the current Token.
+
+    Attributes:
+        field: Field to store the Token in.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        fields[self.field] = parser.current
+
+
+class Expect(Step):
+    """Expect, and skip, a Token of the given kind.
+
+    Attributes:
+        kind: Kind of the expected Token.
+        error: Error message when the Token isn't found.
+        field: Optional field to store the Token in.
+    """
+
+    def __init__(self, symbol: Union[str, int], error: str, field: Optional[str] = None):
+        self.kind = kind_of(symbol)
+        self.error = error
+        self.field = field
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        if parser.current.kind != self.kind:
+            raise ErrorSignal(InvalidSyntaxError(self.error, parser.current.pos))
+
+        if self.field is not None:
+            fields[self.field] = parser.current
+        parser.next()
+
+
+class Identifier(Expect):
+    """Expect, and skip, an Identifier and store it as an IDNode.
+
+    Attributes:
+        field: Field to store the IDNode in.
+        error: Error message when no Identifier is found.
+    """
+
+    def __init__(self, field: str, error: str):
+        super().__init__(TokenKind.ID, error, field)
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        super().run(parser, fields)
+        fields[self.field] = parser.share(IDNode(fields[self.field]))
+
+
+class Peek(Step):
+    """Expect a Token of the given kinds, without skipping it.
+
+    Attributes:
+        kinds: Kinds of the expected Tokens.
+        error: Error message, which may refer to the '{current}' Token.
+    """
+
+    def __init__(self, symbols: Iterable[Union[str, int]], error: str):
+        self.kinds = kinds_of(symbols)
+        self.error = error
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        if parser.current.kind not in self.kinds:
+            raise ErrorSignal(
+                InvalidSyntaxError(
+                    self.error.format(current=parser.current), parser.current.pos
+                )
+            )
+
+
+class Reject(Peek):
+    """Fail when the current Token is one of the given kinds.
+
+    Attributes:
+        kinds: Kinds of the rejected Tokens.
+        error: Error message, which may refer to the '{current}' Token.
+    """
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        if parser.current.kind in self.kinds:
+            raise ErrorSignal(
+                InvalidSyntaxError(
+                    self.error.format(current=parser.current), parser.current.pos
+                )
+            )
+
+
+class Parse(Step):
+    """Parse a part of the statement with a method of the Parser.
+
+    Attributes:
+        field: Field to store the parsed Node in.
+        method: Name of the Parser method to parse with.
+        arg: Optional field passed on to the method.
+    """
+
+    def __init__(self, field: str, method: str, arg: Optional[str] = None):
+        self.field = field
+        self.method = method
+        self.arg = arg
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        method = getattr(parser, self.method)
+        fields[self.field] = method() if self.arg is None else method(fields[self.arg])
+
+
+class Build(Step):
+    """Build a (shared) Node out of the already parsed fields.
+
+    Attributes:
+        field: Field to store the built Node in.
+        build: Function building the Node from the fields.
+    """
+
+    def __init__(self, field: str, build: Callable[[Dict[str, Any]], BaseNode]):
+        self.field = field
+        self.build = build
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        fields[self.field] = parser.share(self.build(fields))
+
+
+class When(Step):
+    """Only run the Steps when the current Token is of the given kind.
+
+    Attributes:
+        kind: Kind of the Token to look for.
+        steps: Steps to run.
+    """
+
+    def __init__(self, symbol: Union[str, int], steps: List[Step]):
+        self.kind = kind_of(symbol)
+        self.steps = steps
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        if parser.current.kind == self.kind:
+            run_steps(self.steps, parser, fields)
+
+
+class Choice(Step):
+    """Run the Steps of the branch, chosen by the kind of the current Token.
+
+    Attributes:
+        branches: Steps of each branch, by the kind of their Token.
+        default: Steps to run when no branch matches.
+    """
+
+    def __init__(self, branches: Dict[Union[str, int], List[Step]], default: List[Step]):
+        self.branches = dict(map(lambda x: (kind_of(x[0]), x[1]), branches.items()))
+        self.default = default
+
+    def run(self, parser, fields: Dict[str, Any]) -> None:
+        steps = self.branches.get(parser.current.kind, self.default)
+        run_steps(steps, parser, fields)
+
+
+def run_steps(steps: List[Step], parser, fields: Dict[str, Any]) -> None:
+    """Run the Steps one after another, until one fails.
+
+    Args:
+        steps: Steps to run.
+        parser: Parser to read the Tokens from.
+        fields: Parsed fields of the statement.
+
+    Raises:
+        ErrorSignal: With the Error of the failed Step.
+    """
+    _ = list(map(lambda x: x.run(parser, fields), steps))
+
+
+class Rule:
+    """Grammar Rule of a statement.
+
+    Attributes:
+        symbols: Symbols the statement starts with.
+        kinds: Kinds of the Tokens the statement starts with.
+        steps: Steps to parse the statement.
+        build: Function building the Node from the parsed
+            fields and the first Token of the statement.
+        shared: If the built Node is shared with all structurally
+            identical statements (see 'NodeTable').
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        steps: List[Step],
+        build: Callable[[Dict[str, Any], Token], BaseNode],
+        shared: bool = True,
+    ):
+        """Initialise the Rule.
+
+        Args:
+            symbols: Symbols the statement starts with.
+            steps: Steps to parse the statement.
+            build: Function building the Node.
+            shared: If the built Node is shared. Defaults to True.
+        """
+        self.symbols = symbols
+        self.kinds = kinds_of(symbols)
+        self.steps = steps
+        self.build = build
+        self.shared = shared
+
+    def __str__(self) -> str:
+        return f"Rule({', '.join(self.symbols)})"
+
+    def __repr__(self) -> str:
+        return f"Rule(symbols={self.symbols!r}, steps={self.steps!r})"
+
+
+def build_call(fields: Dict[str, Any], token: Token, inline: bool = False) -> CallNode:
+    """Build a CallNode out of the parsed fields.
+
+    Args:
+        fields: Parsed fields of the call.
+        token: Initial token reference.
+        inline: If the call is made inline. Defaults to False.
+
+    Returns:
+        The built CallNode.
+    """
+    return CallNode(
+        id=fields["id"],
+        args=fields["args"],
+        result=fields.get("result", None),
+        inline=inline,
+        token=token,
+    )
+
+
+# Arguments of a function call, with the optional
+# variable to store the returned result in
+CALL_TAIL = [
+    Expect("(", "Expected '('"),
+    Parse("args", "func_args"),
+    Expect(")", "Expected ')'"),
+    When(
+        "=:",
+        [
+            Mark("store"),
+            Skip(),
+            Identifier(
+                "result_id",
+                "Expected 'Identifier' to store the returned value of the function in",
+            ),
+            Build(
+                "result",
+                lambda fields: VarNode(
+                    id=fields["result_id"], value=None, token=fields["store"]
+                ),
+            ),
+            Peek(
+                [TokenKind.NEW_LINE, TokenKind.EOF],
+                "Can't put '{current}' after function call",
+            ),
+        ],
+    ),
+]
+
+RULES = [
+    # =: x 10
+    # =+ x 1
+    Rule(
+        ["=:", "=+", "=-", "=*", "=/"],
+        [
+            Skip(),
+            Identifier("id", "No 'Identifier' was specified"),
+            Parse("value", "assign_value", "id"),
+            Skip(),
+        ],
+        lambda fields, token: (
+            VarNode if token.kind == TokenKind.VAR else AssignOpNode
+        )(fields["id"], fields["value"], token),
+    ),
+    # =| name (a, b) ={ ... }
+    Rule(
+        ["=|"],
+        [
+            Skip(),
+            Identifier("id", "No 'IDToken' was specified"),
+            Expect("(", "Expected '('"),
+            Parse("args", "func_params"),
+            Expect(")", "Expected ')'"),
+            Expect("={", "Expected '={'", "start"),
+            Parse("body", "code_block"),
+            Expect("}", "Expected '}'", "end"),
+        ],
+        lambda fields, token: FuncNode(
+            fields["id"],
+            fields["args"],
+            fields["body"],
+            fields["start"],
+            fields["end"],
+            token,
+        ),
+        shared=False,
+    ),
+    # => result
+    # => name(a, b)
+    Rule(
+        ["=>"],
+        [
+            Skip(),
+            Mark("call"),
+            Parse("value", "atom"),
+            When(
+                "(",
+                CALL_TAIL
+                + [
+                    Build(
+                        "value",
+                        lambda fields: build_call(
+                            dict(fields, id=fields["value"]), fields["call"], True
+                        ),
+                    )
+                ],
+            ),
+        ],
+        lambda fields, token: ReturnNode(fields["value"], token),
+    ),
+    # =@ name (a, b) =: result
+    Rule(
+        ["=@"],
+        [Skip(), Identifier("id", "Expected 'name' of function to call")] + CALL_TAIL,
+        build_call,
+    ),
+    # =? (a < b) =: result : ...
+    Rule(
+        ["=?"],
+        [
+            Skip(),
+            Parse("conditions", "condition"),
+            Choice(
+                {
+                    "=:": [
+                        Mark("store"),
+                        Skip(),
+                        Identifier(
+                            "result_id",
+                            "Expected 'Identifier' to store the result of the if-statement in",
+                        ),
+                        Build(
+                            "result",
+                            lambda fields: VarNode(
+                                id=fields["result_id"], value=None, token=fields["store"]
+                            ),
+                        ),
+                    ],
+                    "={": [Skip(), Parse("result", "code_block"), Skip()],
+                },
+                [Parse("result", "statement")],
+            ),
+            When(
+                ":",
+                [
+                    Skip(),
+                    Reject(
+                        ["\n"],
+                        "No 'False' or 'right-hand side' action was specified for if-statement",
+                    ),
+                    Parse("other", "statement"),
+                ],
+            ),
+        ],
+        lambda fields, token: ConditionsNode(
+            fields["conditions"], fields["result"], fields.get("other", None), token
+        ),
+        shared=False,
+    ),
+    # =! value
+    Rule(
+        ["=!"],
+        [
+            Skip(),
+            Peek(VALUE_KINDS, "Expected 'int', 'float', 'string', 'variable'"),
+            Parse("value", "expr"),
+        ],
+        lambda fields, token: PrintNode(fields["value"], token),
+    ),
+]
+
+
+def compile_rules(rules: List[Rule]) -> Dict[int, Rule]:
+    """Compile the Rules into an LL(1) table.
+
+    Args:
+        rules: Rules to compile.
+
+    Returns:
+        Dict with the Rule of each kind of Token a statement starts with.
+    """
+
+    def add(table: Dict[int, Rule], rule: Rule) -> Dict[int, Rule]:
+        conflicts = rule.kinds & table.keys()
+        if len(conflicts) > 0:
+            raise ValueError(f"{rule} conflicts with {table[min(conflicts)]}")
+        return {**table, **dict(map(lambda x: (x, rule), rule.kinds))}
+
+    return reduce(add, rules, dict())
+
+
+# LL(1) table of the statements, by the kind of their first Token
+STATEMENTS = compile_rules(RULES)
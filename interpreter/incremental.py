@@ -0,0 +1,415 @@
+from __future__ import annotations
+from functools import reduce
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+from interpreter.tokens import (
+    Token,
+    EOFToken,
+    StringToken,
+    CodeBlockToken,
+    BracketCloseToken,
+)
+from interpreter.nodes import BaseNode, ListNode
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser, ParseState
+from interpreter.position import Position, PositionTable, LineIndex
+from interpreter.errors import Error
+
+# Change of the 'code block' depth caused by a Token
+BLOCK_DEPTH = {CodeBlockToken: 1, BracketCloseToken: -1}
+
+
+def group_by_line(tokens: List[Token]) -> Dict[int, List[Token]]:
+    """Group the given tokens by their line.
+
+    Args:
+        tokens: Tokens to group.
+
+    Returns:
+        Dict containing the tokens of each line.
+    """
+
+    def add(groups: Dict[int, List[Token]], token: Token) -> Dict[int, List[Token]]:
+        groups.setdefault(token.pos.line, []).append(token)
+        return groups
+
+    return reduce(add, filter(lambda x: not isinstance(x, EOFToken), tokens), dict())
+
+
+def last_line(token: Token) -> int:
+    """Find the last line covered by the given token.
+
+    Which is the line the token starts at, unless it's
+    a (multiline) string containing newlines.
+
+    Args:
+        token: Token to find the last line of.
+
+    Returns:
+        The last line of the token.
+    """
+    if isinstance(token, StringToken):
+        return token.pos.line + token.value.count("\n")
+    return token.pos.line
+
+
+def split_lines(
+    tokens: Dict[int, List[Token]], start: int, end: int
+) -> Tuple[List[Tuple[int, int]], bool]:
+    """Split a range of lines into top-level statements.
+
+    A statement ends at the end of a line, where all opened
+    code blocks ('={') are closed again ('}'), and no (multiline)
+    string continues onto the next line. This way a whole function
+    (or if-statement block) is kept within one range, as well as
+    every line a token covers.
+
+    Args:
+        tokens: Tokens of each line.
+        start: First line to split.
+        end: End (exclusive) of the lines to split.
+
+    Returns:
+        Tuple with the (start, end) line range of each statement,
+        and if the last statement was closed/balanced.
+    """
+
+    def step(acc: Tuple[List[Tuple[int, int]], int, int, int], line: int):
+        ranges, first, depth, last = acc
+        depth = reduce(
+            lambda x, y: x + BLOCK_DEPTH.get(type(y), 0), tokens.get(line, []), depth
+        )
+        last = max([last] + list(map(last_line, tokens.get(line, []))))
+
+        if depth > 0 or last > line:
+            return ranges, first, depth, last
+
+        ranges.append((first, line + 1))
+        return ranges, line + 1, 0, line + 1
+
+    ranges, first, _, _ = reduce(step, range(start, end), (list(), start, 0, start))
+
+    if first < end:
+        ranges.append((first, end))
+        return ranges, False
+
+    return ranges, True
+
+
+def collect_positions(obj, found: Optional[Dict[int, Position]] = None):
+    """Collect all (unique) Positions within Tokens and Nodes.
+
+    Args:
+        obj: Token, Node or list of those to collect the Positions from.
+        found: Already collected Positions, by their id. Defaults to None.
+
+    Returns:
+        Dict containing the collected Positions, by their id.
+    """
+    found = dict() if found is None else found
+
+    if isinstance(obj, Position):
+        found[id(obj)] = obj
+
+    elif isinstance(obj, PositionTable):
+        collect_positions(obj.values(), found)
+
+    elif isinstance(obj, Token):
+        collect_positions(obj.pos, found)
+
+    elif isinstance(obj, (BaseNode, list)):
+        _ = list(
+            map(
+                lambda x: collect_positions(x, found),
+                obj if isinstance(obj, list) else [obj.pos] + obj.fields,
+            )
+        )
+
+    return found
+
+
+class Segment:
+    """Lexed and parsed range of lines, containing top-level statement(s).
+
+    Attributes:
+        start: First line of the Segment.
+        end: End (exclusive) line of the Segment.
+        tokens: Tokens of the Segment.
+        nodes: Parsed top-level Nodes of the Segment.
+        error: Optional Error caused while lexing or parsing the Segment.
+        closed: If all code blocks opened within the Segment are closed.
+        positions: Positions of the top-level Nodes.
+        occurrences: PositionTables of the top-level Nodes (see 'NodeTable').
+    """
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        tokens: List[Token],
+        nodes: List[BaseNode],
+        error: Optional[Error] = None,
+        closed: bool = True,
+        positions: Optional[List[Position]] = None,
+        occurrences: Optional[List[PositionTable]] = None,
+    ):
+        """Initialise the Segment.
+
+        Args:
+            start: First line of the Segment.
+            end: End (exclusive) line of the Segment.
+            tokens: Tokens of the Segment.
+            nodes: Parsed top-level Nodes of the Segment.
+            error: Optional Error caused while lexing or parsing. Defaults to None.
+            closed: If all opened code blocks are closed. Defaults to True.
+            positions: Positions of the top-level Nodes. Defaults to None.
+            occurrences: PositionTables of the top-level Nodes. Defaults to None.
+        """
+        self.start = start
+        self.end = end
+        self.tokens = tokens
+        self.nodes = nodes
+        self.error = error
+        self.closed = closed
+        self.positions = list() if positions is None else positions
+        self.occurrences = list() if occurrences is None else occurrences
+
+    def __str__(self) -> str:
+        return f"Segment({self.start}:{self.end})"
+
+    def __repr__(self) -> str:
+        return f"Segment(start={self.start!r}, end={self.end!r}, nodes={self.nodes!r}, error={self.error!r})"
+
+    def move(self, lines: int) -> Segment:
+        """Move the Segment (and all of it's Positions) by the given lines.
+
+        Args:
+            lines: Amount of lines to move.
+
+        Returns:
+            The moved Segment.
+        """
+        if lines != 0:
+            positions = collect_positions(
+                [self.tokens, self.nodes, self.positions, self.occurrences]
+            )
+            _ = list(
+                map(lambda x: setattr(x, "line", x.line + lines), positions.values())
+            )
+            self.start += lines
+            self.end += lines
+        return self
+
+
+class IncrementalParser:
+    """Incremental Lexer and Parser of an edited source.
+
+    The source is kept as top-level statements (Segments), keyed
+    by their lines. After an edit, only the Segments touching the
+    changed lines are lexed and parsed again, while all other
+    Segments (and their FuncNode subtrees) are reused.
+
+    Attributes:
+        lines: Lines of the current source.
+        segments: Segments of the current source.
+        debug_mode: If 'debug mode' is enabled. Defaults to False.
+        relexed: Amount of lines lexed and parsed by the last update.
+        reused: Amount of Segments reused by the last update.
+    """
+
+    def __init__(self, text: str = "", debug_mode: bool = False):
+        """Initialise the parser, and parse the given text.
+
+        Args:
+            text: Source to parse. Defaults to an Empty str.
+            debug_mode: If 'debug mode' is enabled. Defaults to False.
+        """
+        self.lines = text.split("\n")
+        self.debug_mode = debug_mode
+        self.segments = self.build(0, len(self.lines))
+        self.relexed = len(self.lines)
+        self.reused = 0
+
+    def __str__(self) -> str:
+        return f"IncrementalParser({len(self.lines)}, {len(self.segments)})"
+
+    def __repr__(self) -> str:
+        return f"IncrementalParser(text={self.text!r}, debug_mode={self.debug_mode!r})"
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def tokens(self) -> List[Token]:
+        """All tokens of the source, ending with an EOFToken."""
+        return list(chain.from_iterable(map(lambda x: x.tokens, self.segments))) + [
+            EOFToken(pos=Position(len(self.lines)))
+        ]
+
+    def parse(self) -> ParseState:
+        """Return the parsed source.
+
+        Returns:
+            ParseState containing a ListNode with all parsed Nodes,
+            or the first Error found within the source.
+        """
+        errors = list(
+            filter(lambda x: x is not None, map(lambda x: x.error, self.segments))
+        )
+
+        if len(errors) > 0:
+            return ParseState().fail(errors[0])
+
+        return ParseState(
+            ListNode(
+                list(chain.from_iterable(map(lambda x: x.nodes, self.segments))),
+                positions=list(
+                    chain.from_iterable(map(lambda x: x.positions, self.segments))
+                ),
+                occurrences=list(
+                    chain.from_iterable(map(lambda x: x.occurrences, self.segments))
+                ),
+            )
+        )
+
+    def update(self, text: str) -> ParseState:
+        """Update the source with the edited text.
+
+        Args:
+            text: The edited source.
+
+        Returns:
+            ParseState of the edited source.
+        """
+        old, new = self.lines, text.split("\n")
+        size = min(len(old), len(new))
+
+        # Find the amount of unchanged lines
+        # at the start and end of the source
+        prefix = next(filter(lambda x: old[x] != new[x], range(size)), size)
+        suffix = next(
+            filter(lambda x: old[-1 - x] != new[-1 - x], range(size - prefix)),
+            size - prefix,
+        )
+        old_end, moved = len(old) - suffix, len(new) - len(old)
+
+        # Find the Segments touching the changed lines,
+        # including the Segment an insertion was made in
+        changed = list(
+            filter(
+                lambda x: (x.end > prefix and x.start < old_end)
+                or x.start < prefix < x.end,
+                self.segments,
+            )
+        )
+        start = min([prefix] + list(map(lambda x: x.start, changed)))
+        end = max([old_end] + list(map(lambda x: x.end, changed)))
+
+        # A code block left open by the Segment before the changed
+        # lines might be closed by them, so it's built again as well
+        start = min(
+            [start]
+            + list(
+                map(
+                    lambda x: x.start,
+                    filter(lambda x: x.end <= start and not x.closed, self.segments),
+                )
+            )
+        )
+
+        before = list(filter(lambda x: x.end <= start, self.segments))
+        after = list(filter(lambda x: x.start >= end, self.segments))
+
+        self.lines = new
+        rebuilt, after = self.rebuild(start, end + moved, after, moved)
+
+        self.segments = before + rebuilt + list(map(lambda x: x.move(moved), after))
+        self.reused = len(before) + len(after)
+        return self.parse()
+
+    def rebuild(
+        self, start: int, end: int, after: List[Segment], moved: int
+    ) -> Tuple[List[Segment], List[Segment]]:
+        """Build the Segments of the changed lines.
+
+        When the changed lines open a code block that isn't closed
+        within those lines, the next (old) Segment is included
+        as well, until the code block is closed.
+
+        Args:
+            start: First changed line.
+            end: End (exclusive) of the changed lines.
+            after: Old Segments after the changed lines.
+            moved: Amount of lines the old Segments are moved by.
+
+        Returns:
+            Tuple with the built Segments and the remaining old Segments.
+        """
+        segments = self.build(start, end)
+
+        if len(after) > 0 and len(segments) > 0 and not segments[-1].closed:
+            return self.rebuild(start, after[0].end + moved, after[1:], moved)
+
+        self.relexed = end - start
+        return segments, after
+
+    def build(self, start: int, end: int) -> List[Segment]:
+        """Lex and parse the given range of lines into Segments.
+
+        Args:
+            start: First line to build.
+            end: End (exclusive) of the lines to build.
+
+        Returns:
+            The built Segments.
+        """
+        if start >= end:
+            return list()
+
+        text = "\n".join(self.lines[start:end])
+        text += "\n" if end < len(self.lines) else ""
+
+        lexer = Lexer(text, self.debug_mode)
+        lexer.lines = LineIndex(start)
+        tokens, error = lexer.run() if len(text) > 0 else ([], None)
+
+        if error is not None:
+            return [Segment(start, end, [], [], error)]
+
+        lines = group_by_line(tokens)
+        ranges, closed = split_lines(lines, start, end)
+
+        segments = list(map(lambda x: self.build_segment(lines, *x), ranges))
+        segments[-1].closed = closed
+        return segments
+
+    def build_segment(
+        self, lines: Dict[int, List[Token]], start: int, end: int
+    ) -> Segment:
+        """Parse the tokens of the given lines into a Segment.
+
+        Args:
+            lines: Tokens of each line.
+            start: First line of the Segment.
+            end: End (exclusive) line of the Segment.
+
+        Returns:
+            The parsed Segment.
+        """
+        tokens = list(
+            chain.from_iterable(map(lambda x: lines.get(x, []), range(start, end)))
+        )
+        ats = Parser(tokens + [EOFToken(pos=Position(end))], self.debug_mode).parse()
+
+        if ats.error is not None:
+            return Segment(start, end, tokens, [], ats.error)
+
+        return Segment(
+            start,
+            end,
+            tokens,
+            ats.node.items,
+            positions=ats.node.positions,
+            occurrences=ats.node.occurrences,
+        )
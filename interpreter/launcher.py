@@ -1,10 +1,13 @@
 import os
 import subprocess
 from typing import Optional
-from interpreter.lexer import Lexer
+from interpreter.lexer import Lexer, LineCache
 from interpreter.parser import Parser
-from interpreter.program import Program, Scope
-from interpreter.errors import Error, FileNotFoundError
+from interpreter.program import Program, Scope, MAX_DEPTH
+from interpreter.tracing import Tracer
+from interpreter.output import Output, StreamOutput, BUFFER_SIZE
+from interpreter.errors import Error, ErrorSignal, FileNotFoundError
+from interpreter.utils import run_with_stack
 
 
 class Launcher:
@@ -13,11 +16,27 @@ class Launcher:
     Attributes:
         file_path: Direct path to the Moonlet file.
         input_file: Opened file bytes, using the 'file_path'.
+        tracer: Optional Tracer, recording the execution of the Program.
+        trace_format: Format to dump the recorded trace in.
+        trace_output: Optional path to dump the recorded trace to.
+        max_depth: Maximum depth of (nested) function calls.
+        output: Output to write the printed values of the Program to.
+        jobs: Amount of processes to lex the file with.
 
     """
 
     def __init__(
-        self, file_path: Optional[str] = None, debug_mode: bool = False, test_mode=False
+        self,
+        file_path: Optional[str] = None,
+        debug_mode: bool = False,
+        test_mode=False,
+        trace_size: Optional[int] = None,
+        trace_format: str = "text",
+        trace_output: Optional[str] = None,
+        max_depth: int = MAX_DEPTH,
+        output: Optional[Output] = None,
+        buffer_size: int = BUFFER_SIZE,
+        jobs: int = 1,
     ) -> None:
         """Initialise the Launcher with given file.
 
@@ -25,10 +44,32 @@ class Launcher:
             file_path: Direct path to file. Defaults to None.
             debug_mode: If 'debug_mode' is enabled. Defaults to False.
             test_mode: If 'test_mode' is enabled. Defaults to False.
+            trace_size: Amount of trace events to keep, tracing
+                is disabled when not given. Defaults to None.
+            trace_format: Format of the dumped trace ('text' or 'jsonl'). Defaults to 'text'.
+            trace_output: Path to always dump the trace to, otherwise the trace
+                is only dumped to 'stderr' when an Error occured. Defaults to None.
+            max_depth: Maximum depth of (nested) function calls. Defaults to 'MAX_DEPTH'.
+            output: Output to write the printed values of the Program to.
+                Defaults to a StreamOutput, which writes to 'sys.stdout'.
+            buffer_size: Amount of characters to buffer within the default
+                Output, which is unbuffered in 'debug_mode'. Defaults to 'BUFFER_SIZE'.
+            jobs: Amount of processes to lex the file with, where more than
+                1 lexes the file in parallel shards. Defaults to 1.
         """
         self.file_path = file_path
         self.debug_mode = debug_mode
         self.test_mode = test_mode
+        self.tracer = Tracer(trace_size) if trace_size else None
+        self.trace_format = trace_format
+        self.trace_output = trace_output
+        self.max_depth = max_depth
+        self.jobs = jobs
+        self.output = (
+            StreamOutput(buffer_size=0 if debug_mode else buffer_size)
+            if output is None
+            else output
+        )
 
         if test_mode:
             print(f"{'TESTING':-^60}", end="\n\n")
@@ -75,6 +116,25 @@ class Launcher:
         print(f"    {file_line}")
         print(error)
 
+    def dump_trace(self, failed: bool = False) -> None:
+        """Dump the recorded trace of the Program.
+
+        The trace is written to the 'trace_output' file when given,
+        or else to 'stderr' when the Program failed.
+
+        Args:
+            failed: If the Program failed with an Error. Defaults to False.
+        """
+        if self.tracer is None:
+            return
+
+        if self.trace_output is not None:
+            with open(self.trace_output, "w") as file:
+                self.tracer.dump(self.trace_format, file)
+
+        elif failed:
+            self.tracer.dump(self.trace_format)
+
     def run_moonlet(self):
         """Launch the Moonlet steps."""
 
@@ -85,9 +145,17 @@ class Launcher:
             if self.debug_mode:
                 print(f"{'LEXER':-^60}")
 
-            lexer = Lexer(input_file, self.debug_mode)
+            # Lex the file line by line, so repeated lines are
+            # replayed from the LineCache, and the others are
+            # scanned as bytes (when they're plain ASCII)
+            lexer = Lexer(
+                input_file, self.debug_mode, self.jobs, LineCache(), binary=True
+            )
             tokens, lexer_error = lexer.run()
 
+            if self.debug_mode and self.jobs == 1:
+                print(f"{'LINE_CACHE:': <30} {lexer.cache.format_stats()}")
+
             # Check for potential errors caused
             # during the lexing process of the file
             if lexer_error is not None:
@@ -108,9 +176,24 @@ class Launcher:
             # the nodes created within the ATS
             if self.debug_mode:
                 print(f"{'PROGRAM':-^60}")
-            prog = Program(self.debug_mode)
+            # The Program runs with a stack large enough
+            # to reach the maximum call depth, so deep recursions
+            # are stopped by the Program itself instead of Python
+            prog = Program(self.debug_mode, self.tracer, self.max_depth, self.output)
             prog_scope = Scope(name="<Program>", origin=ats.node)
-            prog_result = prog.exec(ats.node, prog_scope)
+            try:
+                prog_result = run_with_stack(
+                    lambda: prog.run(ats.node, prog_scope),
+                    prog.recursion_limit,
+                    prog.stack_size,
+                )
+
+            # The stack of the Program couldn't be
+            # created, so it never started running
+            except ErrorSignal as signal:
+                print(signal.error)
+                return
+            self.dump_trace(prog_result.error is not None)
 
             # Check for potential errors caused
             # during the execution process of the Program
@@ -121,3 +204,5 @@ class Launcher:
                 print("")
                 print(f"{'='*60}")
                 print(f"{'RESULT_PROGRAM:': <30} {str(prog_scope.format_args()): <50}")
+                print(f"{'QUICKENING:': <30} {prog.quickening.format_stats()}")
+                print(f"{'CALL_CACHE:': <30} {prog.call_cache.format_stats()}")
@@ -1,297 +1,828 @@
-import re
-from typing import Optional, Tuple, Union, List
-from functools import reduce
-from interpreter.tokens import (
-    TokenTypes,
-    NewLineToken,
-    FloatToken,
-    StringToken,
-    IntegerToken,
-    EOFToken,
-    CommentToken,
-)
-from interpreter.position import Position
-from interpreter.errors import Error, InvalidSyntaxError
-from interpreter.utils import debug_log
-
-
-class Lexer:
-    """Reperesentation of the Moonlet Lexer.
-
-    Attributes:
-        text: Input text to lexial.
-        debug_mode: If 'debug mode' is enabled. Defaults to False.
-        pos: Current position of the Lexer.
-        error: Optional causes Error. Defaults to None.
-    """
-
-    def __init__(self, text: str = "", debug_mode: bool = False):
-        """Initialise the Lexer with the given text.
-
-        Args:
-            text: input text to lexial. Defaults to Empty str.
-            debug_mode: If 'debug mode' is enabled. Defaults to False.
-        """
-        self.text = text
-        self.debug_mode = debug_mode
-        self.pos = Position()
-        self.error = None
-
-    def __str__(self) -> str:
-        return f"Lexer({self.debug_mode})"
-
-    def __repr__(self) -> str:
-        return f"Lexer(text={self.text!r}, debug_mode={self.debug_mode!r})"
-
-    @debug_log("Lexer.run", True)
-    def run(self):
-        """Run the Lexer.
-
-        Returns:
-            List of found and created Tokens.
-        """
-
-        # Only start tokenizing when
-        # the size of the 'text' > 0
-        if len(self.text) == 0:
-            self.error = Error(
-                "Empty", "Couldn't perform Lexing as no 'text' input was given"
-            )
-            return [EOFToken(pos=self.pos)], self.error
-
-        tokens = self.tokenize(self.text)
-        self.pos.nextl()
-        return tokens + [EOFToken(pos=self.pos)], self.error
-
-    @debug_log("Lexer.tokenize", True)
-    def tokenize(self, text):
-        """Tokenize the given text.
-
-        Args:
-            text: Text to tonenize.
-
-        Returns:
-            List of tokens.
-        """
-
-        if text is None or len(text) == 0 or self.error is not None:
-            return []
-
-        elif text[0] == " ":
-            self.pos.next()
-            return self.tokenize(text[1:])
-
-        token, rest = self.match_expr(text)
-
-        # Ignore Comment lines
-        if isinstance(token, CommentToken):
-            return self.tokenize(rest)
-
-        return [token] + self.tokenize(rest)
-
-    def match_expr(self, text):
-        """Match the text against a Token expression.
-
-        Args:
-            text: Text to perform the match with.
-
-        Returns:
-            Tuple with the matched token and the rest
-            of the remaining text.
-        """
-
-        # First try to match for a symbol token
-        token, match = self.match_tokens(
-            text[0], TokenTypes.MATH_OPS.value + TokenTypes.SINGLE_CHARS.value
-        )
-
-        # If a match with a symbol was made,
-        # then return the found token
-        if token is not None and match is not None:
-            # If the token is a newline,
-            # then reformat the value and
-            # set the Lexer position to nextline
-            if token is NewLineToken:
-                found = token("\\n", self.pos.copy())
-                self.pos.nextl()
-
-            # Or else define the found token,
-            # and return the found result
-            else:
-                found = token(text[0], self.pos.copy())
-                self.pos.next()
-
-            return found, text[1:] if len(text) > 1 else None
-
-        # If current 'char' is a 'quote'
-        # or a 'double quote', then
-        # build the next part, while
-        # ignoring whitespaces
-        if len(text) > 1 and (text[0] == '"' or text[0] == "'"):
-            rest, part, size = self.build_part(text=text[1:], find=text[0])
-
-            if part.count(text[0]) < 1:
-                self.error = InvalidSyntaxError(
-                    f"Expected '\"', \"'\"", self.pos.copy(size - 1)
-                )
-                return None, None
-
-            part = text[0] + part
-        else:
-            rest, part, size = self.build_part(text)
-
-        # Try to find the matching token,
-        # with the part that was made before
-        token, match = self.match_tokens(
-            part,
-            TokenTypes.DATA_TYPES.value
-            + TokenTypes.COMPERATIONS.value
-            + TokenTypes.ASSIGNMENT_OPS.value
-            + TokenTypes.STATEMENTS.value,
-        )
-
-        # If a match with the part was made,
-        # then return the found token as a part
-        if token is not None and match is not None:
-            # Try to format the value of the part,
-            # and define an 'error' when an exception
-            # happend during the process
-            try:
-                # Else if the token is a FloatToken,
-                # then convert the part to it's type
-                if token is FloatToken:
-                    part = float(part)
-
-                # Else if the token is a IntegerToken,
-                # then convert the part to it's type
-                elif token is IntegerToken:
-                    part = int(part)
-
-                # Else if the token is a CommentToken,
-                # continue part building, until the end
-                elif token is CommentToken:
-                    found = token(part, self.pos.copy(size - 1))
-                    rest, _, comment_size = self.build_part(text=rest, stops=["\n"])
-                    self.pos.next(size + comment_size - 1)
-                    found.pos.end += comment_size
-                    return found, rest
-
-                # Else if the token is a StringToken,
-                # then strip the (double) quotes
-                elif token is StringToken:
-                    part = part.replace("'", "")
-                    part = part.replace('"', "")
-
-                found = token(part, self.pos.copy(size - 1))
-                self.pos.next(size)
-                return found, rest
-
-            except ValueError:
-                self.error = InvalidSyntaxError(
-                    f"Cannot create {token} with value '{part}'"
-                )
-                return None, None
-
-        self.error = InvalidSyntaxError(
-            f"{part!r} isn't a valid expression", self.pos.copy(size - 1)
-        )
-        return None, None
-
-    def match_tokens(self, text, tokens):
-        """Match text against a list of Tokens.
-
-        Args:
-            text: Text to match.
-            tokens: Tokens to match against.
-
-        Returns:
-            Found Tokens match.
-        """
-        return reduce(
-            lambda x, y: x if x[1] is not None else y,
-            map(lambda x: (x, self.match_token(text, x)), tokens),
-        )
-
-    def match_token(self, text, token):
-        """Match text against a Token.
-
-        Args:
-            text: Text to match.
-            tokens: Token to match against.
-
-        Returns:
-            Found Token match.
-        """
-
-        if isinstance(token, object):
-            token = token()
-
-            # Return 'None' if the token
-            # has no expression to match
-            if token.expr is None:
-                return None
-
-            pattern = re.compile(token.expr)
-            return re.match(pattern, text)
-
-        return None
-
-    def build_part(
-        self,
-        text: str,
-        result: Optional[str] = "",
-        size: Optional[int] = 0,
-        stops: Optional[List] = None,
-        find: Optional[str] = None,
-    ) -> Tuple[Union[str, None], Union[str, None], int]:
-        """Build a Token part.
-
-        Args:
-            text: Input text to build the part with.
-            result: Passed result of the part building. Defaults to ''.
-            size: Size of the build part. Defaults to 0.
-            stops: End stop of the build part. Defaults to None.
-            find: Symbol to look for during part building. Defaults to None.
-
-        Returns:
-            The build part.
-        """
-
-        # Define a list of chars, where if
-        # the current char is one of these chars,
-        # then stop with building the part,
-        # (if no 'find' param is given)
-        if stops is None:
-            stops = [" ", "\t", "\n", "(", ")", ","]
-
-        # Return the result if no char is
-        # left for the part building process
-        if len(text) == 0:
-            return None, result, size
-
-        # Return when the 'find' char is found
-        if find is not None and text[0] == find:
-            if len(text) > 1:
-                return text[1:], result + text[0], size + 1
-            return None, result + text[0], size + 1
-
-        # Stop building the part, if current
-        # char is within the 'stops' list
-        elif find is None and text[0] in stops:
-            return text, result, size
-
-        # Return the result + the last char,
-        # when there is only one last char left
-        elif len(text) == 1:
-            return None, result + text[0], size + 1
-
-        # Continue building the part with
-        # the remaining text, and add
-        # the current char to the result
-        return self.build_part(
-            text=text[1:],
-            result=result + text[0],
-            size=size + 1,
-            stops=stops,
-            find=find,
-        )
+import re
+import sys
+from bisect import bisect_left
+from itertools import accumulate, chain, islice, repeat
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Dict, Optional, Tuple, Union, List
+from functools import reduce
+from interpreter.tokens import (
+    Token,
+    TokenTypes,
+    NewLineToken,
+    FloatToken,
+    StringToken,
+    IntegerToken,
+    EOFToken,
+    CommentToken,
+)
+from interpreter.position import Position, LineIndex
+from interpreter.errors import Error, InvalidSyntaxError
+from interpreter.utils import debug_log
+
+# Preferred size (in characters) of a shard, when lexing in parallel
+SHARD_SIZE = 4096
+
+# Maximum amount of distinct lines kept within a LineCache
+LINE_CACHE_SIZE = 4096
+
+# Tokens matched by a single char, and Tokens matched by a part of the text
+CHAR_TOKENS = TokenTypes.MATH_OPS.value + TokenTypes.SINGLE_CHARS.value
+PART_TOKENS = (
+    TokenTypes.DATA_TYPES.value
+    + TokenTypes.COMPERATIONS.value
+    + TokenTypes.ASSIGNMENT_OPS.value
+    + TokenTypes.STATEMENTS.value
+)
+
+# Lookup tables used when lexing the (ASCII) bytes of a text:
+# the Token of each char that's a Token on it's own, the compiled
+# expressions of the other Tokens, and the chars that end a part
+CHAR_TOKEN_BYTES: Dict[int, type] = dict(
+    filter(
+        lambda x: x[1] is not None,
+        map(
+            lambda x: (
+                x,
+                next(filter(lambda y: re.match(y().expr, chr(x)), CHAR_TOKENS), None),
+            ),
+            range(128),
+        ),
+    )
+)
+PART_TOKEN_BYTES: List[Tuple[type, re.Pattern]] = list(
+    map(lambda x: (x, re.compile(x().expr.encode())), PART_TOKENS)
+)
+STOP_BYTES = re.compile(rb"[ \t\n(),]")
+QUOTE_BYTES = frozenset(b"\"'")
+
+# Parts of the text (the same as 'tokenize' splits it) of which the
+# 'literal' ones are where a newline doesn't end a line of the source:
+# comments and (double) quoted strings, where an unterminated string
+# continues until the end. These only start at the start of a part,
+# so a '=#' or quote within a part (like 'x=#c') doesn't start one
+LITERALS = re.compile(
+    r"[ \t"
+    + re.escape("".join(map(chr, CHAR_TOKEN_BYTES)))
+    + r"]|(?P<literal>=#[^\n]*|\"[^\"]*\"?|'[^']*'?)|[^ \t\n(),]+"
+)
+
+
+def shard_text(text: str, size: int = SHARD_SIZE) -> List[str]:
+    """Split the text into shards of whole lines.
+
+    The text is only split at newlines, which are
+    not part of a (multiline) string. An unterminated
+    string continues until the end of the text, so the
+    shard lexing it fails with the same Error Position
+    as lexing the whole text would.
+
+    Args:
+        text: Text to split.
+        size: Preferred size of a shard. Defaults to 'SHARD_SIZE'.
+
+    Returns:
+        List of the shards, which joined together form the text.
+    """
+    literals = list(
+        filter(
+            lambda x: "\n" in (x.group("literal") or ""), LITERALS.finditer(text)
+        )
+    )
+    newlines = list(
+        filter(
+            lambda x: not any(map(lambda y: y.start() < x < y.end(), literals)),
+            map(lambda x: x.end(), re.finditer("\n", text)),
+        )
+    )
+
+    # Find the first newline after each 'size' characters
+    cuts = sorted(
+        set(
+            map(
+                lambda x: newlines[x] if x < len(newlines) else len(text),
+                map(lambda x: bisect_left(newlines, x), range(size, len(text), size)),
+            )
+        )
+        | {0, len(text)}
+    )
+    return list(
+        filter(len, map(lambda x: text[x[0] : x[1]], zip(cuts, cuts[1:])))
+    )
+
+
+def lex_shard(text: str, binary: bool = False) -> Tuple[List, Optional[Error]]:
+    """Lex a single shard of the text.
+
+    Args:
+        text: Shard to lex.
+        binary: If the shard is lexed as bytes (see 'Lexer.scan'). Defaults to False.
+
+    Returns:
+        Tuple with the found Tokens and an optional Error.
+    """
+    # The Lexer recurses for each Token,
+    # so make sure the whole shard fits
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, len(text) * 4 + 1000))
+
+    try:
+        return Lexer(text, binary=binary).run()
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def move_tokens(result: Tuple[List, Optional[Error]], lines: int):
+    """Move the Positions of a lexed shard by the given lines.
+
+    Args:
+        result: Tokens and optional Error of the lexed shard.
+        lines: Amount of lines to move.
+
+    Returns:
+        Tuple with the moved Tokens and optional Error.
+    """
+    tokens, error = result
+    locations = list(
+        map(lambda x: x.location, filter(lambda x: x is not None, tokens))
+    )
+
+    # Tokens without a built Position share the LineIndex of
+    # their shard, so moving the index moves all of them at once
+    indices = dict(
+        map(
+            lambda x: (id(x[0]), x[0]),
+            filter(lambda x: isinstance(x, tuple), locations),
+        )
+    )
+    positions = chain(
+        indices.values(), locations, [error.pos] if error is not None else []
+    )
+    _ = list(
+        map(
+            lambda x: setattr(x, "line", x.line + lines),
+            filter(lambda x: isinstance(x, (Position, LineIndex)), positions),
+        )
+    )
+    return tokens, error
+
+
+class LineCache:
+    """Bounded cache of the Tokens of lexed lines.
+
+    Generated sources repeat many identical lines (like '=- n 1'
+    within many functions). The Token classes, values and offsets
+    of a lexed line are kept by the text of the line, and replayed
+    as new Tokens (with their own LineIndex) when the same line is
+    lexed again, instead of scanning it char by char. Lines with an
+    Error aren't kept. When the cache is full, the least recently
+    used line is removed.
+
+    Attributes:
+        size: Maximum amount of kept lines.
+        lines: Kept Tokens, line starts and lex time of each line, by it's text.
+        hits: Amount of lines replayed from the cache.
+        misses: Amount of lines that were lexed.
+        saved: Time (in seconds) saved by replaying lines, instead of lexing them.
+    """
+
+    def __init__(self, size: int = LINE_CACHE_SIZE):
+        """Initialise an empty LineCache.
+
+        Args:
+            size: Maximum amount of kept lines. Defaults to 'LINE_CACHE_SIZE'.
+        """
+        self.size = size
+        self.lines: Dict[str, Tuple[List[Tuple], List[int], float]] = dict()
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+
+    def __str__(self) -> str:
+        return f"LineCache({len(self.lines)}, {self.hits}, {self.misses})"
+
+    def __repr__(self) -> str:
+        return f"LineCache(size={self.size!r}, lines={len(self.lines)!r}, hits={self.hits!r}, misses={self.misses!r}, saved={self.saved!r})"
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    @property
+    def hit_rate(self) -> float:
+        """Part of the lines replayed from the cache."""
+        return self.hits / max(1, self.hits + self.misses)
+
+    def format_stats(self) -> str:
+        """Format the statistics of the cache as a single line."""
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%}), {self.saved * 1000:.1f} ms saved"
+
+    def lex(self, text: str, binary: bool = False) -> Tuple[List[Token], Optional[Error]]:
+        """Lex a single line, or replay it from the cache.
+
+        Args:
+            text: Line to lex, including it's newline.
+            binary: If the line is lexed as bytes (see 'Lexer.scan'). Defaults to False.
+
+        Returns:
+            Tuple with the Tokens of the line and an optional Error.
+        """
+        start = perf_counter()
+        entry = self.lines.pop(text, None)
+
+        if entry is not None:
+            self.lines[text] = entry
+            tokens = self.replay(entry)
+            self.hits += 1
+            self.saved += entry[2] - (perf_counter() - start)
+            return tokens, None
+
+        tokens, error = lex_shard(text, binary)
+        self.misses += 1
+
+        if error is None:
+            self.lines[text] = (
+                list(map(lambda x: (type(x), x.value) + x.location[1:], tokens)),
+                tokens[-1].location[0].starts,
+                perf_counter() - start,
+            )
+
+            # Remove the least recently used line(s)
+            _ = list(
+                map(
+                    self.lines.pop,
+                    list(islice(self.lines, max(0, len(self.lines) - self.size))),
+                )
+            )
+
+        return tokens, error
+
+    def replay(self, entry: Tuple[List[Tuple], List[int], float]) -> List[Token]:
+        """Build new Tokens of a kept line.
+
+        Args:
+            entry: Kept Tokens, line starts and lex time of the line.
+
+        Returns:
+            The Tokens of the line.
+        """
+        lines = LineIndex(starts=list(entry[1]))
+        return list(map(lambda x: x[0](x[1]).at(lines, x[2], x[3]), entry[0]))
+
+
+class Lexer:
+    """Reperesentation of the Moonlet Lexer.
+
+    The Lexer keeps it's position as an offset within the text,
+    while the starts of the lines are recorded within a LineIndex.
+    The Tokens only get this offset, so no Position is built
+    while lexing (unless an Error is found).
+
+    Attributes:
+        text: Input text to lexial.
+        debug_mode: If 'debug mode' is enabled. Defaults to False.
+        offset: Current offset of the Lexer.
+        lines: LineIndex of the lexed text.
+        pos: Current position of the Lexer.
+        error: Optional causes Error. Defaults to None.
+        jobs: Amount of processes to lex with. Defaults to 1.
+        cache: Optional LineCache to lex the text line by line with.
+        binary: If the text is lexed as bytes, instead of str slices.
+        index: Current index within the bytes of the text.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        debug_mode: bool = False,
+        jobs: int = 1,
+        cache: Optional[LineCache] = None,
+        binary: bool = False,
+    ):
+        """Initialise the Lexer with the given text.
+
+        Args:
+            text: input text to lexial. Defaults to Empty str.
+            debug_mode: If 'debug mode' is enabled. Defaults to False.
+            jobs: Amount of processes to lex with, where more
+                than 1 lexes the text in parallel shards. Defaults to 1.
+            cache: Optional LineCache, to lex the text line by line
+                with (when lexing within a single process). Defaults to None.
+            binary: If the text is lexed as bytes (see 'Lexer.scan'),
+                instead of str slices. Defaults to False.
+        """
+        self.text = text
+        self.debug_mode = debug_mode
+        self.offset = 0
+        self.lines = LineIndex()
+        self.error = None
+        self.jobs = jobs
+        self.cache = cache
+        self.binary = binary
+        self.index = 0
+
+    def __str__(self) -> str:
+        return f"Lexer({self.debug_mode})"
+
+    def __repr__(self) -> str:
+        return f"Lexer(text={self.text!r}, debug_mode={self.debug_mode!r})"
+
+    @property
+    def pos(self) -> Position:
+        return self.lines.locate(self.offset)
+
+    def place(self, token: Token, steps: int = 0) -> Token:
+        """Place the given Token at the current offset.
+
+        Args:
+            token: Token to place.
+            steps: Size of the Token, after the first char. Defaults to 0.
+
+        Returns:
+            The placed Token.
+        """
+        return token.at(self.lines, self.offset, self.offset + max(steps, 0))
+
+    def next_line(self):
+        """Go to the start of the next line."""
+        self.offset += 1
+        self.lines.add(self.offset)
+
+    def add_lines(self, part: str):
+        """Start a new line after each newline within a part of the text.
+
+        A (multiline) string continues onto the next lines, so the
+        Tokens after it are placed at the line they're actually at.
+
+        Args:
+            part: Part of the text, starting at the current offset.
+        """
+        _ = list(
+            map(lambda x: self.lines.add(self.offset + x.end()), re.finditer("\n", part))
+        )
+
+    @debug_log("Lexer.run", True)
+    def run(self):
+        """Run the Lexer.
+
+        Returns:
+            List of found and created Tokens.
+        """
+
+        # Only start tokenizing when
+        # the size of the 'text' > 0
+        if len(self.text) == 0:
+            self.error = Error(
+                "Empty", "Couldn't perform Lexing as no 'text' input was given"
+            )
+            return [self.place(EOFToken())], self.error
+
+        if self.jobs > 1:
+            return self.run_sharded(self.jobs)
+
+        if self.cache is not None:
+            return self.run_cached()
+
+        # Only ASCII text can be lexed as bytes, as the
+        # offsets of the bytes and chars are the same
+        if self.binary and self.text.isascii():
+            tokens = self.scan(self.text.encode())
+        else:
+            tokens = self.tokenize(self.text)
+
+        self.next_line()
+        return tokens + [self.place(EOFToken())], self.error
+
+    @debug_log("Lexer.run_sharded")
+    def run_sharded(self, jobs: int = 1, size: int = SHARD_SIZE):
+        """Run the Lexer over shards of the text.
+
+        The text is split into shards of whole lines,
+        which are lexed seperately (in parallel when more
+        than 1 job is given). The Tokens of the shards are
+        merged back together, after moving their Positions
+        to the line the shard started at.
+
+        Args:
+            jobs: Amount of processes to lex with. Defaults to 1.
+            size: Preferred size of a shard. Defaults to 'SHARD_SIZE'.
+
+        Returns:
+            List of found and created Tokens.
+        """
+        shards = shard_text(self.text, size)
+
+        if jobs > 1 and len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(
+                    executor.map(
+                        lex_shard,
+                        shards,
+                        repeat(self.binary),
+                        chunksize=max(1, len(shards) // (jobs * 4)),
+                    )
+                )
+        else:
+            results = list(map(lex_shard, shards, repeat(self.binary)))
+
+        return self.merge(results)
+
+    @debug_log("Lexer.run_cached")
+    def run_cached(self):
+        """Run the Lexer line by line, through it's LineCache.
+
+        Returns:
+            List of found and created Tokens.
+        """
+        return self.merge(
+            list(map(self.cache.lex, shard_text(self.text, 1), repeat(self.binary)))
+        )
+
+    def merge(self, results: List[Tuple[List[Token], Optional[Error]]]):
+        """Merge the Tokens of lexed shards.
+
+        Args:
+            results: Tokens and optional Error of each shard.
+
+        Returns:
+            List of found and created Tokens.
+        """
+        # Move each shard to the line it started at,
+        # and stop merging at the first shard with an Error
+        lines = list(
+            accumulate(
+                map(lambda x: x[0][-1].pos.line - 1, results), initial=self.lines.line
+            )
+        )
+        results = list(map(move_tokens, results, lines))
+        failed = next(
+            filter(lambda x: results[x][1] is not None, range(len(results))),
+            len(results) - 1,
+        )
+
+        tokens = list(
+            chain.from_iterable(map(lambda x: x[0][:-1], results[:failed]))
+        )
+        self.error = results[failed][1]
+        return tokens + results[failed][0], self.error
+
+    @debug_log("Lexer.scan", True)
+    def scan(self, data: bytes) -> List[Token]:
+        """Scan the (ASCII) bytes of a text into Tokens.
+
+        Instead of slicing off the rest of the text after every
+        Token, and building each part char by char, the bytes are
+        scanned by index through a memoryview. A part is only
+        matched and converted as a slice of the bytes, so it's value
+        is the only object that's created for it. This gives the same
+        Tokens (and Errors) as 'tokenize', without recursing per Token.
+
+        Args:
+            data: Bytes of the text to scan.
+
+        Returns:
+            List of tokens.
+        """
+        view = memoryview(data)
+        return list(
+            chain.from_iterable(
+                iter(
+                    lambda: self.scan_token(data, view)
+                    if self.index < len(data) and self.error is None
+                    else None,
+                    None,
+                )
+            )
+        )
+
+    def scan_token(self, data: bytes, view: memoryview) -> List[Optional[Token]]:
+        """Scan the Token at the current index of the bytes.
+
+        Args:
+            data: Bytes of the text to scan.
+            view: Memoryview of the same bytes.
+
+        Returns:
+            List with the scanned Token, None when an Error was
+            found, or an empty list when nothing was scanned.
+        """
+        start = self.index
+        char = data[start]
+
+        if char == 32:
+            self.offset += 1
+            self.index += 1
+            return []
+
+        # First try to match a single char Token
+        token = CHAR_TOKEN_BYTES.get(char, None)
+
+        if token is NewLineToken:
+            found = self.place(token("\\n"))
+            self.next_line()
+            self.index += 1
+            return [found]
+
+        elif token is not None:
+            found = self.place(token(chr(char)))
+            self.offset += 1
+            self.index += 1
+            return [found]
+
+        # A string ends at the next matching quote, while
+        # the size of a string excludes it's opening quote
+        if char in QUOTE_BYTES and start + 1 < len(data):
+            end = data.find(data[start : start + 1], start + 1) + 1
+            size = end - start - 1
+
+            if end == 0:
+                size = len(data) - start - 1
+                self.error = InvalidSyntaxError(
+                    f"Expected '\"', \"'\"",
+                    self.lines.locate(self.offset, self.offset + max(size - 1, 0)),
+                )
+                return [None]
+        else:
+            stop = STOP_BYTES.search(data, start)
+            end = len(data) if stop is None else stop.start()
+            size = end - start
+
+        token = next(
+            map(
+                lambda x: x[0],
+                filter(lambda x: x[1].match(data, start, end), PART_TOKEN_BYTES),
+            ),
+            None,
+        )
+        self.index = end
+
+        if token is None:
+            self.error = InvalidSyntaxError(
+                f"{str(view[start:end], 'ascii')!r} isn't a valid expression",
+                self.lines.locate(self.offset, self.offset + max(size - 1, 0)),
+            )
+            return [None]
+
+        try:
+            if token is FloatToken or token is IntegerToken:
+                value = (float if token is FloatToken else int)(view[start:end])
+
+            # A comment continues until the end of the
+            # line, and is ignored (just like 'tokenize')
+            elif token is CommentToken:
+                stop = data.find(b"\n", end)
+                self.index = len(data) if stop < 0 else stop
+                self.offset += size + self.index - end - 1
+                return []
+
+            elif token is StringToken:
+                value = str(view[start:end], "ascii")
+                self.add_lines(value)
+                value = value.replace("'", "").replace('"', "")
+
+            else:
+                value = str(view[start:end], "ascii")
+
+        except ValueError:
+            self.error = InvalidSyntaxError(
+                f"Cannot create {token} with value '{str(view[start:end], 'ascii')}'"
+            )
+            return [None]
+
+        found = self.place(token(value), size - 1)
+        self.offset += size
+        return [found]
+
+    @debug_log("Lexer.tokenize", True)
+    def tokenize(self, text):
+        """Tokenize the given text.
+
+        Args:
+            text: Text to tonenize.
+
+        Returns:
+            List of tokens.
+        """
+
+        if text is None or len(text) == 0 or self.error is not None:
+            return []
+
+        elif text[0] == " ":
+            self.offset += 1
+            return self.tokenize(text[1:])
+
+        token, rest = self.match_expr(text)
+
+        # Ignore Comment lines
+        if isinstance(token, CommentToken):
+            return self.tokenize(rest)
+
+        return [token] + self.tokenize(rest)
+
+    def match_expr(self, text):
+        """Match the text against a Token expression.
+
+        Args:
+            text: Text to perform the match with.
+
+        Returns:
+            Tuple with the matched token and the rest
+            of the remaining text.
+        """
+
+        # First try to match for a symbol token
+        token, match = self.match_tokens(
+            text[0], TokenTypes.MATH_OPS.value + TokenTypes.SINGLE_CHARS.value
+        )
+
+        # If a match with a symbol was made,
+        # then return the found token
+        if token is not None and match is not None:
+            # If the token is a newline,
+            # then reformat the value and
+            # set the Lexer position to nextline
+            if token is NewLineToken:
+                found = self.place(token("\\n"))
+                self.next_line()
+
+            # Or else define the found token,
+            # and return the found result
+            else:
+                found = self.place(token(text[0]))
+                self.offset += 1
+
+            return found, text[1:] if len(text) > 1 else None
+
+        # If current 'char' is a 'quote'
+        # or a 'double quote', then
+        # build the next part, while
+        # ignoring whitespaces
+        if len(text) > 1 and (text[0] == '"' or text[0] == "'"):
+            rest, part, size = self.build_part(text=text[1:], find=text[0])
+
+            if part.count(text[0]) < 1:
+                self.error = InvalidSyntaxError(
+                    f"Expected '\"', \"'\"",
+                    self.lines.locate(self.offset, self.offset + max(size - 1, 0)),
+                )
+                return None, None
+
+            part = text[0] + part
+        else:
+            rest, part, size = self.build_part(text)
+
+        # Try to find the matching token,
+        # with the part that was made before
+        token, match = self.match_tokens(
+            part,
+            TokenTypes.DATA_TYPES.value
+            + TokenTypes.COMPERATIONS.value
+            + TokenTypes.ASSIGNMENT_OPS.value
+            + TokenTypes.STATEMENTS.value,
+        )
+
+        # If a match with the part was made,
+        # then return the found token as a part
+        if token is not None and match is not None:
+            # Try to format the value of the part,
+            # and define an 'error' when an exception
+            # happend during the process
+            try:
+                # Else if the token is a FloatToken,
+                # then convert the part to it's type
+                if token is FloatToken:
+                    part = float(part)
+
+                # Else if the token is a IntegerToken,
+                # then convert the part to it's type
+                elif token is IntegerToken:
+                    part = int(part)
+
+                # Else if the token is a CommentToken,
+                # continue part building, until the end
+                elif token is CommentToken:
+                    rest, _, comment_size = self.build_part(text=rest, stops=["\n"])
+                    found = self.place(token(part), size - 1 + comment_size)
+                    self.offset += size + comment_size - 1
+                    return found, rest
+
+                # Else if the token is a StringToken,
+                # then strip the (double) quotes
+                elif token is StringToken:
+                    self.add_lines(part)
+                    part = part.replace("'", "")
+                    part = part.replace('"', "")
+
+                found = self.place(token(part), size - 1)
+                self.offset += size
+                return found, rest
+
+            except ValueError:
+                self.error = InvalidSyntaxError(
+                    f"Cannot create {token} with value '{part}'"
+                )
+                return None, None
+
+        self.error = InvalidSyntaxError(
+            f"{part!r} isn't a valid expression",
+            self.lines.locate(self.offset, self.offset + max(size - 1, 0)),
+        )
+        return None, None
+
+    def match_tokens(self, text, tokens):
+        """Match text against a list of Tokens.
+
+        Args:
+            text: Text to match.
+            tokens: Tokens to match against.
+
+        Returns:
+            Found Tokens match.
+        """
+        return reduce(
+            lambda x, y: x if x[1] is not None else y,
+            map(lambda x: (x, self.match_token(text, x)), tokens),
+        )
+
+    def match_token(self, text, token):
+        """Match text against a Token.
+
+        Args:
+            text: Text to match.
+            tokens: Token to match against.
+
+        Returns:
+            Found Token match.
+        """
+
+        if isinstance(token, object):
+            token = token()
+
+            # Return 'None' if the token
+            # has no expression to match
+            if token.expr is None:
+                return None
+
+            pattern = re.compile(token.expr)
+            return re.match(pattern, text)
+
+        return None
+
+    def build_part(
+        self,
+        text: str,
+        result: Optional[str] = "",
+        size: Optional[int] = 0,
+        stops: Optional[List] = None,
+        find: Optional[str] = None,
+    ) -> Tuple[Union[str, None], Union[str, None], int]:
+        """Build a Token part.
+
+        Args:
+            text: Input text to build the part with.
+            result: Passed result of the part building. Defaults to ''.
+            size: Size of the build part. Defaults to 0.
+            stops: End stop of the build part. Defaults to None.
+            find: Symbol to look for during part building. Defaults to None.
+
+        Returns:
+            The build part.
+        """
+
+        # Define a list of chars, where if
+        # the current char is one of these chars,
+        # then stop with building the part,
+        # (if no 'find' param is given)
+        if stops is None:
+            stops = [" ", "\t", "\n", "(", ")", ","]
+
+        # Return the result if no char is
+        # left for the part building process
+        if len(text) == 0:
+            return None, result, size
+
+        # Return when the 'find' char is found
+        if find is not None and text[0] == find:
+            if len(text) > 1:
+                return text[1:], result + text[0], size + 1
+            return None, result + text[0], size + 1
+
+        # Stop building the part, if current
+        # char is within the 'stops' list
+        elif find is None and text[0] in stops:
+            return text, result, size
+
+        # Return the result + the last char,
+        # when there is only one last char left
+        elif len(text) == 1:
+            return None, result + text[0], size + 1
+
+        # Continue building the part with
+        # the remaining text, and add
+        # the current char to the result
+        return self.build_part(
+            text=text[1:],
+            result=result + text[0],
+            size=size + 1,
+            stops=stops,
+            find=find,
+        )
@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Optional, Union, List
-from interpreter.tokens import Token
+import pickle
+from itertools import chain, repeat
+from typing import Any, Dict, Optional, Tuple, Union, List
+from interpreter.position import Position, PositionTable, POSITIONS
+from interpreter.symbols import SYMBOLS
 from interpreter.tokens import (
     Token,
+    TokenKind,
     IntegerToken,
     FloatToken,
     StringToken,
@@ -32,42 +36,99 @@ from interpreter.tokens import (
     PrintToken,
 )
 
+# Slots caching the state of a Node while it's executed,
+# which aren't part of it's structure (and aren't pickled)
+CACHE_SLOTS = frozenset({"quick", "cache", "bound"})
+
 
 class BaseNode:
     """Default base node.
 
+    Nodes don't keep a reference to their initial token. They only
+    store the values they need (within '__slots__'), while the Position
+    of the token (or only it's Span) is kept within the POSITIONS side
+    table. The Position is only looked up when an Error (or trace) is built.
+
+    Nodes aren't changed once they're parsed (apart from the
+    caches of the operations and calls, see 'CACHE_SLOTS'),
+    so copying a Node returns the Node itself. Pickling
+    a Node encodes it's whole tree at once (see 'encode_nodes').
+
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
+        pos: Position of the initial token.
     """
 
+    __slots__ = ("kind",)
+
+    # Keep a reference to the table, so Nodes can
+    # still remove their Position on shutdown
+    position_table = POSITIONS
+
     def __init__(self, token: Optional[Token] = None):
         """Initialise the node.
 
         Args:
             token: Initial token reference. Defaults to None.
         """
-        self.token = token
+        self.kind = token.kind if token is not None else TokenKind.NONE
+
+        if token is not None:
+            self.position_table.set(self, token.location)
+
+    def __del__(self):
+        self.position_table.discard(self)
+
+    def __copy__(self) -> BaseNode:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> BaseNode:
+        return self
+
+    def __reduce__(self) -> Tuple[Any, Tuple[bytes]]:
+        # Pickle the whole (sub)tree as a single flat table,
+        # instead of every Node as a separate object
+        return decode_nodes, (encode_nodes(self),)
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.token.value!r})"
+        return f"{self.__class__.__name__}({self.kind!r})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(token={self.token!r})"
+        return f"{self.__class__.__name__}(kind={self.kind!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token
+        return self.kind == rhs.kind
+
+    @property
+    def pos(self) -> Optional[Position]:
+        return self.position_table.get(self)
+
+    @property
+    def fields(self) -> List[Any]:
+        """Values of all slots of the Node, used to walk over the ATS."""
+        slots = chain.from_iterable(
+            map(lambda x: x.__dict__.get("__slots__", ()), type(self).__mro__)
+        )
+        return list(
+            map(
+                lambda x: getattr(self, x),
+                filter(lambda x: x not in CACHE_SLOTS, slots),
+            )
+        )
 
 
 class NumberNode(BaseNode):
     """Node representing a Number value.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, token: Union[IntegerToken, FloatToken]):
         """Initialise the node.
 
@@ -75,25 +136,30 @@ class NumberNode(BaseNode):
             token: Initial token reference.
         """
         super().__init__(token)
+        self.value = token.value
 
-    @property
-    def value(self):
-        return self.token.value
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
 
 
 class StringNode(BaseNode):
     """Node representing a String value.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, token: StringToken):
         """Initialise the node.
 
@@ -101,25 +167,31 @@ class StringNode(BaseNode):
             token: Initial token reference.
         """
         super().__init__(token)
+        self.value = token.value
 
-    @property
-    def value(self):
-        return self.token.value
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
 
 
 class IDNode(BaseNode):
     """Node representing a Identifier of a variable.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
+        symbol: Interned symbol of the value.
     """
 
+    __slots__ = ("value", "symbol")
+
     def __init__(self, token: IDToken):
         """Initialise the node.
 
@@ -127,31 +199,31 @@ class IDNode(BaseNode):
             token: Initial token reference.
         """
         super().__init__(token)
+        self.value = token.value
+        self.symbol = token.symbol
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.token.value})"
+        return f"{self.__class__.__name__}({self.value})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(token={self.token!r})"
-
-    @property
-    def value(self):
-        return self.token.value
+        return f"{self.__class__.__name__}(value={self.value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
 
 
 class BooleanNode(BaseNode):
     """Node representing a Boolean value.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, token: BooleanToken):
         """Initialise the node.
 
@@ -159,15 +231,18 @@ class BooleanNode(BaseNode):
             token: Initial token reference.
         """
         super().__init__(token)
+        self.value = token.value
 
-    @property
-    def value(self):
-        return self.token.value
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
 
 
 class ListNode(BaseNode):
@@ -177,35 +252,50 @@ class ListNode(BaseNode):
     a list of nodes.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         items: Nodes/Items of the list.
+        positions: Optional Positions of the statements within the list.
+        occurrences: Optional PositionTables of the statements within the
+            list, containing the Position of each (shared) Node within
+            the statement (see 'NodeTable').
     """
 
+    __slots__ = ("items", "positions", "occurrences")
+
     def __init__(
-        self, items: Optional[List[BaseNode]] = None, token: Optional[BaseNode] = None
+        self,
+        items: Optional[List[BaseNode]] = None,
+        token: Optional[BaseNode] = None,
+        positions: Optional[List[Position]] = None,
+        occurrences: Optional[List[PositionTable]] = None,
     ):
         """Initialise the node.
 
         Args:
             items: Nodes/Items of the list.
             token: Initial token reference.
+            positions: Optional Positions of the statements. Defaults to None.
+            occurrences: Optional PositionTables of the statements. Defaults to None.
         """
         super().__init__(token)
         self.items = items
+        self.positions = positions
+        self.occurrences = occurrences
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.items!r})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(items={self.items!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(items={self.items!r})"
 
 
 class ParamNode(BaseNode):
     """Node representing a Function parameter.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
+        symbol: Interned symbol of the value.
 
     Example:
         ```
@@ -213,6 +303,8 @@ class ParamNode(BaseNode):
         ```
     """
 
+    __slots__ = ("value", "symbol")
+
     def __init__(self, token: IDToken):
         """Initialise the node.
 
@@ -220,15 +312,19 @@ class ParamNode(BaseNode):
             token: Initial token reference.
         """
         super().__init__(token)
+        self.value = token.value
+        self.symbol = token.symbol
 
-    @property
-    def value(self):
-        return self.token.value
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
 
 
 class CompareOpNode(BaseNode):
@@ -237,7 +333,10 @@ class CompareOpNode(BaseNode):
     Attributes:
         lhs: The Left-hand side.
         rhs: The Right-hand side.
-        token: Initial token reference.
+        op: The operator.
+        kind: Kind of the initial token.
+        quick: Specialization of the comparison, for the
+            types of the operands it has seen (see 'Program').
 
     Example:
         ```
@@ -245,6 +344,8 @@ class CompareOpNode(BaseNode):
         ```
     """
 
+    __slots__ = ("lhs", "rhs", "op", "quick")
+
     def __init__(
         self,
         lhs: Optional[BaseNode],
@@ -268,20 +369,24 @@ class CompareOpNode(BaseNode):
         super().__init__(token)
         self.lhs = lhs
         self.rhs = rhs
+        self.op = token.value
+        self.quick = None
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.lhs.value} {self.token.value} {self.rhs.value})"
+        return f"{self.__class__.__name__}({self.lhs.value} {self.op} {self.rhs.value})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(lhs={self.lhs!r}, rhs={self.rhs!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(lhs={self.lhs!r}, rhs={self.rhs!r}, op={self.op!r})"
 
 
 class AssignOpNode(BaseNode):
     """Node representing a Assignment Operation.
 
     Attributes:
-        token: Initial token reference.
+        id: Identifier of the node.
         value: Value of the node.
+        op: The operator.
+        kind: Kind of the initial token.
 
     Example:
         ```
@@ -289,6 +394,8 @@ class AssignOpNode(BaseNode):
         ```
     """
 
+    __slots__ = ("id", "value", "op")
+
     def __init__(
         self,
         id: IDNode,
@@ -305,19 +412,18 @@ class AssignOpNode(BaseNode):
         super().__init__(token)
         self.id = id
         self.value = value
+        self.op = token.value
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.token.value} {self.id.value} {self.value.value})"
+        return f"{self.__class__.__name__}({self.op} {self.id.value} {self.value.value})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id!r}, value={self.value!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(id={self.id!r}, value={self.value!r}, op={self.op!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return (
-            self.token == rhs.token and self.value == rhs.value and self.value == rhs.id
-        )
+        return self.kind == rhs.kind and self.value == rhs.value and self.id == rhs.id
 
 
 class BinaryOpNode(BaseNode):
@@ -326,7 +432,10 @@ class BinaryOpNode(BaseNode):
     Attributes:
         lhs: The Left-hand side.
         rhs: The Right-hand side.
-        token: Initial token reference.
+        op: The operator.
+        kind: Kind of the initial token.
+        quick: Specialization of the operation, for the
+            types of the operands it has seen (see 'Program').
 
     Example:
         ```
@@ -334,6 +443,8 @@ class BinaryOpNode(BaseNode):
         ```
     """
 
+    __slots__ = ("lhs", "rhs", "op", "quick")
+
     def __init__(
         self,
         lhs: Optional[BaseNode],
@@ -350,24 +461,28 @@ class BinaryOpNode(BaseNode):
         super().__init__(token)
         self.lhs = lhs
         self.rhs = rhs
+        self.op = token.value
+        self.quick = None
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.lhs.value} {self.token.value} {self.rhs.value})"
+        return f"{self.__class__.__name__}({self.lhs.value} {self.op} {self.rhs.value})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(lhs={self.lhs!r}, rhs={self.rhs!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(lhs={self.lhs!r}, rhs={self.rhs!r}, op={self.op!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.lhs == self.rhs
+        return (
+            self.kind == rhs.kind and self.lhs == rhs.lhs and self.rhs == rhs.rhs
+        )
 
 
 class VarNode(BaseNode):
     """Node representing a Variable Assignment.
 
     Attributes:
-        token: Initial token reference.
+        kind: Kind of the initial token.
         value: Value of the node.
 
     Example:
@@ -376,6 +491,8 @@ class VarNode(BaseNode):
         ```
     """
 
+    __slots__ = ("id", "value")
+
     def __init__(self, id: IDNode, value: Optional[BaseNode], token: VarToken):
         """Initialise the node.
 
@@ -389,21 +506,25 @@ class VarNode(BaseNode):
         self.value = value
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.token.value!r} {self.id.value}" + (
+        return f"{self.__class__.__name__}('=:' {self.id.value}" + (
             f" {self.value.value!r})" if self.value is not None else ")"
         )
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id!r}, value={self.value!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(id={self.id!r}, value={self.value!r})"
 
     @property
     def name(self) -> str:
         return self.id.value
 
+    @property
+    def symbol(self) -> int:
+        return self.id.symbol
+
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value and self.id == rhs.id
+        return self.kind == rhs.kind and self.value == rhs.value and self.id == rhs.id
 
 
 class ReturnNode(BaseNode):
@@ -411,7 +532,7 @@ class ReturnNode(BaseNode):
 
     Attributes:
         return_value: The value that will be returned.
-        token: Initial token reference.
+        kind: Kind of the initial token.
 
     Example:
         ```
@@ -419,6 +540,8 @@ class ReturnNode(BaseNode):
         ```
     """
 
+    __slots__ = ("return_value",)
+
     def __init__(self, return_value: Optional[BaseNode], token: ReturnToken):
         """Initialise the node.
 
@@ -437,12 +560,12 @@ class ReturnNode(BaseNode):
             return f"{self.__class__.__name__}({self.return_value.value})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(return_value={self.return_value!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(return_value={self.return_value!r})"
 
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.return_value == rhs.return_value
+        return self.kind == rhs.kind and self.return_value == rhs.return_value
 
 
 class FuncNode(BaseNode):
@@ -452,9 +575,11 @@ class FuncNode(BaseNode):
         id: Identifier of the function.
         args: Arguments of the function.
         body: Code body of the function.
-        start: Start token/position of the Code body.
-        end: End token/position of the Code body.
-        token: Initial token reference.
+        start: Start position of the Code body.
+        end: End position of the Code body.
+        kind: Kind of the initial token.
+        bound: Symbols which can be bound within a call of the function,
+            once it passed it's static checks (see 'Program.check_func_node').
 
     Example:
         ```
@@ -465,6 +590,8 @@ class FuncNode(BaseNode):
         ```
     """
 
+    __slots__ = ("id", "args", "body", "start", "end", "bound")
+
     def __init__(
         self,
         id: IDNode,
@@ -488,23 +615,28 @@ class FuncNode(BaseNode):
         self.id = id
         self.args = args
         self.body = body
-        self.start = start
-        self.end = end
+        self.start = start.pos
+        self.end = end.pos
+        self.bound = None
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name!r}({self.args}))"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id!r}, args={self.args!r}, body={self.body!r}, start={self.start!r}, end={self.end!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(id={self.id!r}, args={self.args!r}, body={self.body!r}, start={self.start!r}, end={self.end!r})"
 
     @property
     def name(self) -> str:
         return self.id.value
 
+    @property
+    def symbol(self) -> int:
+        return self.id.symbol
+
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.id == rhs.id
+        return self.kind == rhs.kind and self.id == rhs.id
 
 
 class CallNode(BaseNode):
@@ -515,7 +647,9 @@ class CallNode(BaseNode):
         args: Optional arguments of the function to call.
         result: Optional place to store the result of the function to call.
         inline: True/False if the function to call is inline.
-        token: Initial token reference.
+        kind: Kind of the initial token.
+        cache: Version of the bindings and the Function
+            the call resolved to (see 'CallCache').
 
     Example:
         ```
@@ -523,6 +657,8 @@ class CallNode(BaseNode):
         ```
     """
 
+    __slots__ = ("id", "args", "result", "inline", "cache")
+
     def __init__(
         self,
         id: IDNode,
@@ -545,21 +681,26 @@ class CallNode(BaseNode):
         self.args = args
         self.result = result
         self.inline = inline if inline is not None else False
+        self.cache = None
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name!r}({self.args}))"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id!r}, args={self.args!r}, result={self.result!r}, inline={self.inline!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(id={self.id!r}, args={self.args!r}, result={self.result!r}, inline={self.inline!r})"
 
     @property
     def name(self) -> str:
         return self.id.value
 
+    @property
+    def symbol(self) -> int:
+        return self.id.symbol
+
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.id == rhs.id
+        return self.kind == rhs.kind and self.id == rhs.id
 
 
 class ConditionsNode(BaseNode):
@@ -569,7 +710,7 @@ class ConditionsNode(BaseNode):
         conditions: Conditions to make any comperations with.
         result: Operation to perform if the statement is True.
         other: Optional else operation to perform if the statement is False.
-        token: Initial token reference.
+        kind: Kind of the initial token.
 
     Example:
         ```
@@ -577,6 +718,8 @@ class ConditionsNode(BaseNode):
         ```
     """
 
+    __slots__ = ("conditions", "result", "other")
+
     def __init__(
         self,
         conditions: Union[CompareOpNode, ListNode],
@@ -604,7 +747,7 @@ class ConditionsNode(BaseNode):
         return value + "+)"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(conditions={self.conditions!r}, result={self.result!r}, other={self.other!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(conditions={self.conditions!r}, result={self.result!r}, other={self.other!r})"
 
 
 class PrintNode(BaseNode):
@@ -612,7 +755,7 @@ class PrintNode(BaseNode):
 
     Attributes:
         to_print: Node to print.
-        token: Initial token reference.
+        kind: Kind of the initial token.
 
     Example:
         ```
@@ -620,6 +763,8 @@ class PrintNode(BaseNode):
         ```
     """
 
+    __slots__ = ("to_print",)
+
     def __init__(
         self, to_print: Union[NumberNode, StringNode, IDNode], token: PrintToken
     ):
@@ -636,7 +781,7 @@ class PrintNode(BaseNode):
         return f"{self.__class__.__name__}({self.value!r})"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(to_print={self.to_print!r}, token={self.token!r})"
+        return f"{self.__class__.__name__}(to_print={self.to_print!r})"
 
     @property
     def value(self):
@@ -645,4 +790,235 @@ class PrintNode(BaseNode):
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, type(self)):
             return False
-        return self.token == rhs.token and self.value == rhs.value
+        return self.kind == rhs.kind and self.value == rhs.value
+
+
+def structure(obj: Any) -> Any:
+    """Return the (hashable) structure of a field of a Node.
+
+    The children of a Node are already shared, so
+    they're compared by their identity instead.
+
+    Args:
+        obj: Field to return the structure of.
+
+    Returns:
+        Structure of the field.
+    """
+    if isinstance(obj, BaseNode):
+        return id(obj)
+
+    elif isinstance(obj, list):
+        return tuple(map(structure, obj))
+
+    return obj
+
+
+class NodeTable:
+    """Table of shared (hash-consed) Nodes.
+
+    Structurally identical Nodes are interned into a single
+    shared Node, so a subtree that's repeated throughout the
+    source is only stored (and processed) once. A shared Node is
+    position-independent, so it doesn't keep a Position within the
+    POSITIONS side table. Instead, the ListNode containing a statement
+    keeps a PositionTable of the statement (see 'Parser.share'), with
+    the Position of each shared Node within it. So the Errors of a
+    shared Node are located by the statement it's executed in.
+
+    Attributes:
+        nodes: Shared Node of each structure.
+        hits: Amount of Nodes replaced by a shared Node.
+    """
+
+    def __init__(self):
+        """Initialise an empty NodeTable."""
+        self.nodes: Dict[Tuple, BaseNode] = dict()
+        self.hits = 0
+
+    def __str__(self) -> str:
+        return f"NodeTable({len(self.nodes)}, {self.hits})"
+
+    def __repr__(self) -> str:
+        return f"NodeTable(nodes={len(self.nodes)!r}, hits={self.hits!r})"
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def intern(self, node: BaseNode) -> BaseNode:
+        """Intern the given Node.
+
+        Args:
+            node: Node to intern, of which all children are interned already.
+
+        Returns:
+            The shared Node, with the same structure as the given Node.
+        """
+        key = (type(node), node.kind) + tuple(map(structure, node.fields))
+        shared = self.nodes.get(key, None)
+
+        if shared is not None:
+            self.hits += 1
+            return shared
+
+        node.position_table.discard(node)
+        self.nodes[key] = node
+        return node
+
+
+# Encoding of the slots of each Node class, used when pickling the ATS:
+#   "v" a plain value, "s" a symbol (stored by it's name, and interned again),
+#   "n" a Node (or None), "l" a list of Nodes (or None),
+#   "p" a Position (or None), "P" a list of Positions (or None),
+#   "O" a list of PositionTables (or None), by the indices of their Nodes.
+NODE_FIELDS: Dict[type, str] = {
+    BaseNode: "",
+    NumberNode: "v",
+    StringNode: "v",
+    IDNode: "vs",
+    BooleanNode: "v",
+    ListNode: "lPO",
+    ParamNode: "vs",
+    CompareOpNode: "nnv",
+    AssignOpNode: "nnv",
+    BinaryOpNode: "nnv",
+    VarNode: "nn",
+    ReturnNode: "n",
+    FuncNode: "nnnpp",
+    CallNode: "nnnv",
+    ConditionsNode: "nnn",
+    PrintNode: "n",
+}
+
+NODE_CLASSES: List[type] = list(NODE_FIELDS.keys())
+
+NODE_INDICES: Dict[type, int] = dict(
+    map(lambda x: (x[1], x[0]), enumerate(NODE_CLASSES))
+)
+
+
+def encode_position(pos: Optional[Position]) -> Optional[Tuple[int, int, int]]:
+    """Encode the given (optional) Position as a tuple."""
+    return None if pos is None else (pos.line, pos.start, pos.end)
+
+
+def decode_position(pos: Optional[Tuple[int, int, int]]) -> Optional[Position]:
+    """Decode a Position encoded by 'encode_position'."""
+    return None if pos is None else Position(*pos)
+
+
+def encode_nodes(node: BaseNode) -> bytes:
+    """Encode the (sub)tree of the given Node into a compact binary form.
+
+    The tree is flattened into a table with a single entry per
+    Node, containing the index of it's class, it's kind, Position
+    and the encoded values of it's slots (see 'NODE_FIELDS'). A child
+    Node is stored as the index of it's entry, so a shared Node is
+    only encoded once and stays shared when it's decoded. Children
+    are encoded before their parent, so the root is the last entry.
+
+    Args:
+        node: Root Node of the tree to encode.
+
+    Returns:
+        The encoded tree, to decode with 'decode_nodes'.
+    """
+    table: List[Tuple] = list()
+    memo: Dict[int, int] = dict()
+
+    def encode(obj: BaseNode) -> int:
+        index = memo.get(id(obj), None)
+        if index is not None:
+            return index
+
+        cls = type(obj)
+        fields = tuple(
+            map(
+                lambda x: encoders[x[0]](getattr(obj, x[1])),
+                zip(NODE_FIELDS[cls], cls.__slots__),
+            )
+        )
+        memo[id(obj)] = len(table)
+        table.append((NODE_INDICES[cls], obj.kind, encode_position(obj.pos)) + fields)
+        return memo[id(obj)]
+
+    encoders = {
+        "v": lambda x: x,
+        "s": lambda x: None if x is None else SYMBOLS.name(x),
+        "n": lambda x: None if x is None else encode(x),
+        "l": lambda x: None if x is None else list(map(encode, x)),
+        "p": encode_position,
+        "P": lambda x: None if x is None else list(map(encode_position, x)),
+        "O": lambda x: None if x is None else list(map(encode_occurrences, x)),
+    }
+
+    def encode_occurrences(table: PositionTable) -> List[Tuple]:
+        # The Nodes within the statement are encoded already
+        positions = zip(list(table.positions.keys()), table.values())
+        return list(
+            map(
+                lambda x: (memo[x[0]], encode_position(x[1])),
+                filter(lambda x: x[0] in memo, positions),
+            )
+        )
+
+    encode(node)
+    return pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_nodes(data: bytes) -> BaseNode:
+    """Decode a tree encoded by 'encode_nodes'.
+
+    Args:
+        data: The encoded tree.
+
+    Returns:
+        Root Node of the decoded tree, of which the Positions
+        are registered and the symbols are interned again.
+    """
+    nodes: List[BaseNode] = list()
+
+    decoders = {
+        "v": lambda x: x,
+        "s": lambda x: None if x is None else SYMBOLS.intern(x),
+        "n": lambda x: None if x is None else nodes[x],
+        "l": lambda x: None if x is None else list(map(nodes.__getitem__, x)),
+        "p": decode_position,
+        "P": lambda x: None if x is None else list(map(decode_position, x)),
+        "O": lambda x: None if x is None else list(map(decode_occurrences, x)),
+    }
+
+    def decode_occurrences(entries: List[Tuple]) -> PositionTable:
+        table = PositionTable()
+        _ = list(map(lambda x: table.add(nodes[x[0]], decode_position(x[1])), entries))
+        return table
+
+    layouts = list(
+        map(lambda x: tuple(map(decoders.__getitem__, NODE_FIELDS[x])), NODE_CLASSES)
+    )
+
+    def decode(entry: Tuple):
+        cls = NODE_CLASSES[entry[0]]
+        node = cls.__new__(cls)
+        node.kind = entry[1]
+        _ = list(
+            map(
+                setattr,
+                repeat(node),
+                cls.__slots__,
+                map(lambda f, x: f(x), layouts[entry[0]], entry[3:]),
+            )
+        )
+
+        # The caches of the Node (the slots after the
+        # encoded ones) start out empty again
+        _ = list(
+            map(setattr, repeat(node), cls.__slots__[len(entry) - 3 :], repeat(None))
+        )
+
+        if entry[2] is not None:
+            node.position_table.set(node, Position(*entry[2]))
+        nodes.append(node)
+
+    _ = list(map(decode, pickle.loads(data)))
+    return nodes[-1]
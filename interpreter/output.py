@@ -0,0 +1,159 @@
+import sys
+from abc import ABC, abstractmethod
+from typing import List, Optional, TextIO
+
+# Default amount of characters to buffer, before writing them
+BUFFER_SIZE = 8192
+
+
+class Output(ABC):
+    """Default base Output of the Program.
+
+    Buffers the written text, and only emits the
+    buffered text to the actual destination once the
+    buffer is full or when it's explicitly flushed.
+
+    Attributes:
+        buffer_size: Amount of characters to buffer before emitting.
+        buffer: Text that is written, but not yet emitted.
+        size: Amount of characters within the buffer.
+    """
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE):
+        """Initialise the Output.
+
+        Args:
+            buffer_size: Amount of characters to buffer before
+                emitting, where 0 disables buffering. Defaults to 'BUFFER_SIZE'.
+        """
+        self.buffer_size = buffer_size
+        self.buffer = list()
+        self.size = 0
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.size}/{self.buffer_size})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(buffer_size={self.buffer_size!r})"
+
+    def write(self, text: str) -> None:
+        """Write text to the Output.
+
+        Args:
+            text: Text to write.
+        """
+        self.buffer.append(text)
+        self.size += len(text)
+
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit all buffered text."""
+        if len(self.buffer) == 0:
+            return
+
+        text = "".join(self.buffer)
+        self.buffer.clear()
+        self.size = 0
+        self.emit(text)
+
+    @abstractmethod
+    def emit(self, text: str) -> None:
+        """Emit text to the actual destination.
+
+        Args:
+            text: Text to emit.
+        """
+
+
+class StreamOutput(Output):
+    """Output writing to a text stream.
+
+    Attributes:
+        stream: Optional stream to write to, or 'sys.stdout' when not given.
+        buffer_size: Amount of characters to buffer before emitting.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = BUFFER_SIZE):
+        """Initialise the Output.
+
+        Args:
+            stream: Stream to write to. Defaults to the current 'sys.stdout'.
+            buffer_size: Amount of characters to buffer before emitting. Defaults to 'BUFFER_SIZE'.
+        """
+        super().__init__(buffer_size)
+        self.stream = stream
+
+    def emit(self, text: str) -> None:
+        """Emit text to the stream.
+
+        Args:
+            text: Text to emit.
+        """
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write(text)
+        stream.flush()
+
+
+class FileOutput(StreamOutput):
+    """Output writing to a file.
+
+    Attributes:
+        file_path: Path to the file to write to.
+        buffer_size: Amount of characters to buffer before emitting.
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = BUFFER_SIZE):
+        """Initialise the Output, which (over)writes the given file.
+
+        Args:
+            file_path: Path to the file to write to.
+            buffer_size: Amount of characters to buffer before emitting. Defaults to 'BUFFER_SIZE'.
+        """
+        super().__init__(open(file_path, "w"), buffer_size)
+        self.file_path = file_path
+
+    def close(self) -> None:
+        """Flush the buffered text and close the file."""
+        self.flush()
+        self.stream.close()
+
+
+class ListOutput(Output):
+    """Output keeping all text in memory.
+
+    Attributes:
+        chunks: All emitted text.
+        buffer_size: Amount of characters to buffer before emitting.
+    """
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE):
+        """Initialise the Output.
+
+        Args:
+            buffer_size: Amount of characters to buffer before emitting. Defaults to 'BUFFER_SIZE'.
+        """
+        super().__init__(buffer_size)
+        self.chunks = list()
+
+    def emit(self, text: str) -> None:
+        """Keep the emitted text.
+
+        Args:
+            text: Text to emit.
+        """
+        self.chunks.append(text)
+
+    def getvalue(self) -> str:
+        """Return all written text.
+
+        Returns:
+            All written text, including the buffered text.
+        """
+        self.flush()
+        return "".join(self.chunks)
+
+    @property
+    def lines(self) -> List[str]:
+        return self.getvalue().splitlines()
@@ -1,41 +1,14 @@
 from __future__ import annotations
-from typing import Optional, List, Any, Union
+from typing import Callable, Optional, List, Any, Union
 from copy import deepcopy
+from functools import reduce
 from interpreter.tokens import (
     Token,
-    IntegerToken,
-    FloatToken,
-    StringToken,
-    IDToken,
-    BooleanToken,
-    CommaToken,
-    ColonToken,
-    ParOpenToken,
-    ParCloseToken,
-    BracketCloseToken,
-    NewLineToken,
-    EOFToken,
-    AddToken,
-    SubToken,
-    MulToken,
-    DivToken,
-    EqualToken,
-    NotEqualToken,
-    GreaterToken,
-    GreaterOrEqualToken,
-    LessToken,
-    LessOrEqualToken,
-    AssignAddToken,
-    AssignSubToken,
-    AssignMulToken,
-    AssignDivToken,
-    VarToken,
-    FuncToken,
-    CodeBlockToken,
-    CallToken,
-    IfToken,
-    ReturnToken,
-    PrintToken,
+    TokenKind,
+    ASSIGN_KINDS,
+    VALUE_KINDS,
+    MATH_KINDS,
+    COMPARE_KINDS,
 )
 from interpreter.nodes import (
     BaseNode,
@@ -54,14 +27,94 @@ from interpreter.nodes import (
     CallNode,
     ConditionsNode,
     PrintNode,
+    NodeTable,
 )
 from interpreter.errors import (
     Error,
+    ErrorSignal,
     InvalidSyntaxError,
     NotImplementedError,
 )
+from interpreter.position import PositionTable
+from interpreter.grammar import STATEMENTS, run_steps
 from interpreter.utils import debug_log
 
+# Precedence of the binary operators, by the kind of their Token
+PRECEDENCE = {
+    TokenKind.ADD: 1,
+    TokenKind.SUB: 1,
+    TokenKind.MUL: 2,
+    TokenKind.DIV: 2,
+}
+
+# Binary operators, where '(a op b) op c' equals 'a op (b op c)'
+# (as long as the operands are integers, see 'is_integer')
+ASSOCIATIVE_KINDS = frozenset({TokenKind.ADD, TokenKind.MUL})
+
+# Binary operators, which result in an integer for integer operands
+INTEGER_KINDS = frozenset({TokenKind.ADD, TokenKind.SUB, TokenKind.MUL})
+
+# Nodes of the atomic values, by the kind of their Token
+ATOM_NODES = {
+    TokenKind.INTEGER: NumberNode,
+    TokenKind.FLOAT: NumberNode,
+    TokenKind.STRING: StringNode,
+    TokenKind.ID: IDNode,
+    TokenKind.BOOLEAN: BooleanNode,
+}
+
+
+def is_integer(node: BaseNode) -> bool:
+    """Check if a Node is known to result in an integer.
+
+    Which is the case for an integer literal, and for an operation
+    (except dividing) on two of these. Any other Node, like an 'IDNode',
+    might result in a float or string when executed.
+
+    Args:
+        node: Node to check.
+
+    Returns:
+        True if the Node results in an integer, else False.
+    """
+    if isinstance(node, NumberNode):
+        return node.kind == TokenKind.INTEGER
+
+    if isinstance(node, BinaryOpNode):
+        return (
+            node.kind in INTEGER_KINDS and is_integer(node.lhs) and is_integer(node.rhs)
+        )
+
+    return False
+
+
+def balance(
+    operands: List[BaseNode],
+    operators: List[Token],
+    share: Callable[[BaseNode], BaseNode],
+) -> BaseNode:
+    """Combine a run of the same associative operator into a balanced tree.
+
+    Args:
+        operands: Operands of the run.
+        operators: Operator Tokens, between each of the operands.
+        share: Function sharing the built Nodes (see 'Parser.share').
+
+    Returns:
+        Root Node of the balanced tree.
+    """
+    if len(operands) == 1:
+        return operands[0]
+
+    middle = len(operands) // 2
+    return share(
+        BinaryOpNode(
+            balance(operands[:middle], operators[: middle - 1], share),
+            balance(operands[middle:], operators[middle:], share),
+            operators[middle - 1],
+        )
+    )
+
 
 class ParseState:
     """Parser State.
@@ -161,6 +214,8 @@ class Parser:
         index: Current index of the Parser.
         previous_index: Previous index of the Parser.
         debug_mode: If 'debug mode' is enabled. Defaults to False.
+        shared: Table of the shared Nodes, within the parsed Tokens.
+        occurrences: PositionTables of the (nested) statements being parsed.
     """
 
     def __init__(self, tokens: List[Token], debug_mode: bool = False):
@@ -176,6 +231,8 @@ class Parser:
         self.current = None
         self.previous = None
         self.debug_mode = debug_mode
+        self.shared = NodeTable()
+        self.occurrences = list()
 
     def __str__(self) -> str:
         return f"Parser({self.debug_mode})"
@@ -202,13 +259,38 @@ class Parser:
         self.set_current()
         return self.current
 
+    def share(self, node: BaseNode) -> BaseNode:
+        """Share the given Node with all structurally identical Nodes.
+
+        The shared Node doesn't keep a Position of it's own, instead
+        the Position of the given Node is kept within the PositionTable
+        of the statement being parsed (when the same Node occurs more
+        than once within a statement, the first occurrence is kept).
+
+        Args:
+            node: Node to share.
+
+        Returns:
+            The shared Node.
+        """
+        pos = node.position_table.take(node)
+        shared = self.shared.intern(node)
+
+        if len(self.occurrences) > 0:
+            self.occurrences[-1].add(shared, pos)
+        return shared
+
     @debug_log("Parser.parse")
     def parse(self) -> ParseState:
         """Parse the Current set of Tokens.
 
+        Within the Parser the parsed Nodes are returned as they are,
+        while any Error is raised as an 'ErrorSignal'. Parsing turns
+        either of them back into a ParseState.
+
         Returns:
-            ListNode containing the parsed Tokens,
-            which are parsed into Nodes.
+            ParseState containing a ListNode with the Tokens,
+            which are parsed into Nodes, or the raised Error.
         """
         p_state = ParseState()
 
@@ -220,239 +302,157 @@ class Parser:
         if self.current is None:
             return p_state.fail(Error("Parse Error", "No current token was specified"))
 
-        nodes = p_state.add(self.build_nodes())
-        if p_state.error:
-            return p_state
-        return p_state.success(ListNode(nodes))
+        try:
+            return p_state.success(self.build_nodes())
+        except ErrorSignal as signal:
+            return p_state.fail(signal.error)
 
     @debug_log("Parser.build_nodes")
-    def build_nodes(self, nodes: Optional[List] = None):
-        """Build the Nodes
-
-        Args:
-            nodes: Nodes to build. Defaults to None.
+    def build_nodes(self) -> ListNode:
+        """Build the Nodes of all Statements, until the 'End Of File'.
 
         Returns:
-            A list containing the build Nodes.
+            A ListNode containing the build Nodes.
         """
-        p_state = ParseState()
-        nodes = list() if nodes is None else nodes
-
-        if isinstance(self.current, EOFToken):
-            return p_state.success(nodes)
-
-        elif self.index >= len(self.tokens):
-            return p_state.fail(Error("NoEOF", "No 'End Of File'"))
-
-        if isinstance(self.current, NewLineToken):
-            self.next()
-            return self.build_nodes(nodes)
-
-        statement = p_state.add(self.statement())
-        if p_state.failed():
-            return p_state
-        return self.build_nodes(nodes + [statement])
+        return self.statements(TokenKind.EOF)
 
     @debug_log("Parser.statement")
-    def statement(self):
+    def statement(self) -> BaseNode:
         """Parse a Statement.
 
+        The statement is parsed by the Steps of it's grammar
+        Rule, which is looked up by the kind of the current Token.
+
         Returns:
             Parsed Node.
-        """
-        p_state = ParseState()
 
-        if isinstance(
-            self.current,
-            (VarToken, AssignAddToken, AssignSubToken, AssignMulToken, AssignDivToken),
-        ):
-            return p_state.run(self.assign_oper())
-
-        elif isinstance(self.current, FuncToken):
-            return p_state.run(self.func_expr())
+        Raises:
+            ErrorSignal: With a NotImplementedError when no Rule
+                starts with the current Token, or the Error of
+                the Step that failed.
+        """
+        rule = STATEMENTS.get(self.current.kind, None)
 
-        elif isinstance(self.current, ReturnToken):
-            return p_state.run(self.func_return())
+        if rule is None:
+            raise ErrorSignal(
+                NotImplementedError(
+                    f"'{self.current}' Statement is not implemented", self.current.pos
+                )
+            )
 
-        elif isinstance(self.current, CallToken):
-            return p_state.run(self.func_call())
+        token, fields = self.current, dict()
+        run_steps(rule.steps, self, fields)
 
-        elif isinstance(self.current, PrintToken):
-            return p_state.run(self.print_expr())
+        node = rule.build(fields, token)
+        return self.share(node) if rule.shared else node
 
-        elif isinstance(self.current, IfToken):
-            return p_state.run(self.if_statement())
+    @debug_log("Parser.statements")
+    def statements(self, end: int) -> ListNode:
+        """Parse all Statements, until a Token of the given kind.
 
-        return p_state.fail(
-            NotImplementedError(f"'{self.current}' Statement is not implemented")
-        )
+        The Statements are parsed one after another, without
+        recursing for each Statement, and all empty lines
+        in between the Statements are skipped.
 
-    @debug_log("Parser.expr")
-    def expr(self):
-        """Parse an Expression.
+        Args:
+            end: Kind of the Token the Statements end at.
 
         Returns:
-            Parsed Node.
+            ListNode of the parsed Nodes (and their Positions).
+
+        Raises:
+            ErrorSignal: With the Error of the first Statement that failed.
         """
-        p_state = ParseState()
+        positions, occurrences = list(), list()
+
+        def parse_statement():
+            # Skip the empty lines before the next Statement
+            _ = list(
+                iter(
+                    lambda: self.next()
+                    if self.current.kind == TokenKind.NEW_LINE
+                    and self.index < len(self.tokens)
+                    else None,
+                    None,
+                )
+            )
 
-        if isinstance(self.current, ParOpenToken):
-            self.next()
+            if self.current.kind in (end, TokenKind.EOF):
+                return None
 
-            expr = p_state.add(self.expr())
-            if p_state.failed():
-                return p_state
+            if self.index >= len(self.tokens):
+                raise ErrorSignal(Error("NoEOF", "No 'End Of File'"))
 
-            if not isinstance(self.current, ParCloseToken):
-                return p_state.fail(InvalidSyntaxError("Expected ')'"))
+            positions.append(self.current.pos)
 
-            self.next()
-            return p_state.success(expr)
+            # Keep the Positions of the (shared) Nodes within the statement
+            self.occurrences.append(PositionTable())
+            try:
+                return self.statement()
+            finally:
+                occurrences.append(self.occurrences.pop())
 
-        node = p_state.add(self.atom())
-        if p_state.failed():
-            return p_state
-        return p_state.success(node)
+        nodes = list(iter(parse_statement, None))
+        return ListNode(nodes, positions=positions, occurrences=occurrences)
 
-    @debug_log("Parser.atom")
-    def atom(self):
-        """Parse an Atomic value.
+    @debug_log("Parser.expr")
+    def expr(self) -> BaseNode:
+        """Parse an Expression.
 
         Returns:
             Parsed Node.
         """
-        p_state = ParseState()
-        token = self.current
-
-        if isinstance(self.current, IntegerToken) or isinstance(
-            self.current, FloatToken
-        ):
-            self.next()
-            return p_state.run(self.bin_oper(NumberNode(token)))
+        return self.atom()
 
-        elif isinstance(self.current, StringToken):
-            self.next()
-            return p_state.run(self.bin_oper(StringNode(token)))
-
-        elif isinstance(self.current, IDToken):
-            self.next()
-            return p_state.run(self.bin_oper(IDNode(token)))
-
-        elif isinstance(self.current, BooleanToken):
-            self.next()
-            return p_state.run(self.bin_oper(BooleanNode(token)))
-
-        return p_state.fail(
-            NotImplementedError(f"'{self.current}' Atomic value is not implemented")
-        )
-
-    @debug_log("Parser.assign_oper")
-    def assign_oper(self):
-        """Parse an Assign Operator.
+    @debug_log("Parser.atom")
+    def atom(self) -> BaseNode:
+        """Parse an Atomic value, followed by any Binary Operations.
 
         Returns:
             Parsed Node.
         """
-        p_state = ParseState()
-        # pos_start = self.current.pos.start
-
-        # Check if the current token is a
-        # 'Variable' or 'Assign Operation'
-        # Otherwise return a 'fail' state
-        if isinstance(
-            self.current,
-            (VarToken, AssignAddToken, AssignSubToken, AssignMulToken, AssignDivToken),
-        ):
-            base_token = self.current
-            self.next()
-
-            if not isinstance(self.current, IDToken):
-                return p_state.fail(InvalidSyntaxError("No 'Identifier' was specified"))
-
-            id_node = IDNode(self.current)
-            self.next()
+        return self.bin_oper(self.primary())
 
-            # Check for a 'binary operation'
-            if isinstance(self.current, (AddToken, SubToken, MulToken, DivToken)):
-                expr = p_state.add(self.bin_oper(id_node))
-                if p_state.failed():
-                    return p_state
-
-            else:
-                expr = p_state.add(self.expr())
-                if p_state.failed():
-                    return p_state
-
-            self.next()
-
-            if isinstance(base_token, VarToken):
-                return p_state.success(VarNode(id_node, expr, base_token))
-
-            return p_state.success(AssignOpNode(id_node, expr, base_token))
-
-        return p_state.fail(InvalidSyntaxError("Expected '=:', '=+', '=-', '=*', '=/'"))
-
-    @debug_log("Parser.func_expr")
-    def func_expr(self):
-        """Parse a Function expression.
+    @debug_log("Parser.primary")
+    def primary(self) -> BaseNode:
+        """Parse a single Atomic value, or a nested Expression.
 
         Returns:
             Parsed Node.
-        """
-        p_state = ParseState()
-
-        if isinstance(self.current, FuncToken):
-            base_token = self.current
-            self.next()
-
-            if not isinstance(self.current, IDToken):
-                return p_state.fail(InvalidSyntaxError("No 'IDToken' was specified"))
-
-            id_node = IDNode(self.current)
-            self.next()
 
-            if not isinstance(self.current, ParOpenToken):
-                return p_state.fail(InvalidSyntaxError("Expected '('"))
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when a nested Expression
+                isn't closed, or a NotImplementedError for any other Token.
+        """
+        token = self.current
 
+        # Parse a nested expression between '(' and ')',
+        # which is used as a single value in an operation
+        if self.current.kind == TokenKind.PAR_OPEN:
             self.next()
 
-            arg_nodes = p_state.add(self.func_params())
-            if p_state.failed():
-                return p_state
+            expr = self.atom()
 
-            if not isinstance(self.current, ParCloseToken):
-                return p_state.fail(InvalidSyntaxError("Expected ')'"))
+            if self.current.kind != TokenKind.PAR_CLOSE:
+                raise ErrorSignal(InvalidSyntaxError("Expected ')'"))
 
             self.next()
+            return expr
 
-            if not isinstance(self.current, CodeBlockToken):
-                return p_state.fail(InvalidSyntaxError("Expected '={'"))
-
-            start_block = self.current
+        # Look up the Node of the atomic value,
+        # based on the kind of the current Token
+        atom_node = ATOM_NODES.get(self.current.kind, None)
 
+        if atom_node is not None:
             self.next()
+            return self.share(atom_node(token))
 
-            body_nodes = p_state.add(self.code_block())
-            if p_state.failed():
-                return p_state
-
-            if not isinstance(self.current, BracketCloseToken):
-                return p_state.fail(InvalidSyntaxError("Expected '}'"))
-
-            end_block = self.current
-
-            self.next()
-
-            return p_state.success(
-                FuncNode(
-                    id_node, arg_nodes, body_nodes, start_block, end_block, base_token
-                )
-            )
-
-        return p_state.fail(InvalidSyntaxError("Expected '=|'"))
+        raise ErrorSignal(
+            NotImplementedError(f"'{self.current}' Atomic value is not implemented")
+        )
 
     @debug_log("Parser.func_params")
-    def func_params(self, params: Optional[List] = None):
+    def func_params(self, params: Optional[List] = None) -> ListNode:
         """Parse the Function parameters.
 
         Args:
@@ -460,33 +460,36 @@ class Parser:
 
         Returns:
             Parsed Nodes.
+
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when
+                the parameters aren't separated by a ','.
         """
-        p_state = ParseState()
         params = list() if params is None else params
 
-        if isinstance(self.current, IDToken):
-            params += [ParamNode(self.current)]
+        if self.current.kind == TokenKind.ID:
+            params += [self.share(ParamNode(self.current))]
             self.next()
 
-            if isinstance(self.current, IDToken):
-                return p_state.fail(InvalidSyntaxError("Expected ','"))
+            if self.current.kind == TokenKind.ID:
+                raise ErrorSignal(InvalidSyntaxError("Expected ','"))
 
             return self.func_params(params)
 
-        elif isinstance(self.current, CommaToken):
+        elif self.current.kind == TokenKind.COMMA:
             self.next()
 
-            if not isinstance(self.current, IDToken):
-                return p_state.fail(
+            if self.current.kind != TokenKind.ID:
+                raise ErrorSignal(
                     InvalidSyntaxError("Expected 'parameter identifier' after ','")
                 )
 
             return self.func_params(params)
 
-        return p_state.success(ListNode(params))
+        return self.share(ListNode(params))
 
     @debug_log("Parser.func_body")
-    def func_body(self, nodes: Optional[List] = None):
+    def func_body(self, nodes: Optional[List] = None) -> ListNode:
         """Parse the body of a Function.
 
         Args:
@@ -494,38 +497,34 @@ class Parser:
 
         Returns:
             Parsed Nodes.
+
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when
+                the body doesn't end with a '=>'.
         """
-        p_state = ParseState()
         nodes = list() if nodes is None else nodes
 
         if (
-            isinstance(self.current, BracketCloseToken)
-            or isinstance(self.current, EOFToken)
+            self.current.kind == TokenKind.BRACKET_CLOSE
+            or self.current.kind == TokenKind.EOF
             or self.index >= len(self.tokens)
         ):
-            return p_state.fail(InvalidSyntaxError("Expected '=>'"))
+            raise ErrorSignal(InvalidSyntaxError("Expected '=>'"))
 
-        elif isinstance(self.current, NewLineToken):
+        elif self.current.kind == TokenKind.NEW_LINE:
             self.next()
             return self.func_body(nodes)
 
-        elif isinstance(self.current, ReturnToken):
-            statement = p_state.add(self.statement())
-            if p_state.failed():
-                return p_state
-
+        elif self.current.kind == TokenKind.RETURN:
+            statement = self.statement()
             self.next()
 
-            return p_state.success(ListNode(nodes + [statement]))
-
-        statement = p_state.add(self.statement())
-        if p_state.failed():
-            return p_state
+            return ListNode(nodes + [statement])
 
-        return self.func_body(nodes + [statement])
+        return self.func_body(nodes + [self.statement()])
 
     @debug_log("Parser.func_args")
-    def func_args(self, args: Optional[List] = None):
+    def func_args(self, args: Optional[List] = None) -> ListNode:
         """Parse the Arguments of a Function.
 
         Args:
@@ -533,272 +532,83 @@ class Parser:
 
         Returns:
             Parsed Nodes.
+
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when
+                the arguments aren't separated by a ','.
         """
-        p_state = ParseState()
         args = list() if args is None else args
 
-        if isinstance(self.current, (IntegerToken, FloatToken, StringToken, IDToken)):
-            arg = p_state.add(self.atom())
-            if p_state.failed():
-                return p_state
+        if self.current.kind in VALUE_KINDS:
+            args += [self.atom()]
 
-            args += [arg]
-
-            if not isinstance(self.current, (CommaToken, ParCloseToken)):
-                return p_state.fail(InvalidSyntaxError("Expected ')', ','"))
+            if self.current.kind not in (TokenKind.COMMA, TokenKind.PAR_CLOSE):
+                raise ErrorSignal(InvalidSyntaxError("Expected ')', ','"))
 
             return self.func_args(args)
 
-        elif isinstance(self.current, CommaToken):
+        elif self.current.kind == TokenKind.COMMA:
             self.next()
 
-            if isinstance(self.current, CommaToken):
-                return p_state.fail(InvalidSyntaxError("Expected 'value' after ','"))
+            if self.current.kind == TokenKind.COMMA:
+                raise ErrorSignal(InvalidSyntaxError("Expected 'value' after ','"))
 
             return self.func_args(args)
 
-        return p_state.success(ListNode(args))
-
-    @debug_log("Parser.func_call")
-    def func_call(self, id_node: Optional[IDNode] = None):
-        """Parse a Function Call.
-
-        Args:
-            id_node: Identifier of the Call.
-
-        Returns:
-            Parsed Node.
-        """
-        p_state = ParseState()
-        base_token = self.current
-        is_inline = False
-
-        if isinstance(self.current, CallToken):
-            self.next()
-
-        # Look for the id/name of the function to call
-        if id_node is None and not isinstance(self.current, IDToken):
-            return p_state.fail(
-                InvalidSyntaxError("Expected 'name' of function to call")
-            )
-
-        elif id_node is None:
-            id_node = IDNode(self.current)
-            self.next()
-
-        else:
-            base_token = id_node.token
-            is_inline = True
-
-        if not isinstance(self.current, ParOpenToken):
-            return p_state.fail(InvalidSyntaxError("Expected '('"))
-
-        self.next()
-
-        # Process the 'function arguments'
-        arg_nodes = p_state.add(self.func_args())
-        if p_state.failed():
-            return p_state
-
-        if not isinstance(self.current, ParCloseToken):
-            return p_state.fail(InvalidSyntaxError("Expected ')'"))
-
-        self.next()
-
-        # If any specification, about were to
-        # store the 'returned result' of the 'call',
-        # is specified, then continue the parsing
-        if not isinstance(self.current, VarToken):
-            return p_state.success(
-                CallNode(
-                    id=id_node,
-                    args=arg_nodes,
-                    result=None,
-                    inline=is_inline,
-                    token=base_token,
-                )
-            )
-
-        var_token = self.current
-
-        self.next()
-
-        if not isinstance(self.current, IDToken):
-            return p_state.fail(
-                InvalidSyntaxError(
-                    "Expected 'Identifier' to store the returned value of the function in"
-                )
-            )
-
-        result_node = IDNode(self.current)
-
-        self.next()
-
-        if not isinstance(self.current, (NewLineToken, EOFToken)):
-            return p_state.fail(
-                InvalidSyntaxError(f"Can't put '{self.current}' after function call")
-            )
-
-        return p_state.success(
-            CallNode(
-                id=id_node,
-                args=arg_nodes,
-                result=VarNode(id=result_node, value=None, token=var_token),
-                inline=is_inline,
-                token=base_token,
-            )
-        )
-
-    @debug_log("Parser.func_return")
-    def func_return(self):
-        """Parse a statement.
-
-        Returns:
-            Parsed Node.
-        """
-        p_state = ParseState()
-        base_token = self.current
-
-        self.next()
-
-        result = p_state.add(self.atom())
-        if p_state.failed():
-            return p_state
-
-        if isinstance(self.current, ParOpenToken):
-            result = p_state.add(self.func_call(result))
-            if p_state.failed():
-                return p_state
-
-        return p_state.success(ReturnNode(result, base_token))
+        return self.share(ListNode(args))
 
     @debug_log("Parser.code_block")
-    def code_block(self, nodes: Optional[List] = None):
+    def code_block(self) -> ListNode:
         """Parse a Code Block from a Function.
 
-        Args:
-            nodes: Nodes to construct the code block with.
-
         Returns:
             Parsed Nodes.
-        """
-        p_state = ParseState()
-        nodes = list() if nodes is None else nodes
-
-        if isinstance(self.current, EOFToken) or self.index >= len(self.tokens):
-            return p_state.fail(InvalidSyntaxError("Expected '}'"))
 
-        elif isinstance(self.current, NewLineToken):
-            self.next()
-            return self.code_block(nodes)
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when
+                the Code Block isn't closed with a '}'.
+        """
+        nodes = self.statements(TokenKind.BRACKET_CLOSE)
 
-        elif isinstance(self.current, BracketCloseToken):
-            return p_state.success(ListNode(nodes))
+        if self.current.kind != TokenKind.BRACKET_CLOSE:
+            raise ErrorSignal(InvalidSyntaxError("Expected '}'", self.current.pos))
 
-        statement = p_state.add(self.statement())
-        if p_state.failed():
-            return p_state
+        return nodes
 
-        return self.code_block(nodes + [statement])
+    @debug_log("Parser.assign_value")
+    def assign_value(self, id_node: IDNode) -> BaseNode:
+        """Parse the value of an Assignment.
 
-    @debug_log("Parser.if_statement")
-    def if_statement(self):
-        """Parse an If-statement.
+        Args:
+            id_node: Identifier that is assigned to.
 
         Returns:
             Parsed Node.
         """
-        p_state = ParseState()
+        # A binary operation directly after the
+        # Identifier uses the Identifier as 'lhs'
+        if self.current.kind in MATH_KINDS:
+            return self.bin_oper(id_node)
 
-        if isinstance(self.current, IfToken):
-            base_token = self.current
-
-            self.next()
-
-            # Build conditions
-            condition = p_state.add(self.condition())
-            if p_state.failed():
-                return p_state
-
-            # Build the 'result' of the conditions
-            # (when the conditions are True)
-            result_token = self.current
-            result_node = None
-
-            # If the 'result' should be stored
-            # within a 'variable', then parse
-            # the rest while building the 'VarNode'
-            if isinstance(self.current, VarToken):
-                self.next()
-
-                if not isinstance(self.current, IDToken):
-                    return p_state.fail(
-                        InvalidSyntaxError(
-                            "Expected 'Identifier' to store the result of the if-statement in"
-                        )
-                    )
-
-                id_node = IDNode(self.current)
-                result_node = VarNode(id=id_node, value=None, token=result_token)
-                self.next()
-
-            # Or if the 'result' defines a 'code block',
-            # then parse the 'body' of the 'result'
-            # as a 'ListNode' (list of seperate nodes)
-            elif isinstance(self.current, CodeBlockToken):
-                self.next()
-                result_node = p_state.add(self.code_block())
-                if p_state.failed():
-                    return p_state
-                self.next()
-
-            else:
-                result_node = p_state.add(self.statement())
-                if p_state.failed():
-                    return p_state
-
-            # Build the 'other' of the conditions
-            # (when the conditions are False),
-            # when it's defined after the 'result'
-            # as a ':' (colon symbol)
-            if isinstance(self.current, ColonToken):
-                self.next()
-
-                if isinstance(self.current, NewLineToken):
-                    return p_state.fail(
-                        InvalidSyntaxError(
-                            f"No 'False' or 'right-hand side' action was specified for if-statement"
-                        )
-                    )
-
-                other_node = p_state.add(self.statement())
-                if p_state.failed():
-                    return p_state
-
-                return p_state.success(
-                    ConditionsNode(condition, result_node, other_node, base_token)
-                )
-
-            return p_state.success(
-                ConditionsNode(condition, result_node, None, base_token)
-            )
-
-        return p_state.fail(InvalidSyntaxError(f"Expected '=?'"))
+        return self.expr()
 
     @debug_log("Parser.condition")
-    def condition(self):
+    def condition(self) -> CompareOpNode:
         """Parse a Conditional statement.
 
         Returns:
             Parsed Node.
+
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError when either side,
+                the operator or the closing ')' of the condition is missing.
         """
-        p_state = ParseState()
         found_par_open = False
 
         # Check if the current token is
         # a '(', which means that their
         # must be a ')' at the end
-        if isinstance(self.current, ParOpenToken):
+        if self.current.kind == TokenKind.PAR_OPEN:
             found_par_open = True
             self.next()
 
@@ -808,35 +618,21 @@ class Parser:
         # First check if the current token
         # is a '(', which indicated a nested expression,
         # or check if it's an atomic value,
-        # or else return a 'failed' state
-        if isinstance(self.current, ParOpenToken):
-            lhs = p_state.add(self.condition())
+        # or else raise an Error
+        if self.current.kind == TokenKind.PAR_OPEN:
+            lhs = self.condition()
 
-        elif isinstance(self.current, (IntegerToken, FloatToken, StringToken, IDToken)):
-            lhs = p_state.add(self.atom())
+        elif self.current.kind in VALUE_KINDS:
+            lhs = self.atom()
 
         else:
-            return p_state.fail(
+            raise ErrorSignal(
                 InvalidSyntaxError(f"Expected 'int', 'float', 'string', 'variable'")
             )
 
-        if p_state.failed():
-            return p_state
-        # self.next()
-
         # Build the 'Operation'
-        if not isinstance(
-            self.current,
-            (
-                EqualToken,
-                NotEqualToken,
-                GreaterToken,
-                GreaterOrEqualToken,
-                LessToken,
-                LessOrEqualToken,
-            ),
-        ):
-            return p_state.fail(
+        if self.current.kind not in COMPARE_KINDS:
+            raise ErrorSignal(
                 InvalidSyntaxError(f"Expected '==', '!=', '>', '>=', '<', '<='")
             )
 
@@ -849,74 +645,119 @@ class Parser:
         # Again, first check if the current token
         # is a '(', which indicated a nested expression,
         # or check if it's an atomic value,
-        # or else return a 'failed' state
-        if isinstance(self.current, ParOpenToken):
-            rhs = p_state.add(self.condition())
+        # or else raise an Error
+        if self.current.kind == TokenKind.PAR_OPEN:
+            rhs = self.condition()
 
-        elif isinstance(self.current, (IntegerToken, FloatToken, StringToken, IDToken)):
-            rhs = p_state.add(self.atom())
+        elif self.current.kind in VALUE_KINDS:
+            rhs = self.atom()
 
         else:
-            return p_state.fail(
+            raise ErrorSignal(
                 InvalidSyntaxError(f"Expected 'int', 'float', 'string', 'variable'")
             )
 
         # Look for a ')' when previously
         # a '(' was found at the beginning
-        if found_par_open and not isinstance(self.current, ParCloseToken):
-            return p_state.fail(InvalidSyntaxError(f"Expected ')'"))
+        if found_par_open and self.current.kind != TokenKind.PAR_CLOSE:
+            raise ErrorSignal(InvalidSyntaxError(f"Expected ')'"))
 
-        elif found_par_open and isinstance(self.current, ParCloseToken):
+        elif found_par_open and self.current.kind == TokenKind.PAR_CLOSE:
             self.next()
 
-        return p_state.success(CompareOpNode(lhs, rhs, expr))
+        return self.share(CompareOpNode(lhs, rhs, expr))
 
-    @debug_log("Parser.print_expr")
-    def print_expr(self):
-        """Parse a Printable expression.
+    # ==========================================================
+
+    @debug_log("Parser.bin_oper")
+    def bin_oper(
+        self, lhs: Union[NumberNode, StringNode, IDNode, BooleanNode]
+    ) -> BaseNode:
+        """Parse a chain of Binary Operations.
+
+        All operations following the 'Left-hand side' are
+        collected without recursing, and afterwards combined
+        into a tree by their precedence (see 'climb').
+
+        Args:
+            lhs: The (first) Left-hand side of the chain.
 
         Returns:
             Parsed Node.
+
+        Raises:
+            ErrorSignal: With the Error of the first operand that failed.
         """
-        p_state = ParseState()
 
-        if isinstance(self.current, PrintToken):
-            base_token = self.current
+        def operation():
+            # Stop collecting at the first Token
+            # that isn't a binary operator
+            if self.current.kind not in MATH_KINDS:
+                return None
 
+            oper_token = self.current
             self.next()
+            return oper_token, self.primary()
 
-            if not isinstance(
-                self.current, (IntegerToken, FloatToken, StringToken, IDToken)
-            ):
-                return p_state.fail(
-                    InvalidSyntaxError(f"Expected 'int', 'float', 'string', 'variable'")
-                )
+        operations = list(iter(operation, None))
 
-            to_print_node = p_state.add(self.expr())
-            if p_state.failed():
-                return p_state
+        return self.climb(
+            [lhs] + list(map(lambda x: x[1], operations)),
+            list(map(lambda x: x[0], operations)),
+        )
 
-            return p_state.success(PrintNode(to_print_node, base_token))
+    @debug_log("Parser.climb")
+    def climb(self, operands: List[BaseNode], operators: List[Token], level: int = 1):
+        """Combine a chain of operands into a tree of BinaryOpNodes.
 
-        return p_state.fail(InvalidSyntaxError(f"Expected '=!'"))
+        The chain is split at the operators of the given precedence
+        'level', and the parts between those operators are combined
+        at the next (higher) level first. So '*' and '/' take precedence
+        over '+' and '-', while all operations are left-associative.
 
-    # ==========================================================
+        A run of the same associative operator ('+' or '*') on integers
+        is combined into a balanced tree instead, keeping long chains
+        shallow. Runs on any other operands stay left-deep, as a float
+        (like '0.1 + 0.2 + 0.3') could round differently when grouped.
 
-    @debug_log("Parser.bin_oper")
-    def bin_oper(self, lhs: Union[NumberNode, StringNode, IDNode, BooleanNode]):
-        """Parse a Binary Operation.
+        Args:
+            operands: Operands of the chain.
+            operators: Operator Tokens, between each of the operands.
+            level: Precedence level to split the chain at. Defaults to 1.
 
         Returns:
-            Parsed Node.
+            Root Node of the combined tree.
         """
-        p_state = ParseState()
-        oper_token = self.current
+        if len(operators) == 0:
+            return operands[0]
 
-        if isinstance(self.current, (AddToken, SubToken, MulToken, DivToken)):
-            self.next()
-            rhs = p_state.add(self.atom())
-            if p_state.failed():
-                return p_state
-            return p_state.success(BinaryOpNode(lhs, rhs, oper_token))
+        cuts = list(
+            filter(
+                lambda x: PRECEDENCE[operators[x].kind] == level, range(len(operators))
+            )
+        )
+        if len(cuts) == 0:
+            return self.climb(operands, operators, level + 1)
+
+        parts = list(
+            map(
+                lambda x: self.climb(
+                    operands[x[0] + 1 : x[1] + 1], operators[x[0] + 1 : x[1]], level + 1
+                ),
+                zip([-1] + cuts, cuts + [len(operators)]),
+            )
+        )
+        joins = list(map(lambda x: operators[x], cuts))
+
+        if (
+            joins[0].kind in ASSOCIATIVE_KINDS
+            and all(map(lambda x: x.kind == joins[0].kind, joins))
+            and all(map(is_integer, parts))
+        ):
+            return balance(parts, joins, self.share)
 
-        return p_state.success(lhs)
+        return reduce(
+            lambda lhs, x: self.share(BinaryOpNode(lhs, x[1], x[0])),
+            zip(joins, parts[1:]),
+            parts[0],
+        )
@@ -1,4 +1,5 @@
-from typing import Optional
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple, Union
 
 
 class Position:
@@ -12,6 +13,8 @@ class Position:
         end: End index.
     """
 
+    __slots__ = ("line", "start", "end")
+
     def __init__(self, line: int = 0, start: int = 0, end: Optional[int] = None):
         """Initializes the postion with given line and start to end index.
 
@@ -38,6 +41,9 @@ class Position:
             return False
         return self.line == rhs.line and self.start == rhs.start and self.end == rhs.end
 
+    def __reduce__(self) -> Tuple[type, Tuple[int, int, int]]:
+        return Position, (self.line, self.start, self.end)
+
     def next(self, steps: Optional[int] = 1):
         """Go to the next position.
 
@@ -64,3 +70,173 @@ class Position:
         return Position(
             self.line, self.start, self.end + steps if steps > 0 else self.end
         )
+
+
+class LineIndex:
+    """Sorted index of the offsets where the lines of a source start.
+
+    Tokens only keep their (absolute) offsets within the source,
+    together with the LineIndex of that source. Their line and
+    column are looked up (by bisecting the index) once their
+    Position is needed, which is mostly when an Error is reported.
+
+    Attributes:
+        starts: Offset where each line starts.
+        line: Number of the first line of the source.
+    """
+
+    __slots__ = ("starts", "line")
+
+    def __init__(self, line: int = 0, starts: Optional[List[int]] = None):
+        """Initialise the LineIndex of a source.
+
+        Args:
+            line: Number of the first line. Defaults to 0.
+            starts: Offsets where the lines start. Defaults to only the first line.
+        """
+        self.line = line
+        self.starts = [0] if starts is None else starts
+
+    def __str__(self) -> str:
+        return f"LineIndex({self.line}, {len(self.starts)})"
+
+    def __repr__(self) -> str:
+        return f"LineIndex(line={self.line!r}, starts={self.starts!r})"
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, offset: int):
+        """Start a new line at the given offset.
+
+        Args:
+            offset: Offset of the first character of the line.
+        """
+        self.starts.append(offset)
+
+    def locate(self, start: int, end: Optional[int] = None) -> Position:
+        """Build the Position of the given offsets.
+
+        Args:
+            start: Offset of the start.
+            end: Offset of the end. Defaults to the start.
+
+        Returns:
+            Position with the line and columns of the offsets.
+        """
+        index = bisect_right(self.starts, start) - 1
+        return Position(
+            self.line + index,
+            start - self.starts[index],
+            (start if end is None else end) - self.starts[index],
+        )
+
+
+# Offsets of a Token (start and end), together with the
+# LineIndex to build their Position with (see 'LineIndex.locate')
+Span = Tuple[LineIndex, int, int]
+
+
+class PositionTable:
+    """Side table of the Positions of Nodes.
+
+    Nodes don't keep their Token (or Position) themselves, instead
+    their Position is kept within this table, by the id of the Node.
+    The table is only consulted when an Error (or trace) is built,
+    and a Node removes it's own Position once it's deleted. A Node
+    can also be stored with the Span of it's Token, of which the
+    Position is only built (and kept) once it's looked up.
+
+    Attributes:
+        positions: Position (or Span) of each Node, by the id of the Node.
+    """
+
+    def __init__(self):
+        """Initialise an empty PositionTable."""
+        self.positions: Dict[int, Union[Position, Span]] = dict()
+
+    def __str__(self) -> str:
+        return f"PositionTable({len(self.positions)})"
+
+    def __repr__(self) -> str:
+        return f"PositionTable(positions={self.positions!r})"
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def set(self, obj: object, pos: Union[Position, Span, None]):
+        """Set the Position of the given object.
+
+        Args:
+            obj: Object to set the Position of.
+            pos: Position (or Span) of the object, or None to remove it.
+        """
+        if pos is None:
+            self.discard(obj)
+        else:
+            self.positions[id(obj)] = pos
+
+    def get(self, obj: object) -> Optional[Position]:
+        """Get the Position of the given object.
+
+        Args:
+            obj: Object to get the Position of.
+
+        Returns:
+            Position of the object, or None if it has no Position.
+        """
+        pos = self.positions.get(id(obj), None)
+
+        # Build the Position of a Span, and keep it
+        # so the same Position is returned every time
+        if isinstance(pos, tuple):
+            pos = self.positions[id(obj)] = pos[0].locate(pos[1], pos[2])
+
+        return pos
+
+    def discard(self, obj: object):
+        """Remove the Position of the given object (if any).
+
+        Args:
+            obj: Object to remove the Position of.
+        """
+        self.positions.pop(id(obj), None)
+
+    def take(self, obj: object) -> Union[Position, Span, None]:
+        """Remove the Position of the given object, and return it.
+
+        Args:
+            obj: Object to take the Position of.
+
+        Returns:
+            The removed Position (or Span), or None if it had no Position.
+        """
+        return self.positions.pop(id(obj), None)
+
+    def add(self, obj: object, pos: Union[Position, Span, None]):
+        """Set the Position of the given object, unless it already has one.
+
+        Args:
+            obj: Object to set the Position of.
+            pos: Position (or Span) of the object.
+        """
+        if pos is not None:
+            self.positions.setdefault(id(obj), pos)
+
+    def values(self) -> List[Position]:
+        """Get all Positions within the table.
+
+        Returns:
+            List of the (built) Positions.
+        """
+        _ = list(
+            map(
+                lambda x: self.positions.__setitem__(x[0], x[1][0].locate(*x[1][1:])),
+                filter(lambda x: isinstance(x[1], tuple), list(self.positions.items())),
+            )
+        )
+        return list(self.positions.values())
+
+
+# Global PositionTable, containing the Positions of all Nodes
+POSITIONS = PositionTable()
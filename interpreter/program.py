@@ -1,22 +1,10 @@
 from __future__ import annotations
-from typing import Optional, List, Union, Any
+import operator
+from itertools import chain, product, repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from copy import deepcopy
-from interpreter.tokens import (
-    AddToken,
-    SubToken,
-    MulToken,
-    DivToken,
-    EqualToken,
-    NotEqualToken,
-    GreaterToken,
-    GreaterOrEqualToken,
-    LessToken,
-    LessOrEqualToken,
-    AssignAddToken,
-    AssignSubToken,
-    AssignMulToken,
-    AssignDivToken,
-)
+from types import MappingProxyType
+from interpreter.tokens import TokenKind
 from interpreter.nodes import (
     BaseNode,
     NumberNode,
@@ -37,13 +25,142 @@ from interpreter.nodes import (
 )
 from interpreter.errors import (
     Error,
+    ErrorSignal,
     InvalidSyntaxError,
     NotImplementedError,
     RunTimeError,
     ZeroDivisionError,
 )
+from interpreter.output import Output, StreamOutput
+from interpreter.rope import Rope, concat
+from interpreter.position import Position, PositionTable
+from interpreter.symbols import SYMBOLS
+from interpreter.tracing import Tracer
 from interpreter.utils import debug_log
 
+# Operations of the comparisons and binary operations,
+# by the kind of their Token
+COMPARE_OPS = {
+    TokenKind.EQUAL: operator.eq,
+    TokenKind.NOT_EQUAL: operator.ne,
+    TokenKind.GREATER: operator.gt,
+    TokenKind.GREATER_OR_EQUAL: operator.ge,
+    TokenKind.LESS: operator.lt,
+    TokenKind.LESS_OR_EQUAL: operator.le,
+}
+MATH_OPS = {
+    TokenKind.ADD: operator.add,
+    TokenKind.SUB: operator.sub,
+    TokenKind.MUL: operator.mul,
+    TokenKind.DIV: operator.truediv,
+}
+
+# Default maximum depth of (nested) function calls
+MAX_DEPTH = 1000
+
+# Estimated amount of Python frames, and bytes of stack, needed
+# by the interpreter to execute a single (nested) function call
+FRAMES_PER_CALL = 100
+STACK_PER_CALL = 16 * 1024
+
+# Largest stack (in bytes) the Program is ran with, which
+# limits the maximum depth of (nested) function calls
+MAX_STACK_SIZE = 1024 * 1024 * 1024
+MAX_CALL_DEPTH = MAX_STACK_SIZE // STACK_PER_CALL
+
+
+# Fields of the nodes containing the nested nodes walked by
+# 'walk_function', by their class (the identifiers of variables
+# and calls are bound or called, instead of looked up)
+WALKED_FIELDS = {
+    CompareOpNode: ("lhs", "rhs"),
+    AssignOpNode: ("id", "value"),
+    BinaryOpNode: ("lhs", "rhs"),
+    VarNode: ("value",),
+    ReturnNode: ("return_value",),
+    CallNode: ("args", "result"),
+    ConditionsNode: ("conditions", "result", "other"),
+    PrintNode: ("to_print",),
+}
+
+
+def locate_node(
+    node: BaseNode,
+    pos: Optional[Position] = None,
+    occurrences: Optional[PositionTable] = None,
+) -> Optional[Position]:
+    """Locate the given node within the statement containing it.
+
+    Shared nodes don't have a Position of their own, so those
+    are located by the PositionTable of the statement, or else
+    at the statement itself.
+
+    Args:
+        node: Node to locate.
+        pos: Position of the statement. Defaults to None.
+        occurrences: PositionTable of the statement. Defaults to None.
+
+    Returns:
+        Position of the node, or of the statement.
+    """
+    found = node.pos
+    if found is None and occurrences is not None:
+        found = occurrences.get(node)
+    return pos if found is None else found
+
+
+def walk_function(
+    node: Any,
+    pos: Optional[Position] = None,
+    occurrences: Optional[PositionTable] = None,
+) -> Iterator[Tuple[BaseNode, Optional[Position], Optional[PositionTable]]]:
+    """Walk over the given node and it's nested nodes, in the order of the source.
+
+    The walk stays within a single function: the body of a nested
+    function definition isn't walked, only the FuncNode itself
+    (see 'WALKED_FIELDS').
+
+    Args:
+        node: Node (or list of nodes) to walk over.
+        pos: Position of the statement containing the node. Defaults to None.
+        occurrences: PositionTable of the statement containing the node.
+            Defaults to None.
+
+    Returns:
+        Iterator over the walked nodes, together with the Position and
+        PositionTable of the (innermost) statement containing them
+        (to locate them with 'locate_node').
+    """
+    if node is None:
+        return iter(())
+
+    if isinstance(node, list):
+        return chain.from_iterable(
+            map(walk_function, node, repeat(pos), repeat(occurrences))
+        )
+
+    # The statements within a code block have a Position of their own
+    if isinstance(node, ListNode) and isinstance(node.items, list):
+        positions = repeat(pos) if node.positions is None else node.positions
+        tables = repeat(occurrences) if node.occurrences is None else node.occurrences
+        return chain(
+            ((node, pos, occurrences),),
+            chain.from_iterable(map(walk_function, node.items, positions, tables)),
+        )
+
+    fields = WALKED_FIELDS.get(type(node), ())
+    return chain(
+        ((node, pos, occurrences),),
+        chain.from_iterable(
+            map(
+                walk_function,
+                map(getattr, repeat(node), fields),
+                repeat(pos),
+                repeat(occurrences),
+            )
+        ),
+    )
+
 
 class Empty:
     """An empty value.
@@ -125,7 +242,13 @@ class Value:
     def __add__(self, rhs) -> Optional[Value]:
         if isinstance(rhs.node, type(self.node)):
             lhs = deepcopy(self)
-            lhs.value = lhs.value + rhs.value
+
+            # Strings are concatenated as a Rope (once they're long
+            # enough), so appending to a string doesn't copy it
+            if isinstance(self.node, StringNode):
+                lhs.value = concat(lhs.value, rhs.value)
+            else:
+                lhs.value = lhs.value + rhs.value
             return lhs
 
     def __sub__(self, rhs) -> Optional[Value]:
@@ -197,6 +320,7 @@ class Function:
         name: Name of the Function.
         args: Arguments of the Function.
         params: Parameters of the Function.
+        symbols: Interned symbols of the parameters.
     """
 
     def __init__(self, node: FuncNode, body: Optional[ListNode], scope: Scope):
@@ -232,21 +356,84 @@ class Function:
 
         return list(map(lambda x: x.value, self.node.args.items))
 
+    @property
+    def symbols(self) -> List[int]:
+        if not isinstance(self.node.args, ListNode) or self.node.args.items is None:
+            return list()
+
+        return list(map(lambda x: x.symbol, self.node.args.items))
+
     def copy(self) -> Function:
         return deepcopy(self)
 
 
+class Bindings:
+    """Version of the bindings of the function names, across all Scopes.
+
+    A call caches the Function it resolved to (see 'CallCache'), which
+    stays valid for as long as no function name is bound (or unbound)
+    within any Scope. So the version is increased whenever a Function
+    is set, a function name is set or removed, or a Scope binding a
+    function name is created or closed. A new root Scope starts a new
+    chain of Scopes, which increases the version as well.
+
+    Attributes:
+        version: Current version of the bindings.
+        symbols: Symbols of the names which were bound to a Function.
+    """
+
+    def __init__(self):
+        """Initialise the Bindings."""
+        self.version = 0
+        self.symbols = set()
+
+    def __str__(self) -> str:
+        return f"Bindings({self.version})"
+
+    def __repr__(self) -> str:
+        return f"Bindings(version={self.version!r}, symbols={self.symbols!r})"
+
+    def bind(self, key: int, value: Any = None) -> None:
+        """Register binding the given key within a Scope.
+
+        Args:
+            key: Key being (un)bound.
+            value: Value bound to the key. Defaults to None.
+        """
+        if isinstance(value, Function):
+            self.symbols.add(key)
+
+        if key in self.symbols:
+            self.version += 1
+
+    def bind_all(self, keys: Any) -> None:
+        """Register binding (or unbinding) all the given keys at once.
+
+        Args:
+            keys: Keys being (un)bound.
+        """
+        if not self.symbols.isdisjoint(keys):
+            self.version += 1
+
+
+# Bindings shared by all Scopes
+BINDINGS = Bindings()
+
+
 class Scope:
     """Scope definition.
 
     This could be the scope of the program,
-    function or function call.
+    function or function call. All arguments are
+    keyed by their interned symbol, instead of their name.
 
     Attributes:
         name: Name/Id of the scope.
         args: Arguments of the scope. Defaults to None.
         origin: Original node of the scope. Defaults to None.
         outer: Outer scope. Defaults to None.
+        pos: Position of the statement being executed within the scope.
+        occurrences: PositionTable of the statement being executed.
     """
 
     def __init__(
@@ -270,6 +457,12 @@ class Scope:
         self.result = None
         self.outer = outer
         self.depth = 0
+        self.pos = None
+        self.occurrences = None
+
+        if outer is None:
+            BINDINGS.version += 1
+        BINDINGS.bind_all(self.args)
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -277,7 +470,21 @@ class Scope:
     def __repr__(self) -> str:
         return f"Scope(name={self.name!r}, args={self.args!r}, origin={self.origin!r}, outer={self.outer!r})"
 
-    def exist(self, key: str) -> bool:
+    def locate(self, node: BaseNode) -> Optional[Position]:
+        """Locate the given node.
+
+        Shared nodes don't have a Position of their own, so those
+        are located within the statement being executed.
+
+        Args:
+            node: Node to locate.
+
+        Returns:
+            Position of the node, or of the current statement.
+        """
+        return locate_node(node, self.pos, self.occurrences)
+
+    def exist(self, key: int) -> bool:
         """Check if given key exists within Scope.
 
         Args:
@@ -288,16 +495,17 @@ class Scope:
         """
         return key in self.args
 
-    def set(self, key: str, value: Union[Value, Function, Empty]) -> None:
+    def set(self, key: int, value: Union[Value, Function, Empty]) -> None:
         """Set key within the Scope.
 
         Args:
             key: Key to set.
             value: Value to set.
         """
+        BINDINGS.bind(key, value)
         self.args[key] = value
 
-    def get(self, key: str) -> Union[Value, Function, Empty, None]:
+    def get(self, key: int) -> Union[Value, Function, Empty, None]:
         """Get the given key from the Scope.
 
         Args:
@@ -308,7 +516,7 @@ class Scope:
         """
         return deepcopy(self.args.get(key, None))
 
-    def get_outer(self, key: str) -> Optional[Function]:
+    def get_outer(self, key: int) -> Optional[Function]:
         """Get key from outer scope.
 
         Args:
@@ -325,7 +533,7 @@ class Scope:
             else:
                 return self.outer.get_outer(key)
 
-    def remove(self, key: str) -> Union[Value, Function, Empty, None]:
+    def remove(self, key: int) -> Union[Value, Function, Empty, None]:
         """Remove key from scope.
 
         Args:
@@ -334,15 +542,43 @@ class Scope:
         Returns:
             The removed key.
         """
+        BINDINGS.bind(key)
         return self.args.pop(key, None)
 
+    def find(self, key: int) -> Union[Value, Function, Empty, None]:
+        """Find the given key within the Scope, or else it's outer scopes.
+
+        Unlike 'get' and 'get_outer', the item itself is returned
+        instead of a copy, so it must not be changed.
+
+        Args:
+            key: Key to find.
+
+        Returns:
+            The item stored with the given key in the nearest scope.
+        """
+        if key in self.args:
+            return self.args[key]
+
+        if self.outer is not None:
+            return self.outer.find(key)
+
+    def close(self) -> None:
+        """Close the Scope, once it has been left."""
+        BINDINGS.bind_all(self.args)
+
     def format_args(self):
         """Format the arguments of the scope.
 
         Returns:
-            Dict containing the formatted arguments.
+            Dict containing the formatted arguments, by their name.
         """
-        return dict(zip(self.args.keys(), map(lambda x: str(x), self.args.values())))
+        return dict(
+            zip(
+                map(SYMBOLS.name, self.args.keys()),
+                map(lambda x: str(x), self.args.values()),
+            )
+        )
 
 
 class ProgramState:
@@ -438,26 +674,402 @@ class ProgramState:
         return self.success(result)
 
 
+class ReturnSignal(Exception):
+    """Signal returning a value from a function.
+
+    Raised by a '=>' statement, unwinding any (nested) code
+    blocks and if-statements straight to the enclosing call.
+
+    Attributes:
+        value: The returned value.
+    """
+
+    def __init__(self, value: Any):
+        """Initialise the signal with the returned value.
+
+        Args:
+            value: The returned value.
+        """
+        super().__init__(value)
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"ReturnSignal({self.value})"
+
+    def __repr__(self) -> str:
+        return f"ReturnSignal(value={self.value!r})"
+
+
+class Frame:
+    """A frame on the call stack of the Program.
+
+    Attributes:
+        name: Name of the called function.
+        pos: Position of the call.
+        scope: Scope of the call.
+    """
+
+    def __init__(self, name: str, pos: Optional[Position], scope: Scope):
+        """Initialise the Frame.
+
+        Args:
+            name: Name of the called function.
+            pos: Position of the call.
+            scope: Scope of the call.
+        """
+        self.name = name
+        self.pos = pos
+        self.scope = scope
+
+    def __str__(self) -> str:
+        return f"Frame({self.name})"
+
+    def __repr__(self) -> str:
+        return f"Frame(name={self.name!r}, pos={self.pos!r}, scope={self.scope!r})"
+
+
+class Specialization:
+    """Specialised handler of a binary operation or comparison.
+
+    An operation records the types of the values of it's operands,
+    and rewrites it's node to the Specialization of those types (see
+    'Quickening'). The Specialization performs the operation directly
+    on the values, for as long as the operands pass it's guard.
+
+    Attributes:
+        name: Name of the Specialization, like 'int add int'.
+        kind: Kind of the Token of the operation.
+        lhs: Type of the value of the Left-hand side.
+        rhs: Type of the value of the Right-hand side.
+        node: Node class both Values must originate from, when the
+            operation creates a new Value, or None for a comparison.
+        run: Function performing the operation on both Values.
+    """
+
+    __slots__ = ("name", "kind", "lhs", "rhs", "node", "run")
+
+    def __init__(
+        self,
+        kind: int,
+        lhs: type,
+        rhs: type,
+        operation: Callable[[Any, Any], Any],
+        node: Optional[type] = None,
+    ):
+        """Initialise the Specialization.
+
+        Args:
+            kind: Kind of the Token of the operation.
+            lhs: Type of the value of the Left-hand side.
+            rhs: Type of the value of the Right-hand side.
+            operation: Operation to perform on the values.
+            node: Node class both Values must originate from, when the
+                operation creates a new Value. Defaults to None.
+        """
+        self.name = f"{lhs.__name__} {operation.__name__} {rhs.__name__}"
+        self.kind = kind
+        self.lhs = lhs
+        self.rhs = rhs
+        self.node = node
+
+        # A binary operation creates a new Value, just like
+        # 'Value.__add__' (and the others) would have done
+        if node is None:
+            self.run = lambda x, y: operation(x.value, y.value)
+        else:
+            self.run = lambda x, y: Value(operation(x.value, y.value), x.node)
+
+    def __str__(self) -> str:
+        return f"Specialization({self.name})"
+
+    def __repr__(self) -> str:
+        return f"Specialization(name={self.name!r}, kind={self.kind!r})"
+
+    def guard(self, lhs: Any, rhs: Any) -> bool:
+        """Check if the operands still match the Specialization.
+
+        Args:
+            lhs: The Left-hand side.
+            rhs: The Right-hand side.
+
+        Returns:
+            True/False if the operation can be performed by the Specialization.
+        """
+        return (
+            type(lhs) is Value
+            and type(rhs) is Value
+            and type(lhs.value) is self.lhs
+            and type(rhs.value) is self.rhs
+            and (
+                self.node is None
+                or type(lhs.node) is self.node
+                and type(rhs.node) is self.node
+            )
+            and (self.kind != TokenKind.DIV or rhs.value != 0)
+        )
+
+
+# Types of the operands that are specialised for
+NUMBER_TYPES = ((int, int), (float, float), (int, float), (float, int))
+STRING_TYPES = ((str, str), (Rope, str), (str, Rope), (Rope, Rope))
+COMPARE_TYPES = NUMBER_TYPES + STRING_TYPES
+
+# Comparisons of which the Values can be compared (the
+# others aren't implemented by 'Value', see '__gte__')
+QUICK_COMPARE_KINDS = frozenset(
+    {TokenKind.EQUAL, TokenKind.NOT_EQUAL, TokenKind.GREATER, TokenKind.LESS}
+)
+
+# Specializations of the binary operations and comparisons,
+# by the kind of their Token and the types of both operand values
+SPECIALIZATIONS: Dict[Tuple[int, type, type], Specialization] = dict(
+    map(
+        lambda x: ((x.kind, x.lhs, x.rhs), x),
+        chain(
+            map(
+                lambda x: Specialization(x[0][0], *x[1], x[0][1], NumberNode),
+                product(MATH_OPS.items(), NUMBER_TYPES),
+            ),
+            map(
+                lambda x: Specialization(TokenKind.ADD, *x, concat, StringNode),
+                STRING_TYPES,
+            ),
+            map(
+                lambda x: Specialization(x[0][0], *x[1], x[0][1]),
+                product(
+                    filter(lambda x: x[0] in QUICK_COMPARE_KINDS, COMPARE_OPS.items()),
+                    COMPARE_TYPES,
+                ),
+            ),
+        ),
+    )
+)
+
+
+class Quickening:
+    """Adaptive specialization (quickening) of the operations of a Program.
+
+    A binary operation or comparison starts out generic. Once it's
+    performed, it's node is rewritten to the Specialization of the
+    types of it's operands. When the operands no longer pass the guard
+    of the Specialization, the node is de-optimised to the generic
+    operation again (and specialised for the new types afterwards).
+
+    Attributes:
+        hits: Operations performed by a Specialization.
+        misses: Operations of which the operands failed the guard
+            of the Specialization, de-optimising the node.
+        generic: Operations performed without a Specialization.
+        specialized: Amount of times a node was specialised.
+    """
+
+    def __init__(self):
+        """Initialise the (empty) statistics."""
+        self.hits = 0
+        self.misses = 0
+        self.generic = 0
+        self.specialized = 0
+
+    def __str__(self) -> str:
+        return f"Quickening({self.hit_rate:.1%})"
+
+    def __repr__(self) -> str:
+        return f"Quickening(hits={self.hits!r}, misses={self.misses!r}, generic={self.generic!r}, specialized={self.specialized!r})"
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the operations performed by a Specialization."""
+        total = self.hits + self.misses + self.generic
+        return self.hits / total if total > 0 else 0.0
+
+    def format_stats(self) -> str:
+        """Format the statistics as a single line."""
+        return f"{self.hits} hits, {self.misses} misses, {self.generic} generic ({self.hit_rate:.1%}), {self.specialized} specialized"
+
+    def run(self, node: Union[BinaryOpNode, CompareOpNode], lhs: Any, rhs: Any) -> Any:
+        """Perform the operation of the node through it's Specialization.
+
+        Args:
+            node: Node of the operation.
+            lhs: The Left-hand side.
+            rhs: The Right-hand side.
+
+        Returns:
+            Result of the operation, or None when the node isn't
+            specialised for (the types of) the given operands.
+        """
+        quick = node.quick
+
+        if quick is None:
+            self.generic += 1
+            return None
+
+        if quick.guard(lhs, rhs):
+            self.hits += 1
+            return quick.run(lhs, rhs)
+
+        # De-optimise the node, as the types of the operands changed
+        node.quick = None
+        self.misses += 1
+        return None
+
+    def specialize(self, node: Union[BinaryOpNode, CompareOpNode], lhs: Any, rhs: Any):
+        """Rewrite the node to the Specialization of the given operands.
+
+        Args:
+            node: Node of the (generically) performed operation.
+            lhs: The Left-hand side.
+            rhs: The Right-hand side.
+        """
+        if type(lhs) is not Value or type(rhs) is not Value:
+            return
+
+        quick = SPECIALIZATIONS.get((node.kind, type(lhs.value), type(rhs.value)), None)
+
+        if quick is not None and quick.guard(lhs, rhs):
+            node.quick = quick
+            self.specialized += 1
+
+
+class CallCache:
+    """Inline caching of the Functions called by the CallNodes of a Program.
+
+    Each CallNode caches the Function it resolved to (and of which
+    the amount of arguments was validated) within it's 'cache' slot,
+    together with the version of the 'BINDINGS' at that time. As
+    long as the version is the same, the Function is called without
+    looking it up (and copying it) again.
+
+    Attributes:
+        hits: Calls of a cached Function.
+        misses: Calls which had to look up the Function.
+    """
+
+    def __init__(self):
+        """Initialise the (empty) statistics."""
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self) -> str:
+        return f"CallCache({self.hit_rate:.1%})"
+
+    def __repr__(self) -> str:
+        return f"CallCache(hits={self.hits!r}, misses={self.misses!r})"
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the calls of a cached Function."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def format_stats(self) -> str:
+        """Format the statistics as a single line."""
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%})"
+
+    def get(self, node: CallNode, scope: Scope) -> Optional[Function]:
+        """Get the cached Function of the given call.
+
+        Args:
+            node: CallNode of the call.
+            scope: Scope the call is executed in.
+
+        Returns:
+            The cached Function, or None when it has to be looked up.
+        """
+        cache = node.cache
+
+        # A call which isn't inline only calls
+        # Functions defined within it's own scope
+        if (
+            cache is not None
+            and cache[0] == BINDINGS.version
+            and (node.inline or scope.args.get(node.symbol, None) is cache[1])
+        ):
+            self.hits += 1
+            return cache[1]
+
+        self.misses += 1
+        return None
+
+
 class Program:
     """Reperesentation of a Moonlet Program.
 
     Attributes:
         debug_mode: If 'debug mode' is enabled. Default to False.
+        tracer: Optional Tracer to record the execution with. Defaults to None.
+        max_depth: Maximum depth of (nested) function calls.
+        frames: Call stack, containing a Frame for each active call.
+        output: Output to write the printed values to.
+        quickening: Optional Quickening, specialising the operations.
+        call_cache: Optional CallCache, caching the called Functions.
+        hoist: If the top-level functions are hoisted into the function table.
+        root: Root scope of the executed Program.
+        functions: Function table, containing the top-level
+            Functions of the executed Program by their symbol.
+        shadowed: Symbols which can be bound within a call,
+            of any of the functions defined so far.
     """
 
-    def __init__(self, debug_mode: bool = False):
+    def __init__(
+        self,
+        debug_mode: bool = False,
+        tracer: Optional[Tracer] = None,
+        max_depth: int = MAX_DEPTH,
+        output: Optional[Output] = None,
+        quicken: bool = True,
+        cache_calls: bool = True,
+        hoist: bool = True,
+    ):
         """Initialise the Program.
 
         Args:
             debug_mode: If 'debug mode' is enabled. Default to False.
+            tracer: Optional Tracer to record the execution with. Defaults to None.
+            max_depth: Maximum depth of (nested) function calls. Defaults to 'MAX_DEPTH'.
+            output: Output to write the printed values to. Defaults to a
+                (buffered) StreamOutput, which writes to 'sys.stdout'.
+            quicken: If the operations are specialised for the types
+                of their operands (see 'Quickening'). Defaults to True.
+            cache_calls: If the calls cache the Function they
+                resolved to (see 'CallCache'). Defaults to True.
+            hoist: If the top-level functions are hoisted into
+                the function table (see 'hoist_functions'). Defaults to True.
         """
         self.debug_mode = debug_mode
+        self.tracer = tracer
+        self.max_depth = max_depth
+        self.frames = list()
+        self.output = StreamOutput() if output is None else output
+        self.quickening = Quickening() if quicken else None
+        self.call_cache = CallCache() if cache_calls else None
+        self.hoist = hoist
+        self.root = None
+        self.functions = MappingProxyType(dict())
+        self.shadowed = set()
 
     def __str__(self) -> str:
         return f"Program({self.debug_mode})"
 
     def __repr__(self) -> str:
-        return f"Program(debug_mode={self.debug_mode!r})"
+        return f"Program(debug_mode={self.debug_mode!r}, tracer={self.tracer!r}, max_depth={self.max_depth!r})"
+
+    @property
+    def recursion_limit(self) -> int:
+        """Python recursion limit needed to reach the 'max_depth'.
+
+        Limited to the 'MAX_CALL_DEPTH', as the 'stack_size' is
+        limited as well (deeper calls run out of stack instead).
+        """
+        return min(self.max_depth, MAX_CALL_DEPTH) * FRAMES_PER_CALL + 10_000
+
+    @property
+    def stack_size(self) -> int:
+        """Size of the stack (in bytes) needed to reach the 'max_depth'.
+
+        Limited to the 'MAX_STACK_SIZE'.
+        """
+        return min(MAX_STACK_SIZE, max(64 * 1024 * 1024, self.max_depth * STACK_PER_CALL))
 
     def __show(self, node: BaseNode, scope: Scope):
         """Show the current execution of an expression.
@@ -468,119 +1080,233 @@ class Program:
             node: Node that is been executed.
             scope: Scope of the Program.
         """
-        if node.token is None:
+        pos = scope.locate(node)
+        if pos is None:
             print(
                 f"{' '*11} {scope!s: <20} {node.__class__.__name__: <15} {str(scope.format_args()): <20}"
             )
 
         else:
             print(
-                f" {node.token.value: ^10} {scope!s: <20} {node.__class__.__name__: <15} {str(scope.format_args()): <20}"
+                f" {str(pos): ^10} {scope!s: <20} {node.__class__.__name__: <15} {str(scope.format_args()): <20}"
             )
 
+    @debug_log("Program.run")
+    def run(self, node: BaseNode, scope: Scope) -> ProgramState:
+        """Run the given node as a whole Program.
+
+        Executes the node, and flushes the Output once
+        the Program has ended (or failed with an Error).
+
+        Args:
+            node: Node to execute the operation on.
+            scope: Current Program scope.
+
+        Returns:
+            ProgramState containing either the Result or an Error.
+        """
+        try:
+            return self.exec(node, scope)
+        finally:
+            self.output.flush()
+
     @debug_log("Program.exec")
     def exec(self, node: BaseNode, scope: Scope) -> ProgramState:
         """Execute the given node.
 
+        Within the Program the results are returned as they are,
+        while any Error is raised as an 'ErrorSignal'. Executing
+        a node turns either of them back into a ProgramState.
+        A '=>' outside of a function ends the execution, with
+        the returned value as it's result.
+
         Args:
             node: Node to execute the operation on.
             scope: Current Program scope.
 
         Returns:
             ProgramState containing either the Result on successfull
-            executing of the Program state, or an 'NotImplementedError'
-            if the given node was not implemented or registered.
+            executing of the Program state, or the Error that was raised
+            while executing the node.
+        """
+        if self.hoist:
+            self.root = scope
+            self.functions = self.hoist_functions(node, scope)
+
+        try:
+            return ProgramState(self.eval(node, scope))
+        except ReturnSignal as signal:
+            return ProgramState(signal.value)
+        except ErrorSignal as signal:
+            return ProgramState(error=signal.error)
+
+    @debug_log("Program.hoist_functions")
+    def hoist_functions(
+        self, node: BaseNode, scope: Scope
+    ) -> MappingProxyType[int, Function]:
+        """Hoist the top-level functions into an (immutable) function table.
+
+        The Function of each top-level FuncNode is created before the
+        Program is executed, while it's still bound to the root scope
+        when it's definition is executed. So a call (within any scope)
+        can look up such a Function within the table, instead of
+        looking it up through the scopes of the calls in between.
+
+        Args:
+            node: Root node of the Program.
+            scope: Root scope of the Program.
+
+        Returns:
+            Function table, containing the Functions by their symbol.
+        """
+        if not isinstance(node, ListNode) or not isinstance(node.items, list):
+            return MappingProxyType(dict())
+
+        # When a function is defined twice, the first
+        # definition is used (the second one will fail)
+        funcs = reversed(list(filter(lambda x: isinstance(x, FuncNode), node.items)))
+        return MappingProxyType(
+            dict(
+                map(
+                    lambda x: (
+                        x.symbol,
+                        Function(
+                            x,
+                            x.body,
+                            Scope(name=f"<Function: '{x.name}'>", origin=x, outer=scope),
+                        ),
+                    ),
+                    funcs,
+                )
+            )
+        )
+
+    @debug_log("Program.eval")
+    def eval(self, node: BaseNode, scope: Scope) -> Any:
+        """Evaluate the given node.
+
+        Args:
+            node: Node to evaluate.
+            scope: Current Program scope.
+
+        Returns:
+            Result of the evaluated node.
+
+        Raises:
+            ErrorSignal: With a 'NotImplementedError' if the given node
+                was not implemented or registered, or with the Error
+                raised while evaluating the node.
         """
-        p_state = ProgramState()
+        # Record the execution of the node,
+        # when tracing has been enabled
+        if self.tracer is not None:
+            self.tracer.record(node, scope)
 
         if isinstance(node, NumberNode):
-            return p_state.run(self.exec_number_node(node))
+            return self.exec_number_node(node)
 
         elif isinstance(node, StringNode):
-            return p_state.run(self.exec_string_node(node))
+            return self.exec_string_node(node)
 
         elif isinstance(node, IDNode):
-            return p_state.run(self.exec_id_node(node, scope))
+            return self.exec_id_node(node, scope)
 
         elif isinstance(node, BooleanNode):
-            return p_state.run(self.exec_bool_node(node))
+            return self.exec_bool_node(node)
 
         elif isinstance(node, ListNode):
-            return p_state.run(self.exec_list_node(node, scope))
+            return self.exec_list_node(node, scope)
 
         elif isinstance(node, ParamNode):
-            return p_state.run(self.exec_param_node(node, scope))
+            return self.exec_param_node(node, scope)
 
         elif isinstance(node, AssignOpNode):
-            return p_state.run(self.exec_assign_op_node(node, scope))
+            return self.exec_assign_op_node(node, scope)
 
         elif isinstance(node, VarNode):
-            return p_state.run(self.exec_var_node(node, scope))
+            return self.exec_var_node(node, scope)
 
         elif isinstance(node, ReturnNode):
-            return p_state.run(self.exec_return_node(node, scope))
+            return self.exec_return_node(node, scope)
 
         elif isinstance(node, FuncNode):
-            return p_state.run(self.exec_func_node(node, scope))
+            return self.exec_func_node(node, scope)
 
         elif isinstance(node, CallNode):
-            return p_state.run(self.exec_call_node(node, scope))
+            return self.exec_call_node(node, scope)
 
         elif isinstance(node, ConditionsNode):
-            return p_state.run(self.exec_condition_node(node, scope))
+            return self.exec_condition_node(node, scope)
 
         elif isinstance(node, CompareOpNode):
-            return p_state.run(self.exec_compare_op_node(node, scope))
+            return self.exec_compare_op_node(node, scope)
 
         elif isinstance(node, BinaryOpNode):
-            return p_state.run(self.exec_binary_op_node(node, scope))
+            return self.exec_binary_op_node(node, scope)
 
         elif isinstance(node, PrintNode):
-            return p_state.run(self.exec_print_node(node, scope))
+            return self.exec_print_node(node, scope)
 
-        return p_state.fail(
+        raise ErrorSignal(
             NotImplementedError(
                 f"Method for function '{type(node).__name__}' is not implemented",
-                node.token.pos,
+                scope.locate(node),
             )
         )
 
     @debug_log("Program.iter")
     def iter(
-        self, items: List[BaseNode], scope: Scope, output: Optional[List] = None
-    ) -> ProgramState:
+        self,
+        items: List[BaseNode],
+        scope: Scope,
+        output: Optional[List] = None,
+        positions: Optional[List[Position]] = None,
+        occurrences: Optional[List[PositionTable]] = None,
+    ) -> List:
         """Iterate recursively over given nodes.
 
         Args:
             items: List of nodes to iterate over.
             scope: Current Program scope.
             output: Optional list of outputs. Defaults to None.
+            positions: Optional Positions of the nodes. Defaults to None.
+            occurrences: Optional PositionTables of the nodes. Defaults to None.
 
         Returns:
-            ProgramState containing either the Result on successfull
-            executing of the Program state, or an Error if the Program
-            state failed while executing the Program state.
+            List containing the results of the nodes.
+
+        Raises:
+            ErrorSignal: With the Error raised by one of the nodes,
+                located at the statement being executed.
         """
-        p_state = ProgramState()
         output = list() if output is None else output
 
         if len(items) <= 0:
-            return p_state.success(output)
-
-        result = p_state.add(self.exec(items[0], scope))
-        if p_state.failed():
-            return p_state
-
-        # Check if the result of the nodes
-        # is already determined, because for
-        # example an 'early return' or 'break'
-        if scope.result is not None:
-            return p_state.success(output)
-
-        return self.iter(items[1:], scope, output + [result])
+            return output
+
+        # Keep track of the statement being executed, to
+        # locate the Errors of (position-independent) shared nodes
+        if positions is not None:
+            scope.pos = positions[0]
+        if occurrences is not None:
+            scope.occurrences = occurrences[0]
+
+        try:
+            result = self.eval(items[0], scope)
+        except ErrorSignal as signal:
+            signal.error.locate(scope.pos)
+            raise
+
+        return self.iter(
+            items[1:],
+            scope,
+            output + [result],
+            positions[1:] if positions is not None else None,
+            occurrences[1:] if occurrences is not None else None,
+        )
 
     @debug_log("Program.exec_number_node")
-    def exec_number_node(self, node: NumberNode) -> ProgramState:
+    def exec_number_node(self, node: NumberNode) -> Value:
         """Execute a Number node.
 
         Turn the given NumberNode into a Program Value.
@@ -589,12 +1315,12 @@ class Program:
             node: NumberNode to execute.
 
         Returns:
-            ProgramState containing the generated Value.
+            The generated Value.
         """
-        return ProgramState().success(Value(node.token.value, node))
+        return Value(node.value, node)
 
     @debug_log("Program.exec_string_node")
-    def exec_string_node(self, node: StringNode) -> ProgramState:
+    def exec_string_node(self, node: StringNode) -> Value:
         """Execute a StringNode.
 
         Turn the given StringNode into a Program Value.
@@ -603,41 +1329,42 @@ class Program:
             node: StringNode to execute.
 
         Returns:
-            ProgramState containing the generated Value.
+            The generated Value.
         """
-        return ProgramState().success(Value(node.token.value, node))
+        return Value(node.value, node)
 
     @debug_log("Program.exec_id_node")
-    def exec_id_node(self, node: IDNode, scope: Scope) -> ProgramState:
+    def exec_id_node(
+        self, node: IDNode, scope: Scope
+    ) -> Union[Value, Function, Empty, None]:
         """Execute an IDNode.
 
         Get the a Variable value from the current
-        ProgramState, and return it's Value if found,
+        scope, and return it's Value if found,
         while using the given IDNode as an Identifier.
 
         Args:
             node: IDNode to execute.
 
         Returns:
-            ProgramState containing the generated Value,
-            or a RunTimeError if the variable couldn't be found
-            within the current ProgramState.
-        """
-        p_state = ProgramState()
+            The Value of the variable.
 
-        if not scope.exist(node.value):
-            return p_state.fail(
+        Raises:
+            ErrorSignal: With a RunTimeError if the variable
+                couldn't be found within the current scope.
+        """
+        if not scope.exist(node.symbol):
+            raise ErrorSignal(
                 RunTimeError(
                     f"'{node.value}' doesn't exist within scope '{scope.name}'",
-                    node.token.pos,
+                    scope.locate(node),
                 )
             )
 
-        value = scope.get(node.value)
-        return p_state.success(value)
+        return scope.get(node.symbol)
 
     @debug_log("Program.exec_bool_node")
-    def exec_bool_node(self, node: BooleanNode) -> ProgramState:
+    def exec_bool_node(self, node: BooleanNode) -> Value:
         """Execute a BooleanNode.
 
         Turn the given BooleanNode into a Program Value.
@@ -646,27 +1373,24 @@ class Program:
             node: BooleanNode to execute.
 
         Returns:
-            ProgramState containing the generated Value,
-            or a RunTimeError if the given node contains
-            an invalid Boolean Value (not True/False).
-        """
-        p_state = ProgramState()
+            The generated Value.
 
+        Raises:
+            ErrorSignal: With a RunTimeError if the given node contains
+                an invalid Boolean Value (not True/False).
+        """
         if node.value == "true":
-            return p_state.success(Value(True, node))
+            return Value(True, node)
 
         elif node.value == "false":
-            return p_state.success(Value(False, node))
+            return Value(False, node)
 
-        else:
-            return p_state.fail(
-                RunTimeError(
-                    f"'{node.value}' isn't a valid boolean value", node.token.pos
-                )
-            )
+        raise ErrorSignal(
+            RunTimeError(f"'{node.value}' isn't a valid boolean value", node.pos)
+        )
 
     @debug_log("Program.exec_list_node")
-    def exec_list_node(self, node: ListNode, scope: Scope) -> ProgramState:
+    def exec_list_node(self, node: ListNode, scope: Scope) -> List:
         """Execute a ListNode.
 
         Execute a ListNode by iterating over
@@ -676,26 +1400,25 @@ class Program:
             node: ListNode to execute.
 
         Returns:
-            ProgramState containing the generated results,
-            or a RunTimeError if the given node was empty
-            or not an instance of a list.
-        """
-        p_state = ProgramState()
+            List containing the generated results.
 
+        Raises:
+            ErrorSignal: With a RunTimeError if the given node
+                was empty or not an instance of a list.
+        """
         if not isinstance(node.items, list):
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(
-                    "Couldn't iterate over an empty 'ListNode'", node.token.pos
+                    "Couldn't iterate over an empty 'ListNode'", scope.locate(node)
                 )
             )
 
-        result = p_state.add(self.iter(node.items, scope))
-        if p_state.failed():
-            return p_state
-        return p_state.success(result)
+        return self.iter(
+            node.items, scope, positions=node.positions, occurrences=node.occurrences
+        )
 
     @debug_log("Program.exec_param_node")
-    def exec_param_node(self, node: ParamNode, scope: Scope) -> ProgramState:
+    def exec_param_node(self, node: ParamNode, scope: Scope) -> Empty:
         """Execute a ParamNode.
 
         Execute a ParamNode to set any params
@@ -709,29 +1432,31 @@ class Program:
             node: ParamNode to execute.
 
         Returns:
-            ProgramState containing the generated parameter,
-            or a RunTimeError if the given parameter node
-            was already defined within the current scope.
-        """
-        p_state = ProgramState()
+            The generated parameter.
 
-        if scope.exist(node.value):
-            return p_state.fail(
+        Raises:
+            ErrorSignal: With a RunTimeError if the given parameter
+                node was already defined within the current scope.
+        """
+        if scope.exist(node.symbol):
+            raise ErrorSignal(
                 RunTimeError(
                     f"'{node.value}' is already defined within scope '{scope.name}'"
                 )
             )
 
         param = Empty(node)
-        scope.set(node.value, param)
-        return p_state.success(param)
+        scope.set(node.symbol, param)
+        return param
 
     @debug_log("Program.exec_assign_op_node")
-    def exec_assign_op_node(self, node: AssignOpNode, scope: Scope) -> ProgramState:
+    def exec_assign_op_node(
+        self, node: AssignOpNode, scope: Scope
+    ) -> Union[Value, Empty]:
         """Execute an AssignOpNode.
 
         Perform an Assign Operation based
-        on the token stored within.
+        on the kind of the node.
 
         Args:
             node: AssignOpNode to execute.
@@ -745,24 +1470,20 @@ class Program:
             ```
 
         Returns:
-            ProgramState containing the generated results,
-            or a InvalidSyntaxError if the given syntax
-            of the Assign Operation isn't a valid or known.
-        """
-        p_state = ProgramState()
+            The generated result.
 
+        Raises:
+            ErrorSignal: With a InvalidSyntaxError if the given syntax
+                of the Assign Operation isn't a valid or known.
+        """
         # Try to retrieve initial 'value' of
         # set 'variable' with the given 'IDNode'
-        lhs = p_state.add(self.exec_id_node(node.id, scope))
-        if p_state.failed():
-            return p_state
+        lhs = self.exec_id_node(node.id, scope)
 
         # Execute the expression, stored within
         # the 'value' field of the given 'AssignOpNode',
         # to generate the rhs of this expression
-        rhs = p_state.add(self.exec(node.value, scope))
-        if p_state.failed():
-            return p_state
+        rhs = self.eval(node.value, scope)
 
         # If either 'lhs' or 'rhs'
         # are an instance of 'Empty',
@@ -770,57 +1491,58 @@ class Program:
         # indicates that the value acts as
         # a param/placeholder for a function
         if isinstance(lhs, Empty) or isinstance(rhs, Empty):
-            return p_state.success(lhs)
+            return lhs
 
         result = None
 
         # Perform the operation, based on the oper Token
-        if isinstance(node.token, AssignAddToken):
+        if node.kind == TokenKind.ASSIGN_ADD:
             result = lhs + rhs
             if not isinstance(result, Value):
-                return p_state.fail(InvalidSyntaxError(f"Can't add {lhs} to {rhs}"))
+                raise ErrorSignal(InvalidSyntaxError(f"Can't add {lhs} to {rhs}"))
 
-        elif isinstance(node.token, AssignSubToken):
+        elif node.kind == TokenKind.ASSIGN_SUB:
             result = lhs - rhs
             if not isinstance(result, Value):
-                return p_state.fail(
+                raise ErrorSignal(
                     InvalidSyntaxError(f"Can't substract {lhs} from {rhs}")
                 )
 
-        elif isinstance(node.token, AssignMulToken):
+        elif node.kind == TokenKind.ASSIGN_MUL:
             result = lhs * rhs
             if not isinstance(result, Value):
-                return p_state.fail(
+                raise ErrorSignal(
                     InvalidSyntaxError(f"Can't multiply {lhs} by {rhs}")
                 )
 
-        elif isinstance(node.token, AssignDivToken):
+        elif node.kind == TokenKind.ASSIGN_DIV:
             # Validate the 'Right-hand side'
             # on 'Zero-division' before
             # performing the division operation
             if rhs.value == 0:
-                return p_state.fail(
+                raise ErrorSignal(
                     ZeroDivisionError(
-                        f"Can't divide the 'Left-hand side' with zero", node.token.pos
+                        f"Can't divide the 'Left-hand side' with zero",
+                        scope.locate(node),
                     )
                 )
 
             result = lhs / rhs
             if not isinstance(result, Value):
-                return p_state.fail(
+                raise ErrorSignal(
                     InvalidSyntaxError(f"Can't devide {lhs} from {rhs}")
                 )
 
         else:
-            return p_state.fail(InvalidSyntaxError("Expected '=+', '=-', '=*', '=/'"))
+            raise ErrorSignal(InvalidSyntaxError("Expected '=+', '=-', '=*', '=/'"))
 
         # Store the result within the given 'scope'
-        scope.set(node.id.value, result)
+        scope.set(node.id.symbol, result)
 
-        return p_state.success(result)
+        return result
 
     @debug_log("Program.exec_var_node")
-    def exec_var_node(self, node: VarNode, scope: Scope) -> ProgramState:
+    def exec_var_node(self, node: VarNode, scope: Scope) -> Any:
         """Execute an VarNode.
 
         Assign a variable with the given value.
@@ -829,154 +1551,237 @@ class Program:
             node: VarNode to execute.
 
         Returns:
-            ProgramState containing the generated results,
-            or a InvalidSyntaxError if the given syntax
-            of the Assign Operation isn't a valid or known.
+            The assigned value.
         """
-        p_state = ProgramState()
-
         # Execute the expression, stored within
         # the 'value' field of the given 'VarNode',
         # to generate the result of this expression
-        value = p_state.add(self.exec(node.value, scope))
-        if p_state.failed():
-            return p_state
+        value = self.eval(node.value, scope)
 
         # Store the variable within the given 'scope'
-        scope.set(node.id.value, value)
+        scope.set(node.id.symbol, value)
 
-        return p_state.success(value)
+        return value
 
     @debug_log("Program.exec_return_node")
-    def exec_return_node(self, node: ReturnNode, scope: Scope) -> ProgramState:
+    def exec_return_node(self, node: ReturnNode, scope: Scope) -> Any:
         """Execute an ReturnNode.
 
-        Return a value from a function.
+        Return a value from a function, by raising it as a
+        'ReturnSignal' that's caught by the enclosing call.
 
         Args:
             node: ReturnNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The returned value, when it's None.
 
+        Raises:
+            ReturnSignal: With the returned value.
+        """
         # Execute the expression, stored within
         # the 'return_value' field of the given 'ReturnNode',
         # to generate the 'return_value' of this expression
-        return_value = p_state.add(self.exec(node.return_value, scope))
-        if p_state.failed():
-            return p_state
+        return_value = self.eval(node.return_value, scope)
         scope.result = return_value
-        return p_state.success(return_value)
+
+        # Returning nothing (like an inline call of a function
+        # that isn't defined just yet) doesn't determine the
+        # result, so the next statements are still executed
+        if return_value is None:
+            return return_value
+
+        raise ReturnSignal(return_value)
 
     @debug_log("Program.exec_func_node")
-    def exec_func_node(self, node: FuncNode, scope: Scope) -> ProgramState:
+    def exec_func_node(self, node: FuncNode, scope: Scope) -> Function:
         """Execute an FunctionNode.
 
+        The Function is defined without executing it's body, which
+        is only checked statically (see 'check_func_node').
+
         Args:
             node: FuncNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The defined Function.
 
+        Raises:
+            ErrorSignal: With a RunTimeError if the Function already
+                exist, or if it's definition is invalid.
+        """
         # Check if 'function' is already exist
         # within the given 'scope', as their
         # shouldn't be multiple definitions
-        if scope.exist(node.name):
-            return p_state.fail(
+        if scope.exist(node.symbol):
+            raise ErrorSignal(
                 RunTimeError(f"Function with name '{node.name}' already exist")
             )
 
-        func_scope = Scope(name=f"<Function: '{node.name}'>", origin=node, outer=scope)
+        self.check_func_node(node, scope.occurrences)
+        self.shadowed.update(node.bound)
 
-        if isinstance(node.args, ListNode) and node.args.items is not None:
-            _ = p_state.add(self.exec_list_node(node.args, func_scope))
-            if p_state.failed():
-                return p_state
+        # Bind the hoisted Function, when defining a top-level function
+        func = self.functions.get(node.symbol, None)
 
-        _ = p_state.add(self.exec_list_node(node.body, func_scope))
-        if p_state.failed():
-            return p_state
+        if func is None or func.node is not node or scope is not self.root:
+            func_scope = Scope(
+                name=f"<Function: '{node.name}'>", origin=node, outer=scope
+            )
+            func = Function(node, node.body, func_scope)
 
-        func = Function(node, node.body, func_scope)
+        scope.set(node.symbol, func)
 
-        scope.set(node.name, func)
+        return func
 
-        return p_state.success(func)
+    @debug_log("Program.check_func_node")
+    def check_func_node(
+        self, node: FuncNode, occurrences: Optional[PositionTable] = None
+    ) -> None:
+        """Statically check the definition of a Function.
 
-    @debug_log("Program.exec_call_node")
-    def exec_call_node(self, node: CallNode, scope: Scope) -> ProgramState:
-        """Execute an CallNode.
+        Checks the parameters and body of the function (and of the
+        functions defined within it), instead of executing the body.
+        Within a call only it's parameters and the variables it
+        sets can be looked up, so any other variable (or call,
+        which isn't inline) within the body can't be resolved.
+        A FuncNode is only checked once, as Nodes don't change.
 
         Args:
-            node: CallNode to execute.
+            node: FuncNode to check.
+            occurrences: PositionTable of the statement containing
+                the definition (and it's parameters). Defaults to None.
 
-        Returns:
-            ProgramState containing the generated results.
+        Raises:
+            ErrorSignal: With a RunTimeError if the definition is invalid.
         """
-        p_state = ProgramState()
-        func = None
+        if node.bound is not None:
+            return
 
-        # Check if the 'function' is
-        # defined within the given 'scope'
-        if not scope.exist(node.name):
-            # Check if the 'function' is
-            # not inline and not available at all
-            if not node.inline:
-                return p_state.fail(
-                    RunTimeError(f"Function with name '{node.name}' isn't defined")
+        name = f"<Function: '{node.name}'>"
+        params = list()
+        if isinstance(node.args, ListNode) and node.args.items is not None:
+            params = node.args.items
+
+        # Check if any of the parameters is defined twice
+        duplicate = next(
+            filter(
+                lambda x: x[1].symbol in map(lambda y: y.symbol, params[: x[0]]),
+                enumerate(params),
+            ),
+            None,
+        )
+        if duplicate is not None:
+            raise ErrorSignal(
+                RunTimeError(
+                    f"'{duplicate[1].value}' is already defined within scope '{name}'",
+                    locate_node(duplicate[1], node.pos, occurrences),
                 )
+            )
 
-            # Check if the 'function' is
-            # inline and not avaiable just yet
-            func = scope.get_outer(node.name)
-
-            if node.inline and func is None:
-                return p_state.success(None)
+        if not isinstance(node.body.items, list):
+            raise ErrorSignal(
+                RunTimeError("Couldn't iterate over an empty 'ListNode'", node.body.pos)
+            )
 
-        # Else retrieve the definition
-        else:
-            func = scope.get(node.name)
+        # Group the nodes of the body by their class
+        nodes = dict()
+        _ = list(
+            map(
+                lambda x: nodes.setdefault(type(x[0]), list()).append(x),
+                walk_function(node.body),
+            )
+        )
 
-        # Check if the definition
-        # within the given 'scope'
-        # is an actual 'function'
-        if not isinstance(func, Function):
-            return p_state.fail(
-                RunTimeError(f"Can't call '{node.name}' as it isn't a function")
+        # Symbols of the parameters, variables and (nested)
+        # functions which can be bound within a call
+        bound = set(
+            chain(
+                map(lambda x: x.symbol, params),
+                map(
+                    lambda x: x[0].id.symbol,
+                    chain(nodes.get(VarNode, ()), nodes.get(FuncNode, ())),
+                ),
             )
+        )
 
-        # Check if both the arguments
-        # of the 'call' and the 'function'
-        # are equal in size/amount
-        if node.args is None and len(func.params) > 0:
-            return p_state.fail(
+        # Shared nodes are located within the statement containing them
+        unbound = next(
+            filter(lambda x: x[0].symbol not in bound, nodes.get(IDNode, ())), None
+        )
+        if unbound is not None:
+            raise ErrorSignal(
                 RunTimeError(
-                    f"Missing '{len(func.params)}' arguments for function '{func.name}', got '0'"
+                    f"'{unbound[0].value}' doesn't exist within scope '{name}'",
+                    locate_node(*unbound),
                 )
             )
 
-        elif len(node.args.items) != len(func.params):
-            return p_state.fail(
+        undefined = next(
+            filter(
+                lambda x: not x[0].inline and x[0].symbol not in bound,
+                nodes.get(CallNode, ()),
+            ),
+            None,
+        )
+        if undefined is not None:
+            raise ErrorSignal(
                 RunTimeError(
-                    f"Missing '{len(func.params)}' arguments for function '{func.name}', got '{len(node.args.items)}'"
+                    f"Function with name '{undefined[0].name}' isn't defined",
+                    locate_node(*undefined),
                 )
             )
 
+        # Check the functions defined within the body
+        _ = list(
+            map(lambda x: self.check_func_node(x[0], x[2]), nodes.get(FuncNode, ()))
+        )
+
+        node.bound = frozenset(bound)
+
+    @debug_log("Program.exec_call_node")
+    def exec_call_node(self, node: CallNode, scope: Scope) -> Any:
+        """Execute an CallNode.
+
+        Args:
+            node: CallNode to execute.
+
+        Returns:
+            The returned value of the called Function.
+
+        Raises:
+            ErrorSignal: With a RunTimeError if the Function
+                can't be called, or with the Error raised
+                while executing the Function.
+        """
+        # Call the Function cached by the call, if it's still valid
+        func = None if self.call_cache is None else self.call_cache.get(node, scope)
+
+        if func is None:
+            func = self.resolve_call(node, scope)
+
+            if func is None:
+                return None
+
         # Execute the expressions of
         # the param arguments of the
         # 'call', to build the input
         # params of the 'function'
-        call_args = p_state.add(self.exec_list_node(node.args, scope))
-        if p_state.failed():
-            return p_state
+        call_args = self.exec_list_node(node.args, scope)
 
         # Stich everything back togeter
         # to define the input params
-        func_args = dict(zip(func.params, call_args))
+        func_args = dict(zip(func.symbols, call_args))
+
+        # Prevent the call from going deeper
+        # than the allowed maximum call depth
+        if len(self.frames) >= self.max_depth:
+            raise ErrorSignal(
+                RunTimeError(
+                    f"Maximum call depth of '{self.max_depth}' exceeded while calling '{node.name}'",
+                    scope.locate(node),
+                )
+            )
 
         # Define a new 'scope' for this
         # instance of the 'function call'
@@ -986,12 +1791,13 @@ class Program:
             origin=node,
             outer=scope,
         )
-        call_scope.depth += 1
+        call_scope.depth = scope.depth + 1
 
-        # Run the body of the 'function'
-        _ = p_state.add(self.exec_list_node(func.body, call_scope))
-        if p_state.failed():
-            return p_state
+        # Run the body of the 'function',
+        # while the call is on the call stack
+        frame = Frame(node.name, scope.locate(node), call_scope)
+        _ = self.exec_frame(frame, func.body)
+        call_scope.close()
 
         # self.__show(node, call_scope)
 
@@ -1003,61 +1809,210 @@ class Program:
             # Check if the function even has
             # a 'returned value' specified
             if call_scope.result is None:
-                return p_state.fail(
+                raise ErrorSignal(
                     RunTimeError(f"Function '{node.name}' doesn't have a return value")
                 )
 
             # Before setting the 'scope' arg,
             # prevent any overwrite of anything
             # that is not a 'value' (like a 'function')
-            if scope.exist(node.result.name):
-                value = scope.get(node.result.name)
+            if scope.exist(node.result.symbol):
+                value = scope.get(node.result.symbol)
 
                 if value is not None and not isinstance(value, (Value, Empty)):
-                    return p_state.fail(
+                    raise ErrorSignal(
                         RunTimeError(f"Can't override '{value.__class__.__name__}'")
                     )
 
-            scope.set(node.result.name, call_scope.result)
+            scope.set(node.result.symbol, call_scope.result)
+
+        return call_scope.result
+
+    def lookup_function(self, node: CallNode, scope: Scope) -> Optional[Function]:
+        """Look up the Function called by a CallNode within the function table.
+
+        A hoisted Function can only be called once it's defined
+        (within the root scope). Within a call it's only looked up
+        through the table when the call is inline, and when none
+        of the calls (in between) could bind it's name.
+
+        Args:
+            node: CallNode to look up the Function of.
+            scope: Scope the call is executed in.
+
+        Returns:
+            The hoisted Function, or None when it has to be looked
+            up through the scopes instead.
+        """
+        func = self.functions.get(node.symbol, None)
+
+        if func is None or self.root.args.get(node.symbol, None) is not func:
+            return None
+
+        if scope is self.root or node.inline and node.symbol not in self.shadowed:
+            return func
+
+        return None
 
-        return p_state.success(call_scope.result)
+    @debug_log("Program.resolve_call")
+    def resolve_call(self, node: CallNode, scope: Scope) -> Optional[Function]:
+        """Look up (and validate) the Function called by a CallNode.
+
+        The found Function is cached by the CallNode
+        (see 'CallCache'), when caching the calls is enabled.
+
+        Args:
+            node: CallNode to look up the Function of.
+            scope: Scope the call is executed in.
+
+        Returns:
+            The called Function, or None if the call is
+            inline and the Function isn't available just yet.
+
+        Raises:
+            ErrorSignal: With a RunTimeError if the Function can't be called.
+        """
+        # Look up the Function within the function table first
+        func = self.lookup_function(node, scope)
+
+        # Check if the 'function' is
+        # defined within the given 'scope'
+        if func is None and not scope.exist(node.symbol):
+            # Check if the 'function' is
+            # not inline and not available at all
+            if not node.inline:
+                raise ErrorSignal(
+                    RunTimeError(f"Function with name '{node.name}' isn't defined")
+                )
+
+            # Check if the 'function' is
+            # inline and not avaiable just yet
+            func = None if scope.outer is None else scope.outer.find(node.symbol)
+
+            if not isinstance(func, Function):
+                return None
+
+        # Else retrieve the definition
+        elif func is None:
+            func = scope.find(node.symbol)
+
+        # Check if the definition
+        # within the given 'scope'
+        # is an actual 'function'
+        if not isinstance(func, Function):
+            raise ErrorSignal(
+                RunTimeError(f"Can't call '{node.name}' as it isn't a function")
+            )
+
+        # Check if both the arguments
+        # of the 'call' and the 'function'
+        # are equal in size/amount
+        if node.args is None and len(func.params) > 0:
+            raise ErrorSignal(
+                RunTimeError(
+                    f"Missing '{len(func.params)}' arguments for function '{func.name}', got '0'"
+                )
+            )
+
+        elif len(node.args.items) != len(func.params):
+            raise ErrorSignal(
+                RunTimeError(
+                    f"Missing '{len(func.params)}' arguments for function '{func.name}', got '{len(node.args.items)}'"
+                )
+            )
+
+        # The Function itself is cached (instead of a copy),
+        # as calling it doesn't change the Function
+        if self.call_cache is not None:
+            node.cache = (BINDINGS.version, func)
+
+        return func
+
+    @debug_log("Program.exec_frame")
+    def exec_frame(self, frame: Frame, body: ListNode) -> Any:
+        """Execute the body of a function call within the given Frame.
+
+        The Frame is pushed on the call stack while executing
+        the body, and popped again once the body has returned
+        (or raised an Error). When the interpreter itself
+        runs out of Python frames, the outermost call turns the
+        'RecursionError' into a RunTimeError, with the
+        Position of the innermost call.
+
+        Args:
+            frame: Frame of the function call.
+            body: Body of the called function.
+
+        Returns:
+            The returned value of the function call.
+
+        Raises:
+            ErrorSignal: With the Error raised while executing the body.
+        """
+        depth = len(self.frames)
+        self.frames.append(frame)
+
+        try:
+            _ = self.exec_list_node(body, frame.scope)
+
+        except ReturnSignal:
+            pass
+
+        except RecursionError:
+            if depth > 0:
+                raise
+
+            innermost = self.frames[-1]
+            error = RunTimeError(
+                f"Ran out of stack at call depth '{len(self.frames)}' while calling '{innermost.name}'",
+                innermost.pos,
+            )
+            del self.frames[depth:]
+            raise ErrorSignal(error)
+
+        except ErrorSignal:
+            self.frames.pop()
+            raise
+
+        self.frames.pop()
+        return frame.scope.result
 
     @debug_log("Program.exec_condition_node")
-    def exec_condition_node(self, node: ConditionsNode, scope: Scope) -> ProgramState:
+    def exec_condition_node(self, node: ConditionsNode, scope: Scope) -> Any:
         """Execute an ConditionsNode.
 
         Args:
             node: ConditionsNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The result of the condition, or of the performed action.
 
+        Raises:
+            ErrorSignal: With an InvalidSyntaxError or RunTimeError
+                if the conditions or their result are invalid.
+        """
         if not isinstance(node.conditions, (CompareOpNode, ListNode)):
-            return p_state.fail(
+            raise ErrorSignal(
                 InvalidSyntaxError(
-                    f"Invalid conditions ({node.conditions})", node.token.pos
+                    f"Invalid conditions ({node.conditions})", scope.locate(node)
                 )
             )
 
-        result = p_state.add(self.exec(node.conditions, scope))
-        if p_state.failed():
-            return p_state
+        result = self.eval(node.conditions, scope)
 
         # Validate if the Result isn't 'None'
         if result is None:
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(f"Condition {node} caused an invalid result: '{result}'")
             )
 
         # Validate if the 'True' action is available
-        # otherwise give back a 'failed' state
+        # otherwise raise an Error
         if node.result is None:
-            return p_state.fail(
+            raise ErrorSignal(
                 InvalidSyntaxError(
                     f"No 'True' or 'left-hand side' action was specified for if-statement",
-                    node.token.pos,
+                    scope.locate(node),
                 )
             )
 
@@ -1068,59 +2023,64 @@ class Program:
             # Before setting the 'scope' arg,
             # prevent any overwrite of anything
             # that is not a 'value' (like a 'function')
-            if scope.exist(node.result.name):
-                value = scope.get(node.result.name)
+            if scope.exist(node.result.symbol):
+                value = scope.get(node.result.symbol)
 
                 if value is not None and not isinstance(value, (Value, Empty)):
-                    return p_state.fail(
+                    raise ErrorSignal(
                         RunTimeError(f"Can't override '{value.__class__.__name__}'")
                     )
 
-            scope.set(node.result.name, result)
-            return p_state.success(result)
+            scope.set(node.result.symbol, result)
+            return result
 
         # Perform 'left-hand' action if condition was 'True'
         if result:
-            return p_state.run(self.exec(node.result, scope))
+            return self.eval(node.result, scope)
 
         # Otherwise perform the 'right-hand' action
         # if the condition was 'False' and not 'None'
         elif not result and node.other is not None:
-            return p_state.run(self.exec(node.other, scope))
+            return self.eval(node.other, scope)
 
-        return p_state.success(result)
+        return result
 
     @debug_log("Program.exec_compare_op_node")
-    def exec_compare_op_node(self, node: CompareOpNode, scope: Scope) -> ProgramState:
+    def exec_compare_op_node(self, node: CompareOpNode, scope: Scope) -> Any:
         """Execute an CompareOpNode.
 
         Args:
             node: CompareOpNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The result of the comparison.
 
+        Raises:
+            ErrorSignal: With a RunTimeError or InvalidSyntaxError
+                if both sides can't be compared.
+        """
         # Execute the 'left-hand side'
         if node.lhs is None:
-            return p_state.fail(
-                RunTimeError(f"Can't compare ({node.lhs})", node.token.pos)
+            raise ErrorSignal(
+                RunTimeError(f"Can't compare ({node.lhs})", scope.locate(node))
             )
 
-        lhs = p_state.add(self.exec(node.lhs, scope))
-        if p_state.failed():
-            return p_state
+        lhs = self.eval(node.lhs, scope)
 
         # Execute the 'right-hand side'
         if node.rhs is None:
-            return p_state.fail(
-                RunTimeError(f"Can't compare ({node.rhs})", node.token.pos)
+            raise ErrorSignal(
+                RunTimeError(f"Can't compare ({node.rhs})", scope.locate(node))
             )
 
-        rhs = p_state.add(self.exec(node.rhs, scope))
-        if p_state.failed():
-            return p_state
+        rhs = self.eval(node.rhs, scope)
+
+        # Perform the comparison through the Specialization of
+        # the node, as long as the operands still pass it's guard
+        if self.quickening is not None:
+            result = self.quickening.run(node, lhs, rhs)
+            if result is not None:
+                return result
 
         # If either 'lhs' or 'rhs'
         # are an instance of 'Empty',
@@ -1128,95 +2088,78 @@ class Program:
         # indicates that the value acts as
         # a param/placeholder for a function
         if isinstance(lhs, Empty) or isinstance(rhs, Empty):
-            return p_state.success(lhs)
+            return lhs
 
         # Validate if the results from
         # both sides are the same data type,
         # before making an comparation
         if isinstance(lhs, Value) and not isinstance(rhs, Value):
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(f"Can't compare a 'Value' to '{type(rhs).__name__}'")
             )
 
         elif not isinstance(lhs, Value) and isinstance(rhs, Value):
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(f"Can't compare a '{type(lhs).__name__}' to 'Value'")
             )
 
-        # Peform the operation, based on the Token
-        if isinstance(node.token, EqualToken):
-            result = lhs == rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, NotEqualToken):
-            result = lhs != rhs
-            if result is not None:
-                return p_state.success(result)
+        # Look up the operation, based on the kind of the Token
+        compare = COMPARE_OPS.get(node.kind, None)
 
-        elif isinstance(node.token, GreaterToken):
-            result = lhs > rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, GreaterOrEqualToken):
-            result = lhs >= rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, LessToken):
-            result = lhs < rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, LessOrEqualToken):
-            result = lhs <= rhs
-            if result is not None:
-                return p_state.success(result)
-
-        else:
-            return p_state.fail(
+        if compare is None:
+            raise ErrorSignal(
                 InvalidSyntaxError(
-                    f"'{node.token.value}' isn't a valid comparetion operator",
-                    node.token.pos,
+                    f"'{node.op}' isn't a valid comparetion operator",
+                    scope.locate(node),
                 )
             )
 
-        return p_state.fail(
-            InvalidSyntaxError(f"Can't compare '{lhs}' to '{rhs}'", node.token.pos)
+        result = compare(lhs, rhs)
+        if result is not None:
+            if self.quickening is not None:
+                self.quickening.specialize(node, lhs, rhs)
+            return result
+
+        raise ErrorSignal(
+            InvalidSyntaxError(f"Can't compare '{lhs}' to '{rhs}'", scope.locate(node))
         )
 
     @debug_log("Program.exec_binary_op_node")
-    def exec_binary_op_node(self, node: BinaryOpNode, scope: Scope) -> ProgramState:
+    def exec_binary_op_node(self, node: BinaryOpNode, scope: Scope) -> Any:
         """Execute an BinaryOpNode.
 
         Args:
             node: BinaryOpNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The result of the operation.
 
+        Raises:
+            ErrorSignal: With a RunTimeError, ZeroDivisionError or
+                NotImplementedError if the operation can't be performed.
+        """
         # Execute the 'left-hand side'
         if node.lhs is None:
-            return p_state.fail(
-                RunTimeError(f"Can't compare ({node.lhs})", node.token.pos)
+            raise ErrorSignal(
+                RunTimeError(f"Can't compare ({node.lhs})", scope.locate(node))
             )
 
-        lhs = p_state.add(self.exec(node.lhs, scope))
-        if p_state.failed():
-            return p_state
+        lhs = self.eval(node.lhs, scope)
 
         # Execute the 'right-hand side'
         if node.rhs is None:
-            return p_state.fail(
-                RunTimeError(f"Can't compare ({node.rhs})", node.token.pos)
+            raise ErrorSignal(
+                RunTimeError(f"Can't compare ({node.rhs})", scope.locate(node))
             )
 
-        rhs = p_state.add(self.exec(node.rhs, scope))
-        if p_state.failed():
-            return p_state
+        rhs = self.eval(node.rhs, scope)
+
+        # Perform the operation through the Specialization of
+        # the node, as long as the operands still pass it's guard
+        if self.quickening is not None:
+            result = self.quickening.run(node, lhs, rhs)
+            if result is not None:
+                return result
 
         # If either 'lhs' or 'rhs'
         # are an instance of 'Empty',
@@ -1224,95 +2167,84 @@ class Program:
         # indicates that the value acts as
         # a param/placeholder for a function
         if isinstance(lhs, Empty) or isinstance(rhs, Empty):
-            return p_state.success(lhs)
+            return lhs
 
         # Validate if the results from
         # both sides are the same data type,
         # before making an calculation operations
         if isinstance(lhs, Value) and not isinstance(rhs, Value):
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(f"Can't calculate a 'Value' with a '{type(rhs).__name__}'")
             )
 
         elif not isinstance(lhs, Value) and isinstance(rhs, Value):
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(f"Can't calculate a '{type(lhs).__name__}' with a 'Value'")
             )
 
-        # Peform the operation, based on the Token
-        if isinstance(node.token, AddToken):
-            result = lhs + rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, SubToken):
-            result = lhs - rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, MulToken):
-            result = lhs * rhs
-            if result is not None:
-                return p_state.success(result)
-
-        elif isinstance(node.token, DivToken):
-            # Validate the 'Right-hand side'
-            # on 'Zero-division' before
-            # performing the division operation
-            if rhs.value == 0:
-                return p_state.fail(
-                    ZeroDivisionError(
-                        f"Can't divide the 'Left-hand side' with zero", node.token.pos
-                    )
+        # Look up the operation, based on the kind of the Token
+        calculate = MATH_OPS.get(node.kind, None)
+
+        # Validate the 'Right-hand side'
+        # on 'Zero-division' before
+        # performing the division operation
+        if node.kind == TokenKind.DIV and rhs.value == 0:
+            raise ErrorSignal(
+                ZeroDivisionError(
+                    f"Can't divide the 'Left-hand side' with zero",
+                    scope.locate(node),
                 )
+            )
 
-            result = lhs / rhs
-            if result is not None:
-                return p_state.success(result)
+        result = calculate(lhs, rhs) if calculate is not None else None
+        if result is not None:
+            if self.quickening is not None:
+                self.quickening.specialize(node, lhs, rhs)
+            return result
 
-        return p_state.fail(
+        raise ErrorSignal(
             NotImplementedError(
-                f"No 'Binary Operation' is implemented for '{type(node.token).__name__}'",
-                node.token.pos,
+                f"No 'Binary Operation' is implemented for '{node.op}'",
+                scope.locate(node),
             )
         )
 
     @debug_log("Program.exec_print_node")
-    def exec_print_node(self, node: PrintNode, scope: Scope) -> ProgramState:
+    def exec_print_node(self, node: PrintNode, scope: Scope) -> Union[Value, Empty]:
         """Execute an PrintNode.
 
         Args:
             node: PrintNode to execute.
 
         Returns:
-            ProgramState containing the generated results.
-        """
-        p_state = ProgramState()
+            The printed value.
 
+        Raises:
+            ErrorSignal: With a RunTimeError if the value can't be printed.
+        """
         if not isinstance(node.to_print, (NumberNode, StringNode, IDNode)):
-            return p_state.fail(
-                RunTimeError(f"Can't print '{node.to_print.value}'", node.token.pos)
+            raise ErrorSignal(
+                RunTimeError(f"Can't print '{node.to_print.value}'", scope.locate(node))
             )
 
-        print_value = p_state.add(self.exec(node.to_print, scope))
-        if p_state.failed():
-            return p_state
+        print_value = self.eval(node.to_print, scope)
 
         if not isinstance(print_value, (Value, Empty)):
-            if hasattr(print_value, "token"):
-                return p_state.fail(
+            if isinstance(print_value, BaseNode):
+                raise ErrorSignal(
                     RunTimeError(
-                        f"Can't print '{print_value.value}'", print_value.token.pos
+                        f"Can't print '{print_value.value}'", scope.locate(print_value)
                     )
                 )
 
-            return p_state.fail(
+            raise ErrorSignal(
                 RunTimeError(
-                    f"Can't print '{print_value.value}'", print_value.node.token.pos
+                    f"Can't print '{print_value.value}'",
+                    scope.locate(print_value.node),
                 )
             )
 
         elif isinstance(print_value, Value):
-            print(print_value)
+            self.output.write(f"{print_value}\n")
 
-        return p_state.success(print_value)
+        return print_value
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from typing import Any, List, Union
+
+# Minimal length of a string concatenated as a Rope, as
+# shorter strings are faster to concatenate directly
+ROPE_LENGTH = 256
+
+
+class Rope:
+    """A string built by concatenation.
+
+    Stores the concatenated strings as a list of chunks, instead of
+    copying both strings on every concatenation. The chunks are shared
+    with the Rope it's concatenated into: when a Rope is the last one
+    appended to it's chunks, the next string is appended to the same
+    list, and the new Rope only owns one more chunk of it. So building
+    a string by appending to it over and over is linear, instead of
+    quadratic, within it's length. Otherwise (when an older Rope is
+    concatenated again), the owned chunks are copied first.
+
+    The chunks are only joined into an actual string (flattened) once
+    the Rope is printed or compared, which is cached afterwards.
+
+    Attributes:
+        chunks: Chunks of the string, shared with the other Ropes.
+        count: Amount of chunks (from the start) owned by the Rope.
+        length: Length of the string.
+        text: The flattened string, or None if it isn't flattened yet.
+    """
+
+    __slots__ = ("chunks", "count", "length", "text")
+
+    def __init__(self, chunks: List[str], count: int, length: int):
+        """Initialise the Rope.
+
+        Args:
+            chunks: Chunks of the string, shared with the other Ropes.
+            count: Amount of chunks (from the start) owned by the Rope.
+            length: Length of the string.
+        """
+        self.chunks = chunks
+        self.count = count
+        self.length = length
+        self.text = None
+
+    def __str__(self) -> str:
+        return self.flatten()
+
+    def __repr__(self) -> str:
+        # Represented as the string itself, so printing
+        # a Value shows no difference with an actual 'str'
+        return repr(self.flatten())
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __hash__(self) -> int:
+        return hash(self.flatten())
+
+    def __add__(self, rhs: Union[Rope, str]) -> Union[Rope, str]:
+        return concat(self, rhs)
+
+    def __radd__(self, lhs: Union[Rope, str]) -> Union[Rope, str]:
+        return concat(lhs, self)
+
+    def __eq__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() == str(rhs)
+        return NotImplemented
+
+    def __ne__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() != str(rhs)
+        return NotImplemented
+
+    def __gt__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() > str(rhs)
+        return NotImplemented
+
+    def __ge__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() >= str(rhs)
+        return NotImplemented
+
+    def __lt__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() < str(rhs)
+        return NotImplemented
+
+    def __le__(self, rhs: Any) -> bool:
+        if isinstance(rhs, (Rope, str)):
+            return self.flatten() <= str(rhs)
+        return NotImplemented
+
+    def __copy__(self) -> Rope:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Rope:
+        # A Rope is never changed (only the chunks it doesn't own
+        # are), so copying a Value doesn't have to copy the string
+        return self
+
+    def __reduce__(self):
+        return str, (self.flatten(),)
+
+    def flatten(self) -> str:
+        """Join the chunks of the Rope into a string.
+
+        Returns:
+            The (cached) string of the Rope.
+        """
+        if self.text is None:
+            self.text = "".join(self.chunks[: self.count])
+
+            # Continue from the flattened string, so it's
+            # chunks don't have to be joined again later on
+            self.chunks = [self.text]
+            self.count = 1
+
+        return self.text
+
+
+def concat(lhs: Union[Rope, str], rhs: Union[Rope, str]) -> Union[Rope, str]:
+    """Concatenate two strings, as a Rope once it's long enough.
+
+    Args:
+        lhs: The Left-hand side.
+        rhs: The Right-hand side.
+
+    Returns:
+        The concatenated string, which is a Rope if either side is a
+        Rope, or the length of the string reaches the 'ROPE_LENGTH'.
+    """
+    if type(lhs) is str and type(rhs) is str:
+        if len(lhs) + len(rhs) < ROPE_LENGTH:
+            return lhs + rhs
+
+    if len(rhs) == 0:
+        return lhs
+
+    if not isinstance(lhs, Rope):
+        lhs = Rope([lhs], 1, len(lhs))
+
+    chunks = rhs.chunks[: rhs.count] if isinstance(rhs, Rope) else [rhs]
+
+    # Only the last Rope appended to the chunks may append to them,
+    # as the (older) Ropes sharing them only own the chunks before
+    if lhs.count == len(lhs.chunks):
+        lhs.chunks.extend(chunks)
+        return Rope(lhs.chunks, lhs.count + len(chunks), lhs.length + len(rhs))
+
+    return Rope(
+        lhs.chunks[: lhs.count] + chunks, lhs.count + len(chunks), lhs.length + len(rhs)
+    )
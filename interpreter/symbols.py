@@ -0,0 +1,65 @@
+from typing import Dict, List
+
+
+class SymbolTable:
+    """Table of interned identifiers.
+
+    Every identifier is interned into a compact integer
+    symbol, so the Program can look up names by their
+    symbol instead of hashing and comparing strings.
+    Names are only resolved back for Errors and debug output.
+
+    Attributes:
+        symbols: Symbol of each interned name.
+        names: Name of each symbol.
+    """
+
+    def __init__(self):
+        """Initialise an empty SymbolTable."""
+        self.symbols: Dict[str, int] = dict()
+        self.names: List[str] = list()
+
+    def __str__(self) -> str:
+        return f"SymbolTable({len(self.names)})"
+
+    def __repr__(self) -> str:
+        return f"SymbolTable(names={self.names!r})"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.symbols
+
+    def intern(self, name: str) -> int:
+        """Intern the given name.
+
+        Args:
+            name: Name to intern.
+
+        Returns:
+            Symbol of the name.
+        """
+        symbol = self.symbols.get(name, None)
+
+        if symbol is None:
+            symbol = len(self.names)
+            self.symbols[name] = symbol
+            self.names.append(name)
+
+        return symbol
+
+    def name(self, symbol: int) -> str:
+        """Resolve the name of the given symbol.
+
+        Args:
+            symbol: Symbol to resolve.
+
+        Returns:
+            Name of the symbol.
+        """
+        return self.names[symbol]
+
+
+# Global SymbolTable, shared by the Lexer, Parser and Program
+SYMBOLS = SymbolTable()
@@ -1,18 +1,76 @@
-from typing import Optional, Union
+from __future__ import annotations
+import pickle
+from array import array
+from itertools import chain
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
-from interpreter.position import Position
-from interpreter.position import Position
+from interpreter.position import Position, LineIndex, Span
+from interpreter.symbols import SYMBOLS
+
+
+class TokenKind:
+    """Integer kinds of the different Tokens.
+
+    Every Token class carries one of these kinds, so
+    the Parser and Program can dispatch on a small integer
+    (through the lookup tables below the Tokens), instead
+    of checking the class of a Token with 'isinstance'.
+    """
+
+    NONE = 0
+    INTEGER = 1
+    FLOAT = 2
+    STRING = 3
+    ID = 4
+    BOOLEAN = 5
+    ADD = 6
+    SUB = 7
+    MUL = 8
+    DIV = 9
+    COMMA = 10
+    COLON = 11
+    PAR_OPEN = 12
+    PAR_CLOSE = 13
+    BRACKET_OPEN = 14
+    BRACKET_CLOSE = 15
+    NEW_LINE = 16
+    EOF = 17
+    EQUAL = 18
+    NOT_EQUAL = 19
+    GREATER = 20
+    GREATER_OR_EQUAL = 21
+    LESS = 22
+    LESS_OR_EQUAL = 23
+    ASSIGN_ADD = 24
+    ASSIGN_SUB = 25
+    ASSIGN_MUL = 26
+    ASSIGN_DIV = 27
+    VAR = 28
+    FUNC = 29
+    CODE_BLOCK = 30
+    CALL = 31
+    IF = 32
+    RETURN = 33
+    PRINT = 34
+    COMMENT = 35
 
 
 class Token:
     """Default base of a Token.
 
+    The Lexer doesn't build the Position of every Token, instead a
+    Token only keeps it's offsets within the source (as a Span),
+    of which the Position is built once it's needed.
+
     Attributes:
         value: Intial value of the Token.
         pos: Position of the Token.
         expr: Expression to perform the regex with.
+        location: Span of the Token, or it's Position once it's built.
     """
 
+    kind = TokenKind.NONE
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -36,6 +94,37 @@ class Token:
         if not isinstance(rhs, type(self)): return False
         return self.value == rhs.value and self.pos == rhs.pos
 
+    @property
+    def pos(self) -> Optional[Position]:
+        # Build the Position of the Span only once
+        if isinstance(self.location, tuple):
+            self.location = self.location[0].locate(*self.location[1:])
+        return self.location
+
+    @pos.setter
+    def pos(self, pos: Optional[Position]):
+        self.location: Union[Position, Span, None] = pos
+
+    def at(self, lines: LineIndex, start: int, end: int) -> Token:
+        """Place the Token at the given offsets within the source.
+
+        Args:
+            lines: LineIndex of the source.
+            start: Offset of the start of the Token.
+            end: Offset of the end of the Token.
+
+        Returns:
+            The placed Token.
+        """
+        self.location = (lines, start, end)
+        return self
+
+    def __reduce__(self) -> Tuple[type, Tuple]:
+        # Only the value and Position are pickled, the expression
+        # (and interned symbol, which is only valid within the
+        # SymbolTable of the current process) are rebuilt on loading
+        return self.__class__, (self.value, self.pos)
+
 
 class IntegerToken(Token):
     """Token representing an Integer.
@@ -46,6 +135,8 @@ class IntegerToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.INTEGER
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -68,6 +159,8 @@ class FloatToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.FLOAT
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -90,6 +183,8 @@ class StringToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.STRING
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -110,8 +205,11 @@ class IDToken(Token):
         value: Intial value of the Token.
         pos: Position of the Token.
         expr: Expression to perform the regex with.
+        symbol: Interned symbol of the Identifier, within 'SYMBOLS'.
     """
 
+    kind = TokenKind.ID
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -123,6 +221,7 @@ class IDToken(Token):
         """
         super().__init__(value, pos)
         self.expr = "(\w)+"
+        self.symbol = SYMBOLS.intern(value) if isinstance(value, str) else None
 
 
 class BooleanToken(Token):
@@ -134,6 +233,8 @@ class BooleanToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.BOOLEAN
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -161,6 +262,8 @@ class AddToken(Token):
         ```
     """
 
+    kind = TokenKind.ADD
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -191,6 +294,8 @@ class SubToken(Token):
         ```
     """
 
+    kind = TokenKind.SUB
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -218,6 +323,8 @@ class MulToken(Token):
         ```
     """
 
+    kind = TokenKind.MUL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -245,6 +352,8 @@ class DivToken(Token):
         ```
     """
 
+    kind = TokenKind.DIV
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -274,6 +383,8 @@ class CommaToken(Token):
         ```
     """
 
+    kind = TokenKind.COMMA
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -296,6 +407,8 @@ class ColonToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.COLON
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -318,6 +431,8 @@ class ParOpenToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.PAR_OPEN
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -340,6 +455,8 @@ class ParCloseToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.PAR_CLOSE
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -362,6 +479,8 @@ class BracketOpenToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.BRACKET_OPEN
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -384,6 +503,8 @@ class BracketCloseToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.BRACKET_CLOSE
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -406,6 +527,8 @@ class NewLineToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.NEW_LINE
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -428,6 +551,8 @@ class EOFToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.EOF
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -452,6 +577,8 @@ class EqualToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.EQUAL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -476,6 +603,8 @@ class NotEqualToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.NOT_EQUAL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -500,6 +629,8 @@ class GreaterToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.GREATER
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -524,6 +655,8 @@ class GreaterOrEqualToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.GREATER_OR_EQUAL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -548,6 +681,8 @@ class LessToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.LESS
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -572,6 +707,8 @@ class LessOrEqualToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.LESS_OR_EQUAL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -594,6 +731,8 @@ class AssignAddToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.ASSIGN_ADD
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -616,6 +755,8 @@ class AssignSubToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.ASSIGN_SUB
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -638,6 +779,8 @@ class AssignMulToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.ASSIGN_MUL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -660,6 +803,8 @@ class AssignDivToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.ASSIGN_DIV
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -682,6 +827,8 @@ class VarToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.VAR
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -704,6 +851,8 @@ class FuncToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.FUNC
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -726,6 +875,8 @@ class CodeBlockToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.CODE_BLOCK
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -748,6 +899,8 @@ class CallToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.CALL
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -770,6 +923,8 @@ class IfToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.IF
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -792,6 +947,8 @@ class ReturnToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.RETURN
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -814,6 +971,8 @@ class PrintToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.PRINT
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -836,6 +995,8 @@ class CommentToken(Token):
         expr: Expression to perform the regex with.
     """
 
+    kind = TokenKind.COMMENT
+
     def __init__(
         self, value: Union[int, float, str, None] = None, pos: Optional[Position] = None
     ):
@@ -915,3 +1076,100 @@ class TokenTypes(Enum):
     ]
 
     OPERATORS = MATH_OPS + COMPERATIONS + ASSIGNMENT_OPS
+
+
+# Lookup tables of Token kinds, shared by the Parser and Program
+ASSIGN_KINDS = frozenset(
+    {
+        TokenKind.VAR,
+        TokenKind.ASSIGN_ADD,
+        TokenKind.ASSIGN_SUB,
+        TokenKind.ASSIGN_MUL,
+        TokenKind.ASSIGN_DIV,
+    }
+)
+
+VALUE_KINDS = frozenset(
+    {TokenKind.INTEGER, TokenKind.FLOAT, TokenKind.STRING, TokenKind.ID}
+)
+
+ATOM_KINDS = VALUE_KINDS | {TokenKind.BOOLEAN}
+
+MATH_KINDS = frozenset({TokenKind.ADD, TokenKind.SUB, TokenKind.MUL, TokenKind.DIV})
+
+COMPARE_KINDS = frozenset(
+    {
+        TokenKind.EQUAL,
+        TokenKind.NOT_EQUAL,
+        TokenKind.GREATER,
+        TokenKind.GREATER_OR_EQUAL,
+        TokenKind.LESS,
+        TokenKind.LESS_OR_EQUAL,
+    }
+)
+
+# Token class of each kind, used to rebuild encoded Tokens
+TOKEN_CLASSES: Dict[int, type] = dict(
+    map(
+        lambda x: (x.kind, x),
+        chain([Token, EOFToken], *map(lambda x: x.value, TokenTypes)),
+    )
+)
+
+
+def encode_tokens(tokens: List[Token]) -> bytes:
+    """Encode the given Tokens into a compact binary form.
+
+    Instead of pickling every Token as a separate object (with
+    it's class, attribute names and Position), the Tokens are
+    stored as columns: a byte with the kind of each Token, a list
+    with their values and an array with all Positions flattened.
+
+    Args:
+        tokens: Tokens to encode.
+
+    Returns:
+        The encoded Tokens, to decode with 'decode_tokens'.
+    """
+    kinds = bytes(map(lambda x: x.kind, tokens))
+    values = list(map(lambda x: x.value, tokens))
+
+    # A Token without a Position is stored on line -1
+    positions = array(
+        "q",
+        chain.from_iterable(
+            map(
+                lambda x: (-1, 0, 0)
+                if x.pos is None
+                else (x.pos.line, x.pos.start, x.pos.end),
+                tokens,
+            )
+        ),
+    )
+    return pickle.dumps(
+        (kinds, values, positions.tobytes()), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def decode_tokens(data: bytes) -> List[Token]:
+    """Decode Tokens encoded by 'encode_tokens'.
+
+    Args:
+        data: The encoded Tokens.
+
+    Returns:
+        The decoded Tokens, with their symbols interned again.
+    """
+    kinds, values, flat = pickle.loads(data)
+    positions = array("q")
+    positions.frombytes(flat)
+
+    lines = iter(positions)
+    return list(
+        map(
+            lambda x: TOKEN_CLASSES[x[0]](
+                x[1], None if x[2][0] == -1 else Position(*x[2])
+            ),
+            zip(kinds, values, zip(lines, lines, lines)),
+        )
+    )
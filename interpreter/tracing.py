@@ -0,0 +1,164 @@
+import sys
+import json
+from time import perf_counter
+from collections import deque
+from typing import Optional, List, TextIO
+from interpreter.position import Position
+
+
+class TraceEvent:
+    """A single recorded execution event.
+
+    Attributes:
+        timestamp: Moment (in seconds) the event was recorded.
+        node: Name of the node type that was executed.
+        pos: Optional Position of the executed node.
+        scope: Name of the scope the node was executed in.
+        depth: Call depth of the scope.
+    """
+
+    def __init__(
+        self,
+        timestamp: float,
+        node: str,
+        pos: Optional[Position],
+        scope: str,
+        depth: int,
+    ):
+        """Initialise the event.
+
+        Args:
+            timestamp: Moment (in seconds) the event was recorded.
+            node: Name of the node type that was executed.
+            pos: Optional Position of the executed node.
+            scope: Name of the scope the node was executed in.
+            depth: Call depth of the scope.
+        """
+        self.timestamp = timestamp
+        self.node = node
+        self.pos = pos
+        self.scope = scope
+        self.depth = depth
+
+    def __str__(self) -> str:
+        pos = str(self.pos) if isinstance(self.pos, Position) else "-"
+        return f"{self.timestamp: >14.6f} {self.depth: >4} {self.scope: <30} {self.node: <15} {pos}"
+
+    def __repr__(self) -> str:
+        return f"TraceEvent(timestamp={self.timestamp!r}, node={self.node!r}, pos={self.pos!r}, scope={self.scope!r}, depth={self.depth!r})"
+
+    def to_json(self) -> str:
+        """Format the event as a single JSON line.
+
+        Returns:
+            JSON encoded representation of the event.
+        """
+        pos = self.pos if isinstance(self.pos, Position) else None
+        return json.dumps(
+            {
+                "timestamp": self.timestamp,
+                "node": self.node,
+                "line": pos.line if pos is not None else None,
+                "start": pos.start if pos is not None else None,
+                "end": pos.end if pos is not None else None,
+                "scope": self.scope,
+                "depth": self.depth,
+            }
+        )
+
+
+class Tracer:
+    """Execution tracer of a Moonlet Program.
+
+    Records structured events into a bounded ring buffer,
+    so only the last 'size' events are kept in memory.
+    Events are stored as plain tuples while recording,
+    and are only turned into 'TraceEvent' instances
+    (and formatted) when the buffer is dumped.
+
+    Attributes:
+        size: Maximum amount of events to keep.
+        buffer: Ring buffer containing the recorded events.
+    """
+
+    FORMATS = ("text", "jsonl")
+
+    def __init__(self, size: int = 1000):
+        """Initialise the Tracer.
+
+        Args:
+            size: Maximum amount of events to keep. Defaults to 1000.
+        """
+        self.size = size
+        self.buffer = deque(maxlen=size)
+
+    def __str__(self) -> str:
+        return f"Tracer({len(self.buffer)}/{self.size})"
+
+    def __repr__(self) -> str:
+        return f"Tracer(size={self.size!r})"
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def record(self, node, scope) -> None:
+        """Record the execution of a node.
+
+        Args:
+            node: Node that is being executed.
+            scope: Scope the node is executed in.
+        """
+        self.buffer.append(
+            (
+                perf_counter(),
+                node.__class__.__name__,
+                scope.locate(node),
+                scope.name,
+                scope.depth,
+            )
+        )
+
+    def events(self) -> List[TraceEvent]:
+        """Return the recorded events.
+
+        Returns:
+            List of the recorded events, from oldest to newest.
+        """
+        return list(map(lambda x: TraceEvent(*x), self.buffer))
+
+    def clear(self) -> None:
+        """Remove all recorded events."""
+        self.buffer.clear()
+
+    def format(self, fmt: str = "text") -> List[str]:
+        """Format the recorded events.
+
+        Args:
+            fmt: Output format, either 'text' or 'jsonl'. Defaults to 'text'.
+
+        Returns:
+            List of formatted lines, one for each event.
+        """
+        if fmt == "jsonl":
+            return list(map(lambda x: x.to_json(), self.events()))
+
+        return list(map(str, self.events()))
+
+    def dump(self, fmt: str = "text", stream: Optional[TextIO] = None) -> None:
+        """Write the recorded events to the given stream.
+
+        Args:
+            fmt: Output format, either 'text' or 'jsonl'. Defaults to 'text'.
+            stream: Stream to write to. Defaults to 'sys.stderr'.
+        """
+        stream = sys.stderr if stream is None else stream
+        lines = self.format(fmt)
+
+        if fmt == "text":
+            stream.write(f"{'TRACE':=^60}\n")
+            stream.write(
+                f"{'TIME': >14} {'DEPTH': >4} {'SCOPE': <30} {'NODE': <15} POSITION\n"
+            )
+
+        stream.write("".join(map(lambda x: x + "\n", lines)))
+        stream.flush()
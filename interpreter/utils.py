@@ -1,4 +1,7 @@
-from typing import Callable, Optional, List, Tuple, Union
+import sys
+import threading
+from typing import Any, Callable, Optional, List, Tuple, Union
+from interpreter.errors import ErrorSignal, RunTimeError
 
 
 def format_args(obj: Optional[Callable]) -> Optional[dict]:
@@ -92,3 +95,61 @@ def debug_log(category: Optional[str] = None, raw: bool = False) -> Callable:
         return inner
 
     return wrapper
+
+
+def run_with_stack(func: Callable[[], Any], recursion_limit: int, stack_size: int) -> Any:
+    """Run the given function with a larger stack.
+
+    The function runs within a separate thread, which
+    has the given stack size, while the Python recursion
+    limit is raised to the given limit.
+
+    Args:
+        func: Function to run.
+        recursion_limit: Python recursion limit to use.
+        stack_size: Size of the stack of the thread in bytes.
+
+    Returns:
+        Result of the given function.
+
+    Raises:
+        ErrorSignal: With a RunTimeError if the stack size can't be
+            used, or the thread couldn't be started.
+        Any exception raised by the given function.
+    """
+    result = dict()
+
+    def target():
+        try:
+            result["value"] = func()
+        except BaseException as exception:
+            result["error"] = exception
+
+    old_limit = sys.getrecursionlimit()
+
+    try:
+        old_size = threading.stack_size(stack_size)
+    except (ValueError, RuntimeError) as error:
+        raise ErrorSignal(
+            RunTimeError(f"Can't use a stack of {stack_size} bytes ({error})")
+        )
+
+    sys.setrecursionlimit(max(old_limit, recursion_limit))
+
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    except RuntimeError as error:
+        raise ErrorSignal(
+            RunTimeError(
+                f"Can't start a thread with a stack of {stack_size} bytes ({error})"
+            )
+        )
+    finally:
+        threading.stack_size(old_size)
+        sys.setrecursionlimit(old_limit)
+
+    if "error" in result:
+        raise result["error"]
+    return result.get("value", None)
@@ -1,22 +1,25 @@
-import io
-import sys
 import unittest
-from interpreter import launcher
+from interpreter import launcher, output
 
 class SystemTest(unittest.TestCase):
 
     def test_system(self):
 
-        sys.stdout = io.StringIO()
+        printed = output.ListOutput()
 
         expected = ''
-        launch = launcher.Launcher('tests/test_file.mnl')
-        launch.run_moonlet()
-        
-        output = sys.stdout.getvalue()
-        
-        sys.stdout = sys.__stdout__
-        self.assertEqual(output, expected, "Launching the System test gave an unexpected output")
+        launcher.Launcher('tests/test_file.mnl', output=printed)
+
+        self.assertEqual(printed.getvalue(), expected, "Launching the System test gave an unexpected output")
+
+    def test_printing(self):
+
+        printed = output.ListOutput()
+
+        expected = ['101']
+        launcher.Launcher('examples/test_operations.mnl', output=printed)
+
+        self.assertEqual(printed.lines, expected, "Launching the System test printed an unexpected output")
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,5 +1,30 @@
+import io
+import json
+import pickle
 import unittest
-from interpreter import lexer, tokens, position, parser, nodes
+from interpreter import lexer, tokens, position, parser, nodes, program, tracing, output
+from interpreter import incremental, symbols, checker, grammar, errors, rope, utils
+
+
+def parse(text):
+    """Lex and parse the given text."""
+    tokens_, _ = lexer.Lexer(text).run()
+    return parser.Parser(tokens_).parse()
+
+
+def run_program(text, **options):
+    """Run the given text as a whole Program, with the given options.
+
+    The Program prints to a ListOutput, unless another 'output' is given.
+
+    Returns:
+        Tuple with the Program, it's ProgramState, the Scope and the ATS.
+    """
+    ats = parse(text)
+    options.setdefault("output", output.ListOutput())
+    test_program = program.Program(**options)
+    scope = program.Scope(name="<Program>", origin=ats.node)
+    return test_program, test_program.run(ats.node, scope), scope, ats
 
 
 class TestTextToToken(unittest.TestCase):
@@ -60,6 +85,167 @@ class TestVariableTokenCreation(unittest.TestCase):
         self.assertNotEqual(result, expected, "Must not be a Variable Token!")
 
 
+class TestTokenKinds(unittest.TestCase):
+    """Test the integer kinds of the Tokens."""
+
+    def test_kinds_are_unique(self):
+        classes = sum(map(lambda x: x.value, tokens.TokenTypes), [tokens.EOFToken])
+        kinds = list(map(lambda x: x.kind, set(classes)))
+        self.assertEqual(len(set(kinds)), len(kinds), "Kinds must be unique")
+        self.assertNotIn(tokens.TokenKind.NONE, kinds, "Every Token needs a kind")
+
+    def test_kind_lookup_tables(self):
+        self.assertIn(tokens.IDToken("x").kind, tokens.VALUE_KINDS)
+        self.assertNotIn(tokens.BooleanToken(True).kind, tokens.VALUE_KINDS)
+        self.assertIn(tokens.BooleanToken(True).kind, tokens.ATOM_KINDS)
+        self.assertIn(tokens.LessOrEqualToken("<=").kind, tokens.COMPARE_KINDS)
+
+
+class TestShardedLexing(unittest.TestCase):
+    """Test lexing the text in (parallel) shards."""
+
+    text = "\n".join(
+        [
+            "=| func (a, b) ={",
+            "    =+ a b",
+            "    => a",
+            "}",
+            "=# comment with a \"quote",
+            '=: text "multiple\nlines"',
+            "=@ func (1, 2) =: result",
+            "=! result",
+        ]
+        * 3
+    )
+
+    def test_shards_are_whole_lines(self):
+        shards = lexer.shard_text(self.text, 64)
+        self.assertGreater(len(shards), 1, "Text wasn't sharded")
+        self.assertEqual("".join(shards), self.text, "Shards don't form the text")
+        self.assertTrue(
+            all(map(lambda x: x.endswith("\n"), shards[:-1])),
+            "Shards must end at a newline",
+        )
+
+    def test_sharded_equals_sequential(self):
+        expected = repr(lexer.Lexer(self.text).run())
+        self.assertEqual(repr(lexer.Lexer(self.text).run_sharded(1, 64)), expected)
+        self.assertEqual(repr(lexer.Lexer(self.text).run_sharded(2, 64)), expected)
+
+    def test_sharded_error(self):
+        text = self.text + "\n=: x ?\n" + self.text
+        expected = lexer.Lexer(text).run()
+        _, error = lexer.Lexer(text).run_sharded(1, 64)
+        self.assertEqual(str(error), str(expected[1]), "Invalid error")
+        self.assertEqual(error.pos, expected[1].pos, "Invalid error position")
+
+    def test_comment_within_part(self):
+        # '=#' only starts a comment at the start of a part
+        text = '=: x 1\n=! x=#c "multi\nline"\n'
+        expected = repr(lexer.Lexer(text).run())
+        self.assertIsNone(lexer.Lexer(text).run()[1], "Text must lex cleanly")
+        self.assertEqual(repr(lexer.Lexer(text).run_sharded(1, 1)), expected)
+
+    def test_sharded_unterminated_string(self):
+        # The string continues over the (otherwise sharded) lines after it
+        lines = "\n".join(["=: n 1", "=+ n 2", "=! n"] * 16)
+        text = self.text + '\n=: x "unterminated\n' + lines
+        self.assertGreater(len(lexer.shard_text(lines, 64)), 1, "Text wasn't sharded")
+        expected = lexer.Lexer(text).run()
+        _, error = lexer.Lexer(text).run_sharded(1, 64)
+        self.assertEqual(str(error), str(expected[1]), "Invalid error")
+        self.assertEqual(error.pos, expected[1].pos, "Invalid error position")
+
+
+class TestLineIndex(unittest.TestCase):
+    """Test locating the offsets of Tokens through a LineIndex."""
+
+    def test_locate(self):
+        lines = position.LineIndex(2, [0, 8, 20])
+        self.assertEqual(lines.locate(10, 12), position.Position(3, 2, 4))
+        self.assertEqual(lines.locate(20), position.Position(4, 0, 0))
+
+    def test_positions_are_built_lazily(self):
+        result, _ = lexer.Lexer("=: x 10\n=: y 5").run()
+        self.assertIsInstance(result[5].location, tuple, "Position is already built")
+        self.assertEqual(result[5].pos, position.Position(1, 3, 3), "Invalid position")
+        self.assertIs(result[5].location, result[5].pos, "Position must be kept")
+
+
+class TestLineCache(unittest.TestCase):
+    """Test replaying repeated lines from a LineCache."""
+
+    text = "=: n 10\n=- n 1\n=: s 'a\nb'\n=- n 1\n=- n 1\n=: x ?\n"
+
+    def test_replayed_equals_lexed(self):
+        text = self.text.replace("=: x ?\n", "=- n 1")
+        cache = lexer.LineCache()
+        expected = repr(lexer.Lexer(text).run())
+        self.assertEqual(repr(lexer.Lexer(text, cache=cache).run()), expected)
+        self.assertEqual((cache.hits, cache.misses), (2, 4), "Invalid statistics")
+
+    def test_comment_within_part(self):
+        text = '=: x 1\n=! x=#c "multi\nline"\n'
+        expected = repr(lexer.Lexer(text).run())
+        cache = lexer.LineCache()
+        self.assertEqual(repr(lexer.Lexer(text, cache=cache).run()), expected)
+
+    def test_error_lines_are_not_kept(self):
+        cache = lexer.LineCache()
+        expected = lexer.Lexer(self.text).run()
+        _, error = lexer.Lexer(self.text, cache=cache).run()
+        self.assertEqual(error.pos, expected[1].pos, "Invalid error position")
+        self.assertNotIn("=: x ?\n", cache.lines, "Lines with an Error can't be kept")
+
+    def test_bounded(self):
+        cache = lexer.LineCache(2)
+        lexer.Lexer("=: x 1\n=: y 2\n=: x 1\n=: z 3\n", cache=cache).run()
+        self.assertEqual(list(cache.lines), ["=: x 1\n", "=: z 3\n"], "Invalid lines")
+
+
+class TestBinaryLexing(unittest.TestCase):
+    """Test lexing the bytes of a text."""
+
+    text = "=: x 10\n=+ x 1.5 =# comment\n=? (>= x 'a \"b\"') {\n=> \"c\nd\"\n}\n"
+
+    def test_scanned_equals_tokenized(self):
+        expected = repr(lexer.Lexer(self.text).run())
+        self.assertEqual(repr(lexer.Lexer(self.text, binary=True).run()), expected)
+
+    def test_error_position(self):
+        text = "=: x 1\n=: y 12a\n"
+        _, expected = lexer.Lexer(text).run()
+        _, error = lexer.Lexer(text, binary=True).run()
+        self.assertEqual(error.pos, expected.pos, "Invalid error position")
+        self.assertEqual(error.details, expected.details, "Invalid error details")
+
+    def test_non_ascii_is_tokenized(self):
+        text = "=: s 'caf\u00e9'\n"
+        result, _ = lexer.Lexer(text, binary=True).run()
+        self.assertEqual(result[2].value, "caf\u00e9", "Invalid value")
+        self.assertEqual(repr(result), repr(lexer.Lexer(text).run()[0]))
+
+
+class TestSymbols(unittest.TestCase):
+    """Test interning the Identifiers into symbols."""
+
+    def test_same_name_same_symbol(self):
+        result, _ = lexer.Lexer("=: x 10\n=+ x y").run()
+        ids = list(filter(lambda x: isinstance(x, tokens.IDToken), result))
+        self.assertEqual(ids[0].symbol, ids[1].symbol, "Names must share a symbol")
+        self.assertNotEqual(ids[0].symbol, ids[2].symbol, "Invalid symbol")
+        self.assertEqual(symbols.SYMBOLS.name(ids[0].symbol), "x", "Invalid name")
+
+    def test_pickled_token_is_interned(self):
+        token = pickle.loads(pickle.dumps(tokens.IDToken("x")))
+        self.assertEqual(token.symbol, symbols.SYMBOLS.intern("x"), "Invalid symbol")
+
+    def test_scope_keyed_by_symbol(self):
+        _, _, scope, _ = run_program("=: x 10")
+        self.assertIn(symbols.SYMBOLS.intern("x"), scope.args, "Scope must use symbols")
+        self.assertEqual(scope.format_args(), {"x": "10"}, "Invalid formatting")
+
+
 class TestVariableNodeCreation(unittest.TestCase):
     """Test the Creation of a Variable Node."""
 
@@ -106,5 +292,673 @@ class TestVariableNodeCreation(unittest.TestCase):
         )
 
 
+class TestSlottedNodes(unittest.TestCase):
+    """Test the Nodes and their Position side table."""
+
+    def test_nodes_are_slotted(self):
+        node = nodes.NumberNode(tokens.IntegerToken(10, position.Position(2, 5, 6)))
+        self.assertFalse(hasattr(node, "__dict__"), "Nodes must use '__slots__'")
+        self.assertEqual(node.value, 10, "Invalid value")
+        self.assertEqual(node.pos, position.Position(2, 5, 6), "Invalid position")
+
+    def test_position_is_removed(self):
+        size = len(position.POSITIONS)
+        node = nodes.IDNode(tokens.IDToken("x", position.Position(0, 3, 3)))
+        self.assertEqual(len(position.POSITIONS), size + 1, "Position wasn't stored")
+        del node
+        self.assertEqual(len(position.POSITIONS), size, "Position wasn't removed")
+
+    def test_error_position(self):
+        _, result, _, _ = run_program("=: x 10\n=! y\n")
+        self.assertEqual(result.error.pos, position.Position(1, 3, 3))
+
+
+class TestErrorSignals(unittest.TestCase):
+    """Test raising the Errors of the Program as signals."""
+
+    text = "=| f (a) ={\n    =! b\n    => a\n}\n=@ f (1) =: r\n"
+
+    def test_eval_returns_result(self):
+        ats = parse("=: x 10\n=+ x 5\n")
+        scope = program.Scope(name="<Program>", origin=ats.node)
+        result = program.Program().eval(ats.node, scope)
+        self.assertEqual(list(map(str, result)), ["10", "15"], "Invalid results")
+
+    def test_eval_raises_error(self):
+        ats = parse(self.text)
+        test_program = program.Program()
+        scope = program.Scope(name="<Program>", origin=ats.node)
+
+        with self.assertRaises(errors.ErrorSignal) as raised:
+            test_program.eval(ats.node, scope)
+
+        self.assertIsInstance(raised.exception.error, errors.RunTimeError)
+        self.assertEqual(raised.exception.error.pos.line, 1, "Invalid error position")
+        self.assertEqual(test_program.frames, [], "Call stack wasn't unwound")
+
+    def test_exec_returns_state(self):
+        ats = parse(self.text)
+        scope = program.Scope(name="<Program>", origin=ats.node)
+        result = program.Program().exec(ats.node, scope)
+        self.assertIsInstance(result, program.ProgramState)
+        self.assertIsInstance(result.error, errors.RunTimeError)
+
+
+class TestReturnSignals(unittest.TestCase):
+    """Test returning from a function through a signal."""
+
+    source = "\n".join(
+        [
+            "=| f (a) ={",
+            "    =? (a > 1) ={",
+            "        =? (a > 2) => a",
+            "        =+ a 10",
+            "    }",
+            "    =! 'after'",
+            "    => a",
+            "}",
+            "=@ f (%d) =: r",
+        ]
+    )
+
+    def test_return_from_nested_blocks(self):
+        test_program, result, scope, _ = run_program(self.source % 3)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r"], "3", "Invalid result")
+        self.assertEqual(
+            test_program.output.chunks, [], "Statements after the return were run"
+        )
+        self.assertEqual(test_program.frames, [], "Call stack wasn't unwound")
+
+    def test_return_after_blocks(self):
+        test_program, result, scope, _ = run_program(self.source % 2)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r"], "12", "Invalid result")
+        self.assertEqual(test_program.output.chunks, ["'after'\n"], "Invalid output")
+
+
+class TestQuickening(unittest.TestCase):
+    """Test specialising the operations for the types of their operands."""
+
+    source = "\n".join(
+        [
+            "=| f (a, b) ={",
+            "    =: c a + b",
+            "    =? (c > b) => c",
+            "    => b",
+            "}",
+            "=@ f (1, 2) =: r1",
+            "=@ f (3, 4) =: r2",
+            "=@ f (%s, %s) =: r3",
+        ]
+    )
+
+    def run_operation(self, lhs, rhs, quicken=True):
+        test_program, result, scope, ats = run_program(
+            self.source % (lhs, rhs), quicken=quicken
+        )
+        return test_program, result, scope, ats.node.items[0].body.items[0].value
+
+    def test_specialized_operation(self):
+        test_program, result, scope, node = self.run_operation(5, 6)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r3"], "11", "Invalid result")
+        self.assertEqual(node.quick.name, "int add int", "Invalid Specialization")
+        self.assertGreater(test_program.quickening.hits, 0, "No Specialization hit")
+        self.assertEqual(test_program.quickening.misses, 0, "Invalid de-optimisation")
+
+    def test_deoptimized_operation(self):
+        test_program, result, scope, node = self.run_operation("'x'", "'y'")
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r3"], "'y'", "Invalid result")
+        self.assertEqual(node.quick.name, "str concat str", "Invalid Specialization")
+        self.assertGreater(test_program.quickening.misses, 0, "No de-optimisation")
+
+    def test_same_results_without_quickening(self):
+        _, _, quick_scope, _ = self.run_operation(1.5, 2)
+        _, _, scope, node = self.run_operation(1.5, 2, quicken=False)
+        self.assertEqual(quick_scope.format_args(), scope.format_args())
+        self.assertIsNone(node.quick, "Node was specialised without quickening")
+
+    def test_specialization_not_pickled(self):
+        _, _, _, node = self.run_operation(5, 6)
+        loaded = pickle.loads(pickle.dumps(node))
+        self.assertIsNone(loaded.quick, "Specialization was pickled")
+        self.assertEqual(loaded, node, "Invalid Node")
+
+
+class TestCallCache(unittest.TestCase):
+    """Test caching the Function called by a call."""
+
+    def test_cached_recursion(self):
+        text = "\n".join(
+            [
+                "=| sommig (n, result) ={",
+                "    =? (n < 1) => result",
+                "    =+ result n",
+                "    =- n 1",
+                "    => sommig(n, result)",
+                "}",
+                "=@ sommig (10, 0) =: result",
+            ]
+        )
+        test_program, result, scope, _ = run_program(text)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["result"], "55", "Invalid result")
+        self.assertEqual(test_program.call_cache.hits, 9, "Invalid amount of hits")
+        self.assertEqual(test_program.call_cache.misses, 2, "Invalid amount of misses")
+
+    def test_shadowed_function(self):
+        text = "\n".join(
+            [
+                "=| f (a) ={",
+                "    => a + 1",
+                "}",
+                "=| k (a) ={",
+                "    =| f (b) ={",
+                "        => b * 100",
+                "    }",
+                "    => f(a)",
+                "}",
+                "=@ f (1) =: r1",
+                "=@ k (2) =: r2",
+                "=@ f (3) =: r3",
+            ]
+        )
+        _, result, scope, _ = run_program(text)
+        _, _, uncached_scope, _ = run_program(text, cache_calls=False)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r2"], "200", "Invalid result")
+        self.assertEqual(scope.format_args()["r3"], "4", "Invalid result")
+        self.assertEqual(scope.format_args(), uncached_scope.format_args())
+
+    def test_call_of_nested_function(self):
+        text = "\n".join(
+            [
+                "=: a 1",
+                "=| f (b) ={",
+                "    => b + 1",
+                "}",
+                "=@ f (a) =: x",
+                "=| g (a) ={",
+                "    =| f (b) ={",
+                "        => b * 10",
+                "    }",
+                "    =@ f (a) =: x",
+                "    => x",
+                "}",
+                "=@ g (5) =: y",
+            ]
+        )
+        _, result, scope, _ = run_program(text)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["x"], "2", "Invalid result")
+        self.assertEqual(scope.format_args()["y"], "50", "Cached call was used")
+
+
+class TestLazyDefinitions(unittest.TestCase):
+    """Test defining functions without executing their body."""
+
+    def test_body_not_executed(self):
+        test_program, result, scope, ats = run_program(
+            "=| f (a) ={\n    =! 'called'\n    => a\n}\n"
+        )
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args(), {"f": "f(a)"}, "Invalid scope")
+        self.assertEqual(test_program.output.chunks, [], "Body was executed")
+        self.assertIsNotNone(ats.node.items[0].bound, "Function wasn't checked")
+
+    def test_unknown_variable(self):
+        _, result, _, _ = run_program("=| f (a) ={\n    =: b 1\n    => c\n}\n")
+        self.assertIsInstance(result.error, errors.RunTimeError, "Invalid Error")
+        self.assertIn("'c' doesn't exist", result.error.details, "Invalid Error")
+        self.assertEqual(result.error.pos.line, 2, "Invalid error position")
+
+    def test_duplicate_param(self):
+        _, result, _, _ = run_program("=| f (a, a) ={\n    => a\n}\n")
+        self.assertIsInstance(result.error, errors.RunTimeError, "Invalid Error")
+        self.assertIn("already defined", result.error.details, "Invalid Error")
+
+    def test_nested_function_checked(self):
+        text = "=| f (a) ={\n    =| g (b) ={\n        => a\n    }\n    => a\n}\n"
+        _, result, _, _ = run_program(text)
+        self.assertIsInstance(result.error, errors.RunTimeError, "Invalid Error")
+        self.assertIn("<Function: 'g'>", result.error.details, "Invalid Error")
+
+
+class TestFunctionTable(unittest.TestCase):
+    """Test hoisting the top-level functions into a function table."""
+
+    def test_mutual_recursion(self):
+        with open("examples/test_odd_even.mnl") as file:
+            text = file.read()
+
+        test_program, result, scope, _ = run_program(text)
+        _, _, unhoisted_scope, _ = run_program(text, hoist=False)
+        odd = symbols.SYMBOLS.intern("odd")
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args(), unhoisted_scope.format_args())
+        self.assertIs(scope.args[odd], test_program.functions[odd], "Not hoisted")
+
+        with self.assertRaises(TypeError):
+            test_program.functions[odd] = None
+
+    def test_call_before_definition(self):
+        text = "=@ f (1) =: r\n=| f (a) ={\n    => a\n}\n"
+        _, result, _, _ = run_program(text)
+        self.assertIsInstance(result.error, errors.RunTimeError, "Invalid Error")
+        self.assertIn("isn't defined", result.error.details, "Invalid Error")
+
+    def test_shadowed_function(self):
+        text = "\n".join(
+            [
+                "=| f (a) ={",
+                "    => a + 1",
+                "}",
+                "=| h (a) ={",
+                "    => f(a)",
+                "}",
+                "=| k (a) ={",
+                "    =| f (b) ={",
+                "        => b * 100",
+                "    }",
+                "    => h(a)",
+                "}",
+                "=@ k (2) =: r1",
+                "=@ h (3) =: r2",
+            ]
+        )
+        _, result, scope, _ = run_program(text)
+        self.assertIsNone(result.error, "Program failed")
+        self.assertEqual(scope.format_args()["r1"], "200", "Invalid result")
+        self.assertEqual(scope.format_args()["r2"], "4", "Invalid result")
+
+
+class TestRopes(unittest.TestCase):
+    """Test concatenating long strings as a Rope."""
+
+    def test_shared_chunks(self):
+        text = rope.Rope(["a" * 300], 1, 300)
+        lhs = text + "b"
+        rhs = text + "c"
+        self.assertIs(lhs.chunks, text.chunks, "Chunks weren't shared")
+        self.assertIsNot(rhs.chunks, text.chunks, "Chunks were shared")
+        self.assertEqual(lhs, "a" * 300 + "b", "Invalid string")
+        self.assertEqual(rhs, "a" * 300 + "c", "Invalid string")
+        self.assertEqual(text, "a" * 300, "Invalid string")
+
+    def test_short_strings(self):
+        self.assertEqual(rope.concat("a", "b"), "ab", "Invalid string")
+        self.assertIs(type(rope.concat("a", "b")), str, "Short string as a Rope")
+        self.assertIs(type(rope.concat("a" * 300, "b")), rope.Rope, "Not a Rope")
+
+    def test_build_string(self):
+        text = "\n".join(
+            [
+                "=| build (n, text) ={",
+                "    =? (n < 1) => text",
+                f'    =+ text "{"x" * 100}"',
+                "    =- n 1",
+                "    => build(n, text)",
+                "}",
+                "=| same (a, b) ={",
+                "    =? (a == b) => 1",
+                "    => 0",
+                "}",
+                '=@ build (20, "y") =: result',
+                '=@ build (20, "y") =: other',
+                "=@ same (result, other) =: equal",
+                "=! result",
+            ]
+        )
+        test_program, result, scope, _ = run_program(text)
+        value = scope.args[symbols.SYMBOLS.intern("result")].value
+        self.assertIsNone(result.error, "Program failed")
+        self.assertIsInstance(value, rope.Rope, "Not a Rope")
+        self.assertEqual(scope.format_args()["equal"], "1", "Invalid comparison")
+        self.assertEqual(
+            test_program.output.getvalue(), f"'y{'x' * 2000}'\n", "Invalid print"
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(value)), value, "Invalid pickle")
+
+
+class TestParseSignals(unittest.TestCase):
+    """Test raising the Errors of the Parser as signals."""
+
+    def parser(self, text):
+        tokens_, _ = lexer.Lexer(text).run()
+        test_parser = parser.Parser(tokens_)
+        test_parser.next()
+        return test_parser
+
+    def test_statement_returns_node(self):
+        node = self.parser("=: x 10\n").statement()
+        self.assertIsInstance(node, nodes.VarNode, "Invalid Node")
+
+    def test_statement_raises_error(self):
+        with self.assertRaises(errors.ErrorSignal) as raised:
+            self.parser("=: x 10\n=: 5 10\n").statements(tokens.TokenKind.EOF)
+
+        self.assertIsInstance(raised.exception.error, errors.InvalidSyntaxError)
+        self.assertEqual(raised.exception.error.pos.line, 1, "Invalid error position")
+
+    def test_parse_returns_state(self):
+        ats = parse("=? (x <) => x\n")
+        self.assertIsInstance(ats, parser.ParseState)
+        self.assertIsInstance(ats.error, errors.InvalidSyntaxError)
+
+
+class TestSharedNodes(unittest.TestCase):
+    """Test the sharing (hash-consing) of identical Nodes."""
+
+    def test_identical_statements_are_shared(self):
+        ats = parse("=+ x 1\n=: y 2\n=+ x 1\n")
+        self.assertIs(ats.node.items[0], ats.node.items[2], "Statements aren't shared")
+        self.assertEqual(
+            list(map(lambda x: x.line, ats.node.positions)),
+            [0, 1, 2],
+            "Statements must keep their own Position",
+        )
+
+    def test_intern(self):
+        table = nodes.NodeTable()
+        first = table.intern(nodes.NumberNode(tokens.IntegerToken(1)))
+        second = table.intern(nodes.NumberNode(tokens.IntegerToken(1)))
+        other = table.intern(nodes.NumberNode(tokens.FloatToken(1.0)))
+        self.assertIs(first, second, "Identical Nodes must be shared")
+        self.assertIsNot(first, other, "Integers and Floats can't be shared")
+        self.assertEqual((len(table), table.hits), (2, 1), "Invalid table")
+
+    def test_error_is_located_at_statement(self):
+        _, result, _, ats = run_program("=: x 1\n=: y 1\n=/ x y\n=: y 0\n=/ x y\n")
+        self.assertIs(ats.node.items[2], ats.node.items[4], "Statements aren't shared")
+        self.assertEqual(result.error.pos.line, 4, "Error must be located at it's use")
+
+    def test_error_is_located_within_repeated_subtree(self):
+        ats = parse("=: x 1\n=: y 4 / x\n=- x 1\n=: zz 4 / x\n")
+        self.assertIs(
+            ats.node.items[1].value, ats.node.items[3].value, "Subtrees aren't shared"
+        )
+
+        # Both the parsed and the pickled tree locate the second occurrence
+        results = list(
+            map(
+                lambda x: program.Program().exec(
+                    x, program.Scope(name="<Program>", origin=x)
+                ),
+                [ats.node, pickle.loads(pickle.dumps(ats.node))],
+            )
+        )
+        self.assertEqual(results[0].error.pos, position.Position(3, 8, 8))
+        self.assertEqual(results[1].error.pos, position.Position(3, 8, 8))
+
+
+class TestPickling(unittest.TestCase):
+    """Test the (compact) pickling of Tokens and Nodes."""
+
+    TEXT = "\n".join(
+        ["=: x 10", "=: y 2.5", "=| f (a) ={", "    =+ a a", "    => a", "}"]
+        + ["=@ f (x) =: z"] * 2
+    )
+
+    def test_tokens_round_trip(self):
+        tokens_, _ = lexer.Lexer(self.TEXT).run()
+        loaded = tokens.decode_tokens(tokens.encode_tokens(tokens_))
+        self.assertEqual(loaded, tokens_, "Tokens must be equal")
+        self.assertEqual(
+            list(map(lambda x: (x.expr, getattr(x, "symbol", None)), loaded)),
+            list(map(lambda x: (x.expr, getattr(x, "symbol", None)), tokens_)),
+            "Tokens must keep their expression and symbol",
+        )
+
+    def test_nodes_round_trip(self):
+        ats = parse(self.TEXT)
+        loaded = pickle.loads(pickle.dumps(ats.node))
+        self.assertEqual(repr(loaded), repr(ats.node), "Nodes must be equal")
+        self.assertEqual(loaded.positions, ats.node.positions, "Invalid positions")
+        self.assertEqual(loaded.items[2].pos, ats.node.items[2].pos, "Invalid position")
+        self.assertEqual(loaded.items[2].symbol, ats.node.items[2].symbol)
+        self.assertIs(loaded.items[3], loaded.items[4], "Nodes must stay shared")
+
+
+class TestGrammar(unittest.TestCase):
+    """Test the grammar table of the statements."""
+
+    def test_statements_are_not_recursive(self):
+        tokens_, _ = lexer.Lexer("=: x 10\n").run()
+        ats = parser.Parser(tokens_[:-1] * 5000 + tokens_[-1:]).parse()
+        self.assertIsNone(ats.error, "Parsing must not fail")
+        self.assertEqual(len(ats.node.items), 5000, "Invalid amount of statements")
+
+    def test_conflicting_rules(self):
+        rule = grammar.Rule(["=!"], [grammar.Skip()], lambda fields, token: None)
+        with self.assertRaises(ValueError):
+            grammar.compile_rules(grammar.RULES + [rule])
+
+    def test_error_position(self):
+        ats = parse("=: x 10\n=: 5 10\n")
+        self.assertEqual(type(ats.error).__name__, "InvalidSyntaxError")
+        self.assertEqual(ats.error.pos.line, 1, "Invalid error position")
+
+    def test_step_must_run(self):
+        class Idle(grammar.Step):
+            pass
+
+        with self.assertRaises(TypeError):
+            Idle()
+
+
+class TestBinaryOperations(unittest.TestCase):
+    """Test the precedence and associativity of Binary Operations."""
+
+    def results(self, text):
+        _, _, scope, _ = run_program(text)
+        return scope.format_args()
+
+    def depth(self, node):
+        if not isinstance(node, nodes.BinaryOpNode):
+            return 0
+        return 1 + max(self.depth(node.lhs), self.depth(node.rhs))
+
+    def test_precedence(self):
+        result = self.results("=: x 2 + 3 * 4 - 10 / 5\n=: y (2 + 3) * 4")
+        self.assertEqual(result, {"x": "12.0", "y": "20"}, "Invalid precedence")
+
+    def test_left_associative(self):
+        result = self.results("=: x 10 - 2 - 3\n=: y 100 / 10 / 5")
+        self.assertEqual(result, {"x": "5", "y": "2.0"}, "Must be left-associative")
+
+    def test_long_chain_is_balanced(self):
+        ats = parse("=: x " + " + ".join(["1"] * 64))
+        self.assertEqual(self.depth(ats.node.items[0].value), 6, "Tree isn't balanced")
+
+    def test_float_chain_is_left_associative(self):
+        result = self.results("=: x 0.1 + 0.2 + 0.3\n=: y 0.1 * 0.2 * 0.3 * 0.4")
+        self.assertEqual(
+            result,
+            {"x": str(0.1 + 0.2 + 0.3), "y": str(0.1 * 0.2 * 0.3 * 0.4)},
+            "Float chain must be left-associative",
+        )
+
+
+class TestTracing(unittest.TestCase):
+    """Test the recording of the execution trace."""
+
+    def run_traced(self, text, size):
+        tracer = tracing.Tracer(size)
+        _ = run_program(text, tracer=tracer)
+        return tracer
+
+    def test_ring_buffer_is_bounded(self):
+        tracer = self.run_traced("=: x 10\n=: y 20\n=+ x y", 3)
+        self.assertEqual(len(tracer), 3, "Tracer must only keep the last events")
+        self.assertEqual(
+            list(map(lambda x: x.node, tracer.events())),
+            ["NumberNode", "AssignOpNode", "IDNode"],
+            "Tracer kept the wrong events",
+        )
+
+    def test_jsonl_dump(self):
+        tracer = self.run_traced("=: x 10", 10)
+        stream = io.StringIO()
+        tracer.dump("jsonl", stream)
+        events = list(map(json.loads, stream.getvalue().splitlines()))
+        self.assertEqual(events[1]["node"], "VarNode", "Invalid traced node")
+        self.assertEqual(events[1]["line"], 0, "Invalid traced position")
+        self.assertEqual(events[1]["scope"], "<Program>", "Invalid traced scope")
+
+
+class TestCallDepth(unittest.TestCase):
+    """Test the maximum depth of (nested) function calls."""
+
+    source = "\n".join(
+        [
+            "=| sommig (n, result) ={",
+            "    =? (n < 1) => result",
+            "    =+ result n",
+            "    =- n 1",
+            "    => sommig(n, result)",
+            "}",
+            "=@ sommig (%d, 0) =: result",
+        ]
+    )
+
+    def run_sommig(self, depth, max_depth):
+        return run_program(self.source % depth, max_depth=max_depth)[:3]
+
+    def test_within_max_depth(self):
+        test_program, result, scope = self.run_sommig(20, 30)
+        self.assertIsNone(result.error, "Call within the maximum depth failed")
+        self.assertEqual(scope.format_args()["result"], "210", "Invalid result")
+        self.assertEqual(test_program.frames, [], "Call stack wasn't unwound")
+
+    def test_exceeding_max_depth(self):
+        test_program, result, _ = self.run_sommig(40, 30)
+        self.assertIsInstance(result.error, program.RunTimeError)
+        self.assertEqual(result.error.pos.line, 4, "Error must point to the call")
+        self.assertEqual(test_program.frames, [], "Call stack wasn't unwound")
+
+    def test_running_out_of_stack(self):
+        test_program, result, _ = self.run_sommig(5000, 10_000)
+        self.assertIsInstance(result.error, program.RunTimeError)
+        self.assertEqual(result.error.pos.line, 4, "Error must point to the call")
+        self.assertEqual(test_program.frames, [], "Call stack wasn't unwound")
+
+    def test_limited_stack_size(self):
+        test_program = program.Program(max_depth=1_000_000)
+        self.assertEqual(test_program.stack_size, program.MAX_STACK_SIZE)
+
+        # A stack which can't be created is an Error, instead of a crash
+        with self.assertRaises(errors.ErrorSignal) as signal:
+            utils.run_with_stack(lambda: None, 1000, 2**62)
+        self.assertIsInstance(signal.exception.error, errors.RunTimeError)
+
+
+class TestBufferedOutput(unittest.TestCase):
+    """Test the buffering of the printed values."""
+
+    def test_output_is_buffered(self):
+        printed = output.ListOutput(buffer_size=8)
+        printed.write("abc\n")
+        self.assertEqual(printed.chunks, [], "Output must be buffered")
+        printed.write("defgh\n")
+        self.assertEqual(printed.chunks, ["abc\ndefgh\n"], "Full buffer wasn't emitted")
+
+    def test_program_flushes_output(self):
+        test_program, _, _, _ = run_program("=: x 10\n=! x\n=! 'done'")
+        self.assertEqual(
+            test_program.output.chunks, ["10\n'done'\n"], "Output wasn't flushed"
+        )
+
+    def test_output_must_emit(self):
+        class SilentOutput(output.Output):
+            pass
+
+        with self.assertRaises(TypeError):
+            SilentOutput()
+
+
+class TestIncrementalParsing(unittest.TestCase):
+    """Test the incremental re-lexing and re-parsing of an edited source."""
+
+    source = "\n".join(
+        [
+            "=: x 10",
+            "=| func (a, b) ={",
+            "    =+ a b",
+            "    => a",
+            "}",
+            "=@ func (x, 2) =: result",
+        ]
+    )
+
+    def test_edit_within_function(self):
+        test_parser = incremental.IncrementalParser(self.source)
+        edited = self.source.replace("=+ a b", "=* a b")
+        ats = test_parser.update(edited)
+
+        self.assertEqual(repr(ats.node), repr(parse(edited).node))
+        self.assertEqual(test_parser.relexed, 4, "Only the function must be re-lexed")
+        self.assertEqual(test_parser.reused, 2, "Other statements must be reused")
+
+    def test_insert_moves_positions(self):
+        test_parser = incremental.IncrementalParser(self.source)
+        func_node = test_parser.parse().node.items[1]
+        edited = "=: y 20\n" + self.source
+        ats = test_parser.update(edited)
+
+        self.assertEqual(repr(ats.node), repr(parse(edited).node))
+        self.assertIs(ats.node.items[2], func_node, "FuncNode must be reused")
+        self.assertEqual(func_node.pos.line, 2, "FuncNode wasn't moved")
+
+    def test_unclosed_code_block(self):
+        test_parser = incremental.IncrementalParser(self.source)
+        edited = self.source.replace("}", "")
+        ats = test_parser.update(edited)
+
+        self.assertIsNotNone(ats.error, "Unclosed code block must fail")
+        self.assertEqual(str(ats.error), str(parse(edited).error))
+
+    def test_close_code_block(self):
+        test_parser = incremental.IncrementalParser("=| f (a) ={\n    => a")
+        edited = "=| f (a) ={\n    => a\n}"
+        ats = test_parser.update(edited)
+
+        self.assertIsNone(ats.error, "Closed code block mustn't fail")
+        self.assertEqual(repr(ats.node), repr(parse(edited).node))
+
+    def test_edit_within_multiline_string(self):
+        test_parser = incremental.IncrementalParser('=: b "multi\nline\nstr"\n=! b')
+        edited = '=: b "multi\n=: z 5\nstr"\n=! b'
+        ats = test_parser.update(edited)
+
+        self.assertEqual(repr(ats.node), repr(parse(edited).node))
+        self.assertEqual(len(ats.node.items), 2, "String must be a single statement")
+
+
+class TestChecker(unittest.TestCase):
+    """Test checking the syntax, without executing."""
+
+    def test_valid_text(self):
+        self.assertEqual(checker.check_text("=: x 10\n=! x\n"), [], "Must be valid")
+
+    def test_reports_all_errors(self):
+        text = "=: 5\n=: x 10\n=: y ?\n=| f (a) ={\n    =: 5\n}\n"
+        errors = checker.check_text(text)
+        self.assertEqual(
+            list(map(lambda x: x.pos.line, errors)), [0, 2, 4], "Invalid error lines"
+        )
+        self.assertEqual(
+            str(errors[1]), "InvalidSyntaxError: '?' isn't a valid expression"
+        )
+
+    def test_check_files(self):
+        results = checker.check_files(["examples/basic.mnl", "missing.mnl"], 2)
+        self.assertEqual(results[0], ("examples/basic.mnl", []), "Must be valid")
+        self.assertEqual(
+            type(results[1][1][0]).__name__, "FileNotFoundError", "Invalid error"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()